@@ -1,18 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import Optional, List, Dict
+from collections import OrderedDict
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from typing import Optional, List, Dict, Tuple
 from app.models.ai import AskRequest, AskResponse
+from app.core.config import settings
 from app.core.security import get_current_active_user
+from app.core.responses import EncodedBody, body_response
 from app.services.ai_service import VannaClient
+from app.services.version_service import data_version
 
 router = APIRouter()
 
 # Initialize Vanna client
 vanna_client = VannaClient()
 
+# Encoded /ask bodies keyed by (question, context, redaction, data version)
+_ask_cache: 'OrderedDict[Tuple, EncodedBody]' = OrderedDict()
+
 
 @router.post("/ask", response_model=AskResponse)
 async def ask_ai_question(
     request: AskRequest,
+    http_request: Request,
     redact_sensitive: bool = Query(True, description="Redact sensitive data in results"),
     current_user = Depends(get_current_active_user)
 ):
@@ -27,6 +35,9 @@ async def ask_ai_question(
     2. Generates SQL using Vanna RAG
     3. Executes the SQL safely
     4. Returns results with security disclaimers
+    
+    Answers are encoded once with orjson (plus gzip) and reused for the
+    same question until the data version changes.
     """
     try:
         # TODO: Implement question validation
@@ -42,6 +53,17 @@ async def ask_ai_question(
                 detail="Question contains blocked keywords or patterns for security reasons"
             )
         
+        cache_key = (
+            ' '.join(request.question.lower().split()),
+            request.context,
+            redact_sensitive,
+            data_version.current().batch_id
+        )
+        cached = _ask_cache.get(cache_key)
+        if cached is not None:
+            _ask_cache.move_to_end(cache_key)
+            return body_response(http_request, cached)
+        
         # TODO: Implement AI question processing
         # - Call vanna_client.ask() to generate SQL
         # - Call vanna_client.run() to execute SQL
@@ -60,14 +82,18 @@ async def ask_ai_question(
         if redact_sensitive:
             query_results = vanna_client.redact_sensitive_data(query_results)
         
-        return AskResponse(
-            question=request.question,
-            sql_query=generated_sql,
-            explanation=_generate_explanation(request.question, generated_sql),
-            results=query_results,
-            row_count=len(query_results),
-            security_note=_get_security_disclaimer()
-        )
+        body = EncodedBody.from_payload({
+            'question': request.question,
+            'sql_query': generated_sql,
+            'explanation': _generate_explanation(request.question, generated_sql),
+            'results': query_results,
+            'row_count': len(query_results),
+            'security_note': _get_security_disclaimer()
+        })
+        _ask_cache[cache_key] = body
+        while len(_ask_cache) > settings.RESPONSE_BODY_CACHE_SIZE:
+            _ask_cache.popitem(last=False)
+        return body_response(http_request, body)
         
     except HTTPException:
         # Re-raise HTTP exceptions
@@ -1,80 +1,310 @@
-from fastapi import APIRouter, Depends, Query
-from typing import List, Optional
-from app.models.margin import MarginRow, MarginSummary, MarginFilter
+import asyncio
+import json
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import List, Optional, Sequence, Tuple
+from app.models.margin import (
+    MarginRow,
+    MarginSummary,
+    MarginFilter,
+    CostBreakdownRow,
+    MarginDistribution,
+    DashboardData,
+    MarginChanges,
+    ProjectSuggestion,
+)
 from app.core.security import get_current_active_user
+from app.core.http_cache import compute_etag, cache_headers, not_modified
+from app.core.responses import body_response
+from app.services.cube_service import CostCubeService, CUBE_DIMENSIONS
+from app.services.margin_service import MarginCalculationService
+from app.services.margin_table import MARGIN_FIELDS, PROJECT_FIELDS
+from app.services.version_service import data_version
+from app.services.event_service import margin_events
 
+# Handlers that read Oracle or rebuild snapshots are plain def, so FastAPI
+# runs them in its threadpool instead of on the event loop
 router = APIRouter()
 
+# Seconds between SSE keep-alive comments on idle streams
+SSE_KEEPALIVE_SECONDS = 15
+
+# Initialize services
+cube_service = CostCubeService()
+margin_service = MarginCalculationService()
+
+
+def _parse_fields(fields: Optional[str], allowed: Sequence[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a comma-separated ?fields= value into a canonical field tuple.
+    
+    Fields are returned in response order regardless of how they were
+    requested, so equivalent projections share one ETag and cache entry.
+    
+    Raises:
+        HTTPException: 400 if an unknown field is requested
+    """
+    if fields is None:
+        return None
+    requested = {field.strip() for field in fields.split(',') if field.strip()}
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}. Available: {', '.join(allowed)}"
+        )
+    selected = tuple(field for field in allowed if field in requested)
+    return None if len(selected) == len(allowed) else selected
+
 
 @router.get("/margins", response_model=List[MarginRow])
-async def get_project_margins(
+def get_project_margins(
+    request: Request,
     project_name: Optional[str] = Query(None, description="Filter by project name"),
     min_margin: Optional[float] = Query(None, description="Minimum margin percentage"),
     max_margin: Optional[float] = Query(None, description="Maximum margin percentage"),
+    fields: Optional[str] = Query(None, description=f"Comma-separated fields to return: {', '.join(MARGIN_FIELDS)}"),
     current_user = Depends(get_current_active_user)
 ):
     """
     Get gross margin data for all projects.
     
     Returns project name, budget (SOW), cost, and margin percentage.
+    Use fields= to return only some of these columns.
+    Honours If-None-Match / If-Modified-Since against the current data version.
+    The body is pre-encoded (and gzipped) once per data version, filter set
+    and field selection.
     """
-    # TODO: Implement margin data retrieval
-    # TODO: Use Oracle connection to query GROSS_MARGIN_VIEW
-    # TODO: Apply filters if provided
-    # TODO: Use margin_calc_pkg_02.f_get_gross_margin for calculations
-    # TODO: Return list of MarginRow objects
+    selected = _parse_fields(fields, MARGIN_FIELDS)
+    version = data_version.current()
+    etag = compute_etag(version, "margins", {
+        "project_name": project_name,
+        "min_margin": min_margin,
+        "max_margin": max_margin,
+        "fields": ",".join(selected) if selected is not None else None
+    })
+    cached = not_modified(request, etag, version)
+    if cached:
+        return cached
     
-    # Placeholder response
-    return [
-        MarginRow(
-            projectName="Sample Project",
-            totalHours=100.0,
-            budget=50000.0,
-            grossMarginPercentage=35.5
-        )
-    ]
+    filters = MarginFilter(
+        project_name=project_name,
+        min_margin=min_margin,
+        max_margin=max_margin
+    )
+    return body_response(
+        request,
+        margin_service.get_project_margins_body(filters, selected),
+        cache_headers(etag, version)
+    )
 
 
 @router.get("/margins/summary", response_model=MarginSummary)
-async def get_margins_summary(
+def get_margins_summary(
+    request: Request,
     current_user = Depends(get_current_active_user)
 ):
     """
     Get summary statistics for all project margins.
     
     Returns total projects, hours, budget, and average margin percentage.
+    Honours If-None-Match / If-Modified-Since against the current data version.
+    The body is pre-encoded (and gzipped) once per data version.
+    """
+    version = data_version.current()
+    etag = compute_etag(version, "margins/summary")
+    cached = not_modified(request, etag, version)
+    if cached:
+        return cached
+    
+    body = margin_service.get_margin_summary_body()
+    if body is None:
+        raise HTTPException(status_code=503, detail="Margin summary is not available")
+    return body_response(request, body, cache_headers(etag, version))
+
+
+@router.get("/dashboard", response_model=DashboardData)
+def get_dashboard(
+    request: Request,
+    response: Response,
+    current_user = Depends(get_current_active_user)
+):
+    """
+    Get margins, summary and projects in one round trip.
+    
+    All three are computed from a single GROSS_MARGIN_VIEW snapshot, so the
+    dashboard authenticates once and reads the view at most once.
+    Honours If-None-Match / If-Modified-Since against the current data version.
+    """
+    version = data_version.current()
+    etag = compute_etag(version, "dashboard")
+    cached = not_modified(request, etag, version)
+    if cached:
+        return cached
+    
+    dashboard = margin_service.get_dashboard()
+    if dashboard is None:
+        raise HTTPException(status_code=503, detail="Dashboard data is not available")
+    response.headers.update(cache_headers(etag, version))
+    return dashboard
+
+
+@router.get("/margins/changes", response_model=MarginChanges)
+def get_margin_changes(
+    since: str = Query(..., description="Version token (batch_id) from the previous sync"),
+    current_user = Depends(get_current_active_user)
+):
+    """
+    Get only the margin rows changed since a given ingest batch.
+    
+    Returns changed rows, tombstones for removed projects and the new
+    version token. fullResync is set when the client must replace its copy.
+    """
+    changes = margin_service.get_margin_changes(since)
+    if changes is None:
+        raise HTTPException(status_code=503, detail="Margin changes are not available")
+    return changes
+
+
+@router.get("/margins/stream")
+async def stream_margin_updates(
+    request: Request,
+    current_user = Depends(get_current_active_user)
+):
+    """
+    Server-sent events stream of margin updates.
+    
+    Clients subscribe once and receive a 'margins' event with compact deltas
+    (changed rows and removed project names) after every ingest batch, or a
+    'refresh'/'resync' event telling them to reload the dashboard.
     """
-    # TODO: Implement summary calculation
-    # TODO: Aggregate data from GROSS_MARGIN_VIEW
-    # TODO: Calculate totals and averages
-    # TODO: Return MarginSummary object
+    async def event_stream():
+        async with margin_events.subscribe() as queue:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                lines = [f"event: {event['type']}"]
+                if event.get('version'):
+                    lines.append(f"id: {event['version']}")
+                lines.append(f"data: {json.dumps(event)}")
+                yield "\n".join(lines) + "\n\n"
     
-    return MarginSummary(
-        totalProjects=0,
-        totalHours=0.0,
-        totalBudget=0.0,
-        averageMarginPercentage=0.0
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
 
 
+@router.get("/margins/distribution", response_model=MarginDistribution)
+def get_margins_distribution(
+    current_user = Depends(get_current_active_user)
+):
+    """
+    Get the distribution of project margins.
+    
+    Returns margin buckets, p10/p50/p90 and the negative-margin count,
+    maintained incrementally after each ingest batch.
+    """
+    distribution = margin_service.get_margin_distribution()
+    if distribution is None:
+        raise HTTPException(status_code=503, detail="Margin distribution is not available")
+    return distribution
+
+
 @router.get("/projects", response_model=List[dict])
-async def list_projects(
+def list_projects(
+    request: Request,
+    fields: Optional[str] = Query(None, description=f"Comma-separated fields to return: {', '.join(PROJECT_FIELDS)}"),
     current_user = Depends(get_current_active_user)
 ):
     """
     List all projects with basic information.
     
     Returns project ID, name, and SOW value.
+    Use fields= to return only some of these columns.
+    Honours If-None-Match / If-Modified-Since against the current data version.
+    """
+    selected = _parse_fields(fields, PROJECT_FIELDS)
+    version = data_version.current()
+    etag = compute_etag(version, "projects", {
+        "fields": ",".join(selected) if selected is not None else None
+    })
+    cached = not_modified(request, etag, version)
+    if cached:
+        return cached
+    
+    return body_response(
+        request,
+        margin_service.get_projects_body(selected),
+        cache_headers(etag, version)
+    )
+
+
+@router.get("/projects/search", response_model=List[ProjectSuggestion])
+def search_projects(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, description="Partial or misspelled project name"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of suggestions"),
+    current_user = Depends(get_current_active_user)
+):
+    """
+    Ranked project name suggestions for autocomplete and "did you mean".
+    
+    Matches name and word prefixes first, then similar names by trigram
+    similarity, from an in-memory index refreshed on ingest.
+    Honours If-None-Match / If-Modified-Since against the current data version.
     """
-    # TODO: Implement project listing
-    # TODO: Query PROJECT table
-    # TODO: Return basic project information
-    # TODO: Exclude sensitive data (CTC values)
+    version = data_version.current()
+    etag = compute_etag(version, "projects/search", {"q": q, "limit": limit})
+    cached = not_modified(request, etag, version)
+    if cached:
+        return cached
     
+    response.headers.update(cache_headers(etag, version))
     return [
-        {
-            "project_id": 1,
-            "project_name": "Sample Project",
-            "sow": 50000.0
-        }
-    ] 
\ No newline at end of file
+        ProjectSuggestion(
+            projectId=match['project_id'],
+            projectName=match['project_name'],
+            score=match['score']
+        )
+        for match in margin_service.search_projects(q, limit)
+    ]
+
+
+@router.get("/margins/breakdown", response_model=List[CostBreakdownRow])
+def get_cost_breakdown(
+    group_by: List[str] = Query(
+        ["project"],
+        description=f"Dimensions to group by: {', '.join(CUBE_DIMENSIONS)}"
+    ),
+    project_name: Optional[str] = Query(None, description="Filter by project name"),
+    month_from: Optional[date] = Query(None, description="First month to include"),
+    month_to: Optional[date] = Query(None, description="Last month to include"),
+    task_type: Optional[str] = Query(None, description="Filter by task type"),
+    time_card_state: Optional[str] = Query(None, description="Filter by timecard state"),
+    current_user = Depends(get_current_active_user)
+):
+    """
+    Drill down into hours and cost by project, month, task type and timecard state.
+    
+    Served from the TIMECARD_COST_CUBE rollup maintained on ingest, so no
+    TIMECARD scan or CTC decryption happens per request.
+    """
+    try:
+        return cube_service.get_breakdown(
+            group_by,
+            project_name=project_name,
+            month_from=month_from,
+            month_to=month_to,
+            task_type=task_type,
+            time_card_state=time_card_state
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -1,39 +1,100 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
-from typing import List
-from app.models.upload import ValidationReport, UploadResult
+import shutil
+import tempfile
+from pathlib import Path
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Query
+from typing import List, Optional
+from app.models.upload import ValidationReport, UploadResult, IssuePage
+from app.core.config import settings
 from app.core.security import get_current_active_user
+from app.services.cleaning_service import DataCleaningService
+from app.services.issue_store import upload_issues
 
 router = APIRouter()
 
+# Initialize services
+cleaning_service = DataCleaningService()
+
 
 @router.post("/upload", response_model=ValidationReport)
-async def upload_files(
+def upload_files(
     timecard_file: UploadFile = File(None, description="TimeCard Excel file"),
     employee_file: UploadFile = File(None, description="Employee Excel file"),
     project_file: UploadFile = File(None, description="Project Excel file"),
+    files: List[UploadFile] = File(None, description="Excel or CSV files of any type, routed by their headers"),
     current_user = Depends(get_current_active_user)
 ):
     """
     Upload and validate three Excel files (TimeCard, Employee, Project).
     
+    Files may be sent under their type or unlabelled as files=; unlabelled
+    files are routed by their headers and files that match no type are
+    reported under file_type 'files'.
     Returns validation report with counts, missing headers, duplicates, and referential issues.
+    Cleaning reads Excel files and may use a process pool, so the handler
+    runs in the threadpool.
     """
-    # TODO: Implement file validation logic
-    # TODO: Check file types and extensions
-    # TODO: Validate required columns
-    # TODO: Check data integrity and business rules
-    # TODO: Return ValidationReport with detailed results
-    
-    if not any([timecard_file, employee_file, project_file]):
+    labelled = {
+        'timecard': timecard_file,
+        'employee': employee_file,
+        'project': project_file
+    }
+    unlabelled = [upload for upload in files or [] if upload is not None]
+    if not unlabelled and not any(labelled.values()):
         raise HTTPException(status_code=400, detail="At least one file must be uploaded")
     
-    # Placeholder response
-    return ValidationReport(
-        uploads=[],
-        total_files=3,
-        total_valid_rows=0,
-        total_invalid_rows=0,
-        has_errors=True
+    Path(settings.FILE_UPLOAD_DIR).mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=settings.FILE_UPLOAD_DIR) as upload_dir:
+        def save(upload: UploadFile, index: int) -> Path:
+            # The suffix selects the reader; the index keeps equal names apart
+            path = Path(upload_dir) / f"{index}_{Path(upload.filename or 'upload').name}"
+            with open(path, 'wb') as target:
+                shutil.copyfileobj(upload.file, target)
+            return path
+        
+        paths = {
+            file_type: save(upload, index)
+            for index, (file_type, upload) in enumerate(labelled.items())
+            if upload is not None
+        }
+        file_paths = [save(upload, len(labelled) + index) for index, upload in enumerate(unlabelled)]
+        
+        _, report = cleaning_service.clean_all_files(
+            timecard_path=paths.get('timecard'),
+            employee_path=paths.get('employee'),
+            project_path=paths.get('project'),
+            file_paths=file_paths
+        )
+    return report
+
+
+@router.get("/upload/{upload_id}/issues", response_model=IssuePage)
+async def get_upload_issues(
+    upload_id: str,
+    file_type: str = Query(..., description="File to page through: timecard, employee, project, referential or files"),
+    column: Optional[str] = Query(None, description="Only issues for this column"),
+    error: Optional[str] = Query(None, description="Only issues with this error message"),
+    offset: int = Query(0, ge=0, description="Index of the first issue to return"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum issues to return"),
+    current_user = Depends(get_current_active_user)
+):
+    """
+    Page through the full validation issue list of an uploaded file.
+    
+    The upload report only carries per-rule counts and samples; this expands
+    the stored row ranges for one page at a time.
+    """
+    store = upload_issues.get(upload_id, file_type)
+    if store is None:
+        raise HTTPException(status_code=404, detail="Upload issues not found or expired")
+    
+    total, issues = store.page(offset, limit, column=column, error=error)
+    return IssuePage(
+        upload_id=upload_id,
+        file_type=file_type,
+        total=total,
+        offset=offset,
+        limit=limit,
+        issues=issues
     )
 
 
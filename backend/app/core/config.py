@@ -21,11 +21,37 @@ class Settings(BaseSettings):
     ORACLE_PASSWORD: str = Field(..., description="Oracle password")
     ORACLE_POOL_MIN: int = Field(1, description="Minimum connection pool size")
     ORACLE_POOL_MAX: int = Field(10, description="Maximum connection pool size")
+
+    # Margin validation
+    MARGIN_VALIDATION_SAMPLE_SIZE: int = Field(50, description="Projects cross-checked per validation run (0 = all projects)")
+    MARGIN_VALIDATION_MAX_WORKERS: int = Field(2, description="Pool connections the validation job may use concurrently")
+    MARGIN_VALIDATION_TIME_BUDGET: float = Field(30.0, description="Maximum seconds a margin validation run may take")
+    MARGIN_VALIDATION_TOLERANCE: float = Field(0.01, description="Allowed margin drift in percentage points")
+
+    # Caching
+    DATA_VERSION_TTL: float = Field(5.0, description="Seconds the current data version is cached per process")
+    HTTP_CACHE_MAX_AGE: int = Field(0, description="Cache-Control max-age for versioned API responses")
+    MARGIN_REFRESH_INTERVAL: float = Field(300.0, description="Seconds between scheduled margin cache refreshes")
+    MARGIN_REFRESH_LOCK_TIMEOUT: int = Field(30, description="Seconds a worker waits for the cross-worker refresh lock")
+    RESPONSE_BODY_CACHE_SIZE: int = Field(64, description="Encoded response bodies kept per margin snapshot")
+    RESPONSE_GZIP_MIN_SIZE: int = Field(1024, description="Smallest response body (bytes) worth gzip-compressing")
+
+    # Data loading
+    TIMECARD_DIRECT_PATH_LOAD: bool = Field(True, description="Load TimeCard batches with direct-path inserts so compressed partitions stay compressed")
+    TIMECARD_FINGERPRINT_DIR: str = Field("./fingerprints", description="Directory of per-month fingerprint files used to detect re-uploaded TimeCard rows")
     
     # File Upload
     FILE_UPLOAD_DIR: str = Field("./uploads", description="Directory for file uploads")
     MAX_FILE_SIZE: int = Field(10 * 1024 * 1024, description="Maximum file size in bytes")
     ALLOWED_EXTENSIONS: List[str] = Field([".xlsx", ".xls", ".csv"], description="Allowed file extensions")
+    UPLOAD_CHUNK_ROWS: int = Field(50000, description="Rows per DataFrame chunk when reading and cleaning uploaded files")
+    UPLOAD_READER_ENGINE: str = Field("auto", description="Upload reader engine: auto, calamine, openpyxl, xlrd, pyarrow or pandas")
+    UPLOAD_IN_MEMORY_READER_MAX_SIZE: int = Field(64 * 1024 * 1024, description="Largest Excel file (bytes) parsed with calamine, which holds the whole sheet; larger files stream through openpyxl")
+    UPLOAD_CLEANING_WORKERS: int = Field(4, description="Worker processes used to clean large uploads (1 = clean in-process)")
+    UPLOAD_PARALLEL_MIN_SIZE: int = Field(5 * 1024 * 1024, description="Smallest TimeCard file (bytes) cleaned on the worker pool")
+    UPLOAD_ISSUE_SAMPLES: int = Field(20, description="Failing rows kept with their values per column and rule")
+    UPLOAD_ISSUE_RANGES: int = Field(100, description="Failing row ranges per column and rule included in the validation report")
+    UPLOAD_ISSUE_RETENTION: int = Field(32, description="Uploads whose issue lists are kept in memory for paging")
     
     # RAG/AI
     RAG_MODEL_PATH: str = Field("./models", description="Path to RAG model files")
@@ -0,0 +1,70 @@
+"""
+HTTP conditional request helpers (ETag / Last-Modified).
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+from app.core.config import settings
+from app.services.version_service import DataVersion
+
+
+def compute_etag(version: DataVersion, route: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Build a weak ETag from the data version, route and normalized query parameters."""
+    normalized = sorted(
+        (key, str(value).strip().lower())
+        for key, value in (params or {}).items()
+        if value is not None
+    )
+    digest = hashlib.sha1(
+        f"{version.batch_id}|{route}|{normalized}".encode("utf-8")
+    ).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def cache_headers(etag: str, version: DataVersion) -> Dict[str, str]:
+    """Headers telling clients and proxies how to revalidate a versioned response."""
+    headers = {
+        "ETag": etag,
+        # Responses are per-user (authenticated), so shared caches must not reuse them
+        "Cache-Control": f"private, max-age={settings.HTTP_CACHE_MAX_AGE}, must-revalidate",
+        "Vary": "Authorization",
+    }
+    if version.loaded_at:
+        headers["Last-Modified"] = format_datetime(_as_utc(version.loaded_at), usegmt=True)
+    return headers
+
+
+def not_modified(request: Request, etag: str, version: DataVersion) -> Optional[Response]:
+    """
+    Return a 304 response if the client's cached copy is still current.
+
+    If-None-Match takes precedence over If-Modified-Since (RFC 9110).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in candidates or etag.removeprefix("W/") in candidates:
+            return Response(status_code=304, headers=cache_headers(etag, version))
+        return None
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and version.loaded_at:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return None
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        if _as_utc(version.loaded_at).replace(microsecond=0) <= since:
+            return Response(status_code=304, headers=cache_headers(etag, version))
+
+    return None
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive database timestamps as UTC."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
@@ -0,0 +1,79 @@
+"""
+Pre-encoded JSON responses (orjson + optional gzip).
+"""
+import gzip
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+import orjson
+from fastapi import Request, Response
+
+from app.core.config import settings
+
+
+def _default(value: Any) -> Any:
+    """Encode types orjson does not handle natively (Oracle NUMBER, LOBs, ...)."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, 'model_dump'):
+        return value.model_dump()
+    return str(value)
+
+
+def dumps(payload: Any) -> bytes:
+    """Serialize a payload to JSON bytes with orjson."""
+    return orjson.dumps(payload, default=_default)
+
+
+@dataclass(frozen=True)
+class EncodedBody:
+    """A JSON body encoded once, with its gzip variant when worth compressing."""
+
+    raw: bytes
+    gzipped: Optional[bytes] = None
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> 'EncodedBody':
+        gzipped = None
+        if len(raw) >= settings.RESPONSE_GZIP_MIN_SIZE:
+            gzipped = gzip.compress(raw, compresslevel=6, mtime=0)
+        return cls(raw=raw, gzipped=gzipped)
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> 'EncodedBody':
+        return cls.from_bytes(dumps(payload))
+
+
+def _accepts_gzip(request: Request) -> bool:
+    return 'gzip' in request.headers.get('accept-encoding', '').lower()
+
+
+def body_response(
+    request: Request,
+    body: EncodedBody,
+    headers: Optional[Dict[str, str]] = None,
+    status_code: int = 200
+) -> Response:
+    """
+    Send a pre-encoded body, choosing the gzip variant if the client accepts it.
+
+    Bypasses response_model validation and JSON encoding entirely.
+    """
+    response_headers = dict(headers or {})
+    vary = [value for value in response_headers.get('Vary', '').split(',') if value.strip()]
+    content = body.raw
+    if body.gzipped is not None:
+        vary.append('Accept-Encoding')
+        if _accepts_gzip(request):
+            content = body.gzipped
+            response_headers['Content-Encoding'] = 'gzip'
+    if vary:
+        response_headers['Vary'] = ', '.join(value.strip() for value in vary)
+    return Response(
+        content=content,
+        status_code=status_code,
+        media_type='application/json',
+        headers=response_headers
+    )
+
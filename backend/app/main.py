@@ -7,15 +7,19 @@ from contextlib import asynccontextmanager
 
 from app.core.config import settings
 from app.api.v1 import routes_health, routes_upload, routes_margins, routes_ai
+from app.services.scheduler_service import refresh_scheduler
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
-    # TODO: Initialize database connections, load models
+    # Warm margin caches before serving, then keep them fresh
+    await refresh_scheduler.start(routes_margins.margin_service)
+    # TODO: Load models
     yield
     # Shutdown
+    await refresh_scheduler.stop()
     # TODO: Close database connections, cleanup
 
 
@@ -1,15 +1,20 @@
 """Pydantic models for the Gross Calculator API."""
 
-from .upload import UploadResult, ValidationIssue, ValidationReport
-from .margin import MarginRow, MarginSummary
+from .upload import UploadResult, ValidationIssue, ValidationReport, IssueSummary, IssuePage
+from .margin import MarginRow, MarginSummary, CostBreakdownRow, DashboardData, ProjectSuggestion
 from .ai import AskRequest, AskResponse
 
 __all__ = [
     "UploadResult",
     "ValidationIssue", 
     "ValidationReport",
+    "IssueSummary",
+    "IssuePage",
     "MarginRow",
     "MarginSummary",
+    "CostBreakdownRow",
+    "DashboardData",
+    "ProjectSuggestion",
     "AskRequest",
     "AskResponse",
 ] 
\ No newline at end of file
@@ -43,6 +43,40 @@ class MarginSummary(BaseModel):
         }
 
 
+class DashboardData(BaseModel):
+    """Margins, summary and project list for the dashboard in one response."""
+    
+    margins: List[MarginRow] = Field(..., description="Per-project margin rows")
+    summary: MarginSummary = Field(..., description="Summary derived from the same rows")
+    projects: List[dict] = Field(..., description="Project ID, name and SOW")
+
+
+class MarginChanges(BaseModel):
+    """Margin rows changed since a client's last synced version."""
+    
+    version: Optional[str] = Field(None, description="Version token to pass as 'since' next time")
+    fullResync: bool = Field(..., description="True when 'changed' holds every row and the client must replace its copy")
+    changed: List[MarginRow] = Field(default_factory=list, description="Added or updated project rows")
+    removed: List[str] = Field(default_factory=list, description="Project names to drop (tombstones)")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "version": "6f1c2d3e-0000-4000-8000-000000000000",
+                "fullResync": False,
+                "changed": [
+                    {
+                        "projectName": "E-commerce Platform",
+                        "totalHours": 128.5,
+                        "budget": 50000.00,
+                        "grossMarginPercentage": 44.1
+                    }
+                ],
+                "removed": []
+            }
+        }
+
+
 class MarginFilter(BaseModel):
     """Filter options for margin queries."""
     
@@ -50,4 +84,81 @@ class MarginFilter(BaseModel):
     min_margin: Optional[float] = Field(None, description="Minimum margin percentage")
     max_margin: Optional[float] = Field(None, description="Maximum margin percentage")
     min_hours: Optional[float] = Field(None, description="Minimum total hours")
-    max_hours: Optional[float] = Field(None, description="Maximum total hours") 
\ No newline at end of file
+    max_hours: Optional[float] = Field(None, description="Maximum total hours") 
+
+class CostBreakdownRow(BaseModel):
+    """Hours and cost for one slice of the project x month x task cube."""
+    
+    project: Optional[str] = Field(None, description="Project name (when grouped by project)")
+    month: Optional[str] = Field(None, description="Month start date, YYYY-MM-DD (when grouped by month)")
+    task_type: Optional[str] = Field(None, description="Task type (when grouped by task type)")
+    time_card_state: Optional[str] = Field(None, description="Timecard state (when grouped by state)")
+    totalHours: float = Field(..., description="Total hours in the slice")
+    totalCost: float = Field(..., description="Total cost in the slice")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "project": "E-commerce Platform",
+                "month": "2024-01-01",
+                "task_type": "DEVELOPMENT",
+                "totalHours": 15.5,
+                "totalCost": 550.25
+            }
+        }
+
+
+class MarginBucket(BaseModel):
+    """Project count for one margin percentage range."""
+    
+    label: str = Field(..., description="Bucket label, e.g. '0-20%'")
+    min: Optional[float] = Field(None, description="Inclusive lower bound (None = unbounded)")
+    max: Optional[float] = Field(None, description="Exclusive upper bound (None = unbounded)")
+    count: int = Field(..., description="Number of projects in the bucket")
+
+
+class MarginDistribution(BaseModel):
+    """Distribution statistics for project margins."""
+    
+    buckets: List[MarginBucket] = Field(..., description="Histogram of projects by margin range")
+    p10: Optional[float] = Field(None, description="10th percentile margin percentage")
+    p50: Optional[float] = Field(None, description="Median margin percentage")
+    p90: Optional[float] = Field(None, description="90th percentile margin percentage")
+    negativeCount: int = Field(..., description="Number of projects with a negative margin")
+    nullMarginCount: int = Field(..., description="Number of projects without a computable margin")
+    totalProjects: int = Field(..., description="Total number of projects")
+    dataVersion: Optional[str] = Field(None, description="Ingest batch the statistics reflect")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "buckets": [
+                    {"label": "<0%", "min": None, "max": 0.0, "count": 1},
+                    {"label": "0-20%", "min": 0.0, "max": 20.0, "count": 3}
+                ],
+                "p10": 2.5,
+                "p50": 31.0,
+                "p90": 58.4,
+                "negativeCount": 1,
+                "nullMarginCount": 0,
+                "totalProjects": 15,
+                "dataVersion": "6f1c2d3e-0000-4000-8000-000000000000"
+            }
+        }
+
+
+class ProjectSuggestion(BaseModel):
+    """A ranked project name match for search and autocomplete."""
+    
+    projectId: Optional[int] = Field(None, description="Project identifier")
+    projectName: str = Field(..., description="Project name")
+    score: float = Field(..., description="Match score from 0 to 1 (1 = exact)")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "projectId": 2,
+                "projectName": "Mobile App Development",
+                "score": 0.9
+            }
+        }
@@ -25,6 +25,29 @@ class ValidationIssue(BaseModel):
         }
 
 
+class IssueSummary(BaseModel):
+    """Aggregated validation failures for one column and rule."""
+    
+    column: str = Field(..., description="Column name with issue")
+    error: str = Field(..., description="Description of the validation error")
+    count: int = Field(..., description="Number of failing rows")
+    samples: List[ValidationIssue] = Field(default_factory=list, description="First failing rows, with values")
+    row_ranges: List[List[int]] = Field(default_factory=list, description="Failing rows as [first, last] ranges (capped)")
+    ranges_truncated: bool = Field(False, description="Whether row_ranges was cut short")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "column": "DAILY_DATE",
+                "error": "Invalid date",
+                "count": 1200,
+                "samples": [],
+                "row_ranges": [[45, 45], [1001, 2199]],
+                "ranges_truncated": False
+            }
+        }
+
+
 class UploadResult(BaseModel):
     """Result of a file upload operation."""
     
@@ -33,7 +56,9 @@ class UploadResult(BaseModel):
     total_rows: int = Field(..., description="Total rows in file")
     valid_rows: int = Field(..., description="Number of valid rows")
     invalid_rows: int = Field(..., description="Number of invalid rows")
-    validation_issues: List[ValidationIssue] = Field(default_factory=list, description="List of validation issues")
+    validation_issues: List[ValidationIssue] = Field(default_factory=list, description="Sample of validation issues (see issue_summary)")
+    issue_count: int = Field(0, description="Total number of validation issues")
+    issue_summary: List[IssueSummary] = Field(default_factory=list, description="Issue counts, samples and row ranges per column and rule")
     
     class Config:
         json_schema_extra = {
@@ -43,7 +68,9 @@ class UploadResult(BaseModel):
                 "total_rows": 100,
                 "valid_rows": 95,
                 "invalid_rows": 5,
-                "validation_issues": []
+                "validation_issues": [],
+                "issue_count": 5,
+                "issue_summary": []
             }
         }
 
@@ -56,6 +83,7 @@ class ValidationReport(BaseModel):
     total_valid_rows: int = Field(..., description="Total valid rows across all files")
     total_invalid_rows: int = Field(..., description="Total invalid rows across all files")
     has_errors: bool = Field(..., description="Whether any validation errors occurred")
+    upload_id: Optional[str] = Field(None, description="Identifier for paging through the full issue list")
     
     class Config:
         json_schema_extra = {
@@ -64,7 +92,31 @@ class ValidationReport(BaseModel):
                 "total_files": 3,
                 "total_valid_rows": 285,
                 "total_invalid_rows": 15,
-                "has_errors": True
+                "has_errors": True,
+                "upload_id": "3f2b9c1e4d5a4e6f8a7b9c0d1e2f3a4b"
+            }
+        }
+
+
+class IssuePage(BaseModel):
+    """One page of the full validation issue list for an uploaded file."""
+    
+    upload_id: str = Field(..., description="Upload identifier")
+    file_type: str = Field(..., description="Type of file (timecard, employee, project)")
+    total: int = Field(..., description="Issues matching the filters")
+    offset: int = Field(..., description="Index of the first issue on this page")
+    limit: int = Field(..., description="Maximum issues per page")
+    issues: List[ValidationIssue] = Field(default_factory=list, description="Issues on this page; value is only set for sampled rows")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "upload_id": "3f2b9c1e4d5a4e6f8a7b9c0d1e2f3a4b",
+                "file_type": "timecard",
+                "total": 1200,
+                "offset": 0,
+                "limit": 100,
+                "issues": []
             }
         }
 
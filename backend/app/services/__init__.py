@@ -3,9 +3,11 @@
 from .cleaning_service import DataCleaningService
 from .load_service import DataLoadService
 from .margin_service import MarginCalculationService
+from .cube_service import CostCubeService
 
 __all__ = [
     "DataCleaningService",
     "DataLoadService", 
     "MarginCalculationService",
+    "CostCubeService",
 ] 
\ No newline at end of file
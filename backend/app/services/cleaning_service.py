@@ -7,20 +7,58 @@ This service handles Excel file processing, validation, and cleaning for:
 - Project/SOW data (budget information)
 
 Stepwise processing ensures data quality before database insertion.
+Files are read and cleaned in fixed-size chunks (UPLOAD_CHUNK_ROWS), so the
+raw rows of an upload are never held whole (except by calamine, which is
+only used up to UPLOAD_IN_MEMORY_READER_MAX_SIZE). The cleaned result is
+one DataFrame per file in compact dtypes, which does grow with the upload.
+The reader engine is picked per file type and size: calamine for Excel,
+pyarrow for CSV, with openpyxl/xlrd/pandas as fallbacks.
 """
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Optional
 from datetime import datetime, date
 import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
 
+import csv
+
+import openpyxl
+import xlrd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pandas' CSV reader is used instead
+    pa = pa_csv = None
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # openpyxl/xlrd are used instead
+    CalamineWorkbook = None
+
+from app.core.config import settings
 from app.models.upload import ValidationIssue, ValidationReport, UploadResult
+from app.services.date_parser import DateParser
+from app.services.header_resolver import HeaderResolver
+from app.services.fingerprint_index import CHANGED, DUPLICATE, timecard_fingerprints
+from app.services.issue_store import IssueStore, upload_issues
+from app.services.key_snapshot import hash_keys, reference_keys
+from app.services.rule_engine import ValidationRuleEngine, first_occurrences
 
 logger = logging.getLogger(__name__)
 
 
+def _frame_bytes(frame: pd.DataFrame) -> int:
+    """Memory held by a DataFrame, including string contents."""
+    return int(frame.memory_usage(index=True, deep=True).sum())
+
+
 class DataCleaningService:
     """Service for cleaning and validating Excel data files."""
     
@@ -59,6 +97,33 @@ class DataCleaningService:
             'project': ['PROJECT_NAME', 'SOW']
         }
         
+        # Header lookup compiled once from the synonyms above
+        self.header_resolver = HeaderResolver(self.header_synonyms, self.required_columns)
+        
+        # Reader engines per file type, in order of preference
+        self.reader_engines = {
+            '.csv': {'pyarrow': self._read_csv_pyarrow, 'pandas': self._read_csv_pandas},
+            '.xlsx': {'calamine': self._read_excel_calamine, 'openpyxl': self._read_xlsx_openpyxl},
+            '.xls': {'calamine': self._read_excel_calamine, 'xlrd': self._read_xls_xlrd}
+        }
+        
+        # DAILY_DATE parsing with text formats cached per header signature
+        self.date_parser = DateParser()
+        
+        # Compact dtypes for cleaned TimeCard columns: repetitive text as
+        # categories, IDs as Arrow-backed strings (Python strings without pyarrow)
+        self.compact_dtypes = {
+            'timecard': {
+                'EMPLOYEE_ID': pd.StringDtype('pyarrow' if pa is not None else 'python'),
+                'EMPLOYEE_NAME': 'category',
+                'PROJECT_NAME': 'category',
+                'TIME_CARD_STATE': 'category',
+                'TASK_TYPE': 'category',
+                'DAILY_DATE': 'datetime64[s]',
+                'TIME_WORKED': 'float32'
+            }
+        }
+        
         # Validation rules
         self.validation_rules = {
             'timecard': {
@@ -78,90 +143,584 @@ class DataCleaningService:
                 'PROJECT_NAME': {'max_length': 200, 'required': True, 'unique': True}
             }
         }
+        
+        # validation_rules compiled once into vectorized checks
+        self.rule_engines = {
+            file_type: ValidationRuleEngine(rules)
+            for file_type, rules in self.validation_rules.items()
+        }
 
-    def clean_timecard_data(self, file_path: Path) -> Tuple[pd.DataFrame, List[ValidationIssue]]:
+    def select_reader_engines(self, file_path: Path, engine: Optional[str] = None) -> List[str]:
         """
-        Clean and validate TimeCard Excel data.
+        Reader engines to try for a file, best first.
         
-        TODO: Step 1 - Read Excel with Pandas
-        TODO: Step 2 - Apply header synonym mapping
-        TODO: Step 3 - Type coercion and data cleaning
-        TODO: Step 4 - Validation checks
-        TODO: Step 5 - Referential integrity validation
-        TODO: Step 6 - Deduplication
-        TODO: Step 7 - Data enrichment
-        TODO: Step 8 - Build validation report
-        TODO: Step 9 - Return cleaned DataFrame and issues
+        calamine parses Excel far faster than openpyxl but holds the whole
+        sheet in memory, so files above UPLOAD_IN_MEMORY_READER_MAX_SIZE
+        stream through openpyxl instead. pyarrow reads CSV in parallel
+        blocks. Engines whose package is not installed are skipped.
         
         Args:
-            file_path: Path to TimeCard Excel file
+            file_path: Uploaded file
+            engine: Engine to force (default UPLOAD_READER_ENGINE where it
+                supports the file type; 'auto' selects)
             
         Returns:
-            Tuple of (cleaned_dataframe, validation_issues)
+            Engine names; the last one is always available
+            
+        Raises:
+            ValueError: If the file type or the forced engine is not supported
         """
-        validation_issues = []
+        suffix = Path(file_path).suffix.lower()
+        engines = self.reader_engines.get(suffix)
+        if engines is None:
+            raise ValueError(f"Unsupported file type: {suffix or file_path}")
         
-        try:
-            # TODO: Step 1 - Read Excel with Pandas
-            # - Use pd.read_excel with proper sheet selection
-            # - Handle multiple sheets if present
-            # - Detect file format (xlsx, xls, csv)
-            # - Set proper data types for initial reading
-            
-            # TODO: Step 2 - Header synonym mapping
-            # - Map column headers using self.header_synonyms['timecard']
-            # - Handle case variations and whitespace
-            # - Log any unmapped columns for review
-            
-            # TODO: Step 3 - Type coercion and data cleaning
-            # - Convert DAILY_DATE to datetime with error handling
-            # - Ensure TIME_WORKED is numeric (float)
-            # - Trim whitespace from string columns
-            # - Normalize PROJECT_NAME to uppercase
-            # - Handle missing values appropriately
+        # The configured engine only applies to the file types it can read
+        if engine is None and settings.UPLOAD_READER_ENGINE in engines:
+            engine = settings.UPLOAD_READER_ENGINE
+        if engine and engine != 'auto':
+            if engine not in engines:
+                raise ValueError(f"Reader engine '{engine}' does not support {suffix} files")
+            return [engine]
+        
+        available = {
+            'calamine': CalamineWorkbook is not None,
+            'pyarrow': pa_csv is not None
+        }
+        candidates = [name for name in engines if available.get(name, True)]
+        if (
+            suffix == '.xlsx'
+            and 'calamine' in candidates
+            and Path(file_path).stat().st_size > settings.UPLOAD_IN_MEMORY_READER_MAX_SIZE
+        ):
+            candidates.remove('calamine')
+        return candidates
+
+    def read_chunks(
+        self,
+        file_path: Path,
+        chunk_size: Optional[int] = None,
+        engine: Optional[str] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream a CSV or Excel file as DataFrame chunks of at most chunk_size rows.
+        
+        Cells are read as-is (no type inference across the file) and blank
+        rows are skipped. Each chunk's index is the 0-based data row, so
+        index + 2 is the row number the user sees in the spreadsheet.
+        If the preferred engine fails before producing any rows, the next
+        one is tried.
+        
+        Args:
+            file_path: Path to a .csv, .xlsx or .xls file
+            chunk_size: Rows per chunk (default UPLOAD_CHUNK_ROWS)
+            engine: Reader engine to force (see select_reader_engines)
             
-            # TODO: Step 4 - Validation checks
-            # - Check required columns presence
-            # - Validate TIME_WORKED range (0.1 to 999.9)
-            # - Validate DAILY_DATE (not future dates)
-            # - Check EMPLOYEE_ID format and length
-            # - Validate PROJECT_NAME length and content
+        Yields:
+            DataFrame chunks with the file's own column headers
+        """
+        chunk_size = chunk_size or settings.UPLOAD_CHUNK_ROWS
+        engines = self.reader_engines[Path(file_path).suffix.lower()]
+        candidates = self.select_reader_engines(file_path, engine)
+        
+        for name in candidates:
+            started = False
+            try:
+                for chunk in engines[name](file_path, chunk_size):
+                    started = True
+                    yield chunk
+                return
+            except Exception as e:
+                if started or name == candidates[-1]:
+                    raise
+                logger.warning(f"{name} reader failed on {Path(file_path).name}, falling back: {e}")
+
+    def _read_csv_pyarrow(self, file_path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+        with open(file_path, newline='', encoding='utf-8') as handle:
+            header = next(csv.reader(handle), None)
+        if not header:
+            return
+        
+        # Every column as text (nullable) so types are not inferred per block;
+        # empty lines are kept so row positions match the file
+        reader = pa_csv.open_csv(
+            file_path,
+            parse_options=pa_csv.ParseOptions(ignore_empty_lines=False),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={column: pa.string() for column in header},
+                strings_can_be_null=True
+            )
+        )
+        position = 0
+        pending: List[pa.RecordBatch] = []
+        pending_rows = 0
+        for batch in reader:
+            pending.append(batch)
+            pending_rows += batch.num_rows
+            while pending_rows >= chunk_size:
+                table = pa.Table.from_batches(pending)
+                yield self._arrow_chunk(table.slice(0, chunk_size), position)
+                position += chunk_size
+                rest = table.slice(chunk_size)
+                pending, pending_rows = rest.to_batches(), rest.num_rows
+        if pending_rows:
+            yield self._arrow_chunk(pa.Table.from_batches(pending), position)
+
+    @staticmethod
+    def _arrow_chunk(table: 'pa.Table', position: int) -> pd.DataFrame:
+        chunk = table.to_pandas()
+        chunk.index = pd.RangeIndex(position, position + len(chunk))
+        return chunk.dropna(how='all')
+
+    def _read_csv_pandas(self, file_path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+        with pd.read_csv(
+            file_path,
+            dtype=str,
+            chunksize=chunk_size,
+            skip_blank_lines=False,
+            encoding_errors='replace'
+        ) as reader:
+            for chunk in reader:
+                yield chunk.dropna(how='all')
+
+    def _read_excel_calamine(self, file_path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+        workbook = CalamineWorkbook.from_path(str(file_path))
+        rows = workbook.get_sheet_by_index(0).iter_rows()
+        
+        def values(row):
+            # calamine reports empty cells as '' and every number as float
+            return tuple(
+                None if value == '' else
+                int(value) if isinstance(value, float) and value.is_integer() else
+                value
+                for value in row
+            )
+        
+        yield from self._chunk_rows(map(values, rows), chunk_size)
+
+    def _read_xlsx_openpyxl(self, file_path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+        # read_only mode streams the sheet XML instead of building the whole workbook
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            yield from self._chunk_rows(rows, chunk_size)
+        finally:
+            workbook.close()
+
+    def _read_xls_xlrd(self, file_path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+        # The legacy .xls format has no streaming reader; on_demand at least
+        # skips parsing sheets other than the first
+        workbook = xlrd.open_workbook(file_path, on_demand=True)
+        try:
+            sheet = workbook.sheet_by_index(0)
             
-            # TODO: Step 5 - Referential integrity validation
-            # - Verify EMPLOYEE_ID exists in Employee table
-            # - Verify PROJECT_NAME exists in Project table
-            # - Create validation issues for missing references
+            def values(row):
+                return tuple(
+                    xlrd.xldate_as_datetime(cell.value, workbook.datemode)
+                    if cell.ctype == xlrd.XL_CELL_DATE else
+                    None if cell.ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK) else
+                    # xlrd reports every number as float; keep IDs like 1001 integral
+                    int(cell.value) if cell.ctype == xlrd.XL_CELL_NUMBER and cell.value.is_integer() else
+                    cell.value
+                    for cell in row
+                )
             
-            # TODO: Step 6 - Deduplication
-            # - Remove exact duplicates based on all columns
-            # - Handle business logic duplicates (same employee, project, date)
-            # - Log duplicate removal counts
+            yield from self._chunk_rows(map(values, sheet.get_rows()), chunk_size)
+        finally:
+            workbook.release_resources()
+
+    @staticmethod
+    def _chunk_rows(rows: Iterable[tuple], chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Group sheet rows (header first) into DataFrame chunks, skipping blank rows."""
+        rows = iter(rows)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [str(value).strip() if value is not None else f"Unnamed: {i}" for i, value in enumerate(header)]
+        width = len(columns)
+        
+        buffer: List[tuple] = []
+        positions: List[int] = []
+        for position, row in enumerate(rows):
+            if not any(value is not None and value != '' for value in row):
+                continue
+            buffer.append(tuple(row[:width]) + (None,) * (width - len(row)))
+            positions.append(position)
+            if len(buffer) >= chunk_size:
+                yield pd.DataFrame.from_records(buffer, columns=columns, index=positions)
+                buffer, positions = [], []
+        if buffer:
+            yield pd.DataFrame.from_records(buffer, columns=columns, index=positions)
+
+    def map_headers(self, columns: Iterable[str], file_type: str) -> Dict[str, str]:
+        """
+        Map file headers to canonical column names via header_synonyms.
+        
+        Matching ignores case, whitespace and punctuation; unlisted headers
+        close to a synonym are matched fuzzily (see HeaderResolver).
+        
+        Args:
+            columns: Headers as they appear in the file
+            file_type: 'timecard', 'employee' or 'project'
             
-            # TODO: Step 7 - Data enrichment
-            # - Add derived columns if needed
-            # - Ensure consistent data types
-            # - Add metadata columns (processed_date, batch_id)
+        Returns:
+            Dict of file header -> canonical column for recognised headers
+        """
+        return self.header_resolver.map_headers(columns, file_type)
+
+    def detect_file_type(self, file_path: Path) -> Optional[str]:
+        """
+        Detect whether a file holds TimeCard, Employee or Project data from its headers.
+        
+        Only the first data chunk of a single row is read.
+        
+        Returns:
+            'timecard', 'employee', 'project', or None if the headers match none
+        """
+        first = next(iter(self.read_chunks(file_path, chunk_size=1)), None)
+        return None if first is None else self.header_resolver.detect_file_type(first.columns)
+
+    def classify_files(self, file_paths: Iterable[Path]) -> Tuple[Dict[str, Path], List[ValidationIssue]]:
+        """
+        Route unlabelled uploads to their file types.
+        
+        Args:
+            file_paths: Uploaded files in any order
             
-            # TODO: Step 8 - Build validation report
-            # - Count total rows, valid rows, invalid rows
-            # - Collect all validation issues with row numbers
-            # - Create sample bad rows for review
+        Returns:
+            Tuple of (file_type -> path, issues for unrecognised or repeated files)
+        """
+        routed: Dict[str, Path] = {}
+        issues: List[ValidationIssue] = []
+        for file_path in file_paths:
+            try:
+                file_type = self.detect_file_type(file_path)
+            except Exception as e:
+                logger.error(f"Error reading headers of {Path(file_path).name}: {e}")
+                file_type = None
+            if file_type is None:
+                issues.append(ValidationIssue(
+                    row=1,
+                    column='HEADER',
+                    value=Path(file_path).name,
+                    error="Headers do not match a TimeCard, Employee or Project file"
+                ))
+            elif file_type in routed:
+                issues.append(ValidationIssue(
+                    row=1,
+                    column='HEADER',
+                    value=Path(file_path).name,
+                    error=f"More than one {file_type} file uploaded; using {Path(routed[file_type]).name}"
+                ))
+            else:
+                routed[file_type] = file_path
+        return routed, issues
+
+    def clean_timecard_data(
+        self,
+        file_path: Path,
+        executor: Optional[Executor] = None
+    ) -> Tuple[pd.DataFrame, IssueStore]:
+        """
+        Clean and validate TimeCard Excel data.
+        
+        Runs clean_timecard_chunks over the file and concatenates the cleaned
+        chunks. Reading and cleaning only hold one raw chunk at a time, but
+        the result is the whole cleaned file: peak memory is about twice the
+        cleaned frame in compact dtypes (chunks plus the concatenation), plus
+        one raw chunk per worker. The "memory by stage" log line reports it.
+        
+        Args:
+            file_path: Path to TimeCard Excel file
+            executor: Optional process pool to clean chunks on
             
-            # Placeholder return
-            cleaned_df = pd.DataFrame()
+        Returns:
+            Tuple of (cleaned_dataframe, issue_store)
+        """
+        issues = IssueStore('timecard', Path(file_path).name)
+        memory: Dict[str, int] = {}
+        
+        try:
+            chunks = list(self.clean_timecard_chunks(file_path, issues, executor=executor, memory=memory))
+            cleaned_df = self._concat_chunks(chunks) if chunks else pd.DataFrame()
+            memory['concatenated'] = _frame_bytes(cleaned_df)
+            logger.info(
+                f"Cleaned TimeCard file {issues.filename}: "
+                f"{issues.valid_rows} of {issues.total_rows} rows kept, {issues.count} issues; "
+                f"memory by stage: " + ', '.join(
+                    f"{stage} {size / 2**20:.1f} MiB" for stage, size in memory.items()
+                )
+            )
             
         except Exception as e:
             logger.error(f"Error cleaning TimeCard data: {e}")
-            validation_issues.append(ValidationIssue(
+            issues.add_issue(ValidationIssue(
                 row=0,
                 column='SYSTEM',
                 error=f"File processing error: {str(e)}"
             ))
+            issues.valid_rows = 0
             cleaned_df = pd.DataFrame()
         
-        return cleaned_df, validation_issues
+        return cleaned_df, issues
 
-    def clean_employee_data(self, file_path: Path) -> Tuple[pd.DataFrame, List[ValidationIssue]]:
+    def clean_timecard_chunks(
+        self,
+        file_path: Path,
+        issues: IssueStore,
+        chunk_size: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        memory: Optional[Dict[str, int]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream cleaned TimeCard chunks.
+        
+        Header mapping, type coercion and validation (validation_rules via
+        ValidationRuleEngine) run per chunk. Duplicate detection spans the
+        whole file using 64-bit row hashes, so only 8 bytes per distinct row
+        are kept between chunks.
+        
+        With an executor, the independent per-chunk work (coercion and
+        stateless rules) runs on its workers, a few chunks ahead; the
+        file-order steps (unique rules, duplicates) stay in this process.
+        
+        Args:
+            file_path: Path to TimeCard file (.xlsx, .xls or .csv)
+            issues: Store receiving validation issues and row counts
+            chunk_size: Rows per chunk (default UPLOAD_CHUNK_ROWS)
+            executor: Optional process pool to prepare chunks on
+            memory: Optional dict receiving the bytes held by all chunks
+                at each stage ('read': mapped raw chunks, 'cleaned')
+            
+        Yields:
+            Cleaned chunks
+            
+        Raises:
+            ValueError: If required columns are missing from the file
+        """
+        memory = {} if memory is None else memory
+        memory.update(read=0, cleaned=0)
+        
+        def measured(chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+            for chunk in chunks:
+                memory['read'] += _frame_bytes(chunk)
+                yield chunk
+        
+        chunks = measured(self._mapped_chunks(file_path, 'timecard', chunk_size))
+        if executor is None:
+            prepared = map(self._prepare_timecard_chunk, chunks)
+        else:
+            prepared = self._map_ahead(
+                executor, _prepare_timecard_chunk_job, chunks, 2 * settings.UPLOAD_CLEANING_WORKERS
+            )
+        
+        state = {
+            'rules': {},
+            'rows': np.empty(0, dtype=np.uint64),
+            'keys': np.empty(0, dtype=np.uint64),
+            'exact_duplicates': 0
+        }
+        for cleaned, chunk_issues in prepared:
+            issues.merge(chunk_issues)
+            cleaned = self._finish_timecard_chunk(cleaned, issues, state)
+            issues.valid_rows += len(cleaned)
+            memory['cleaned'] += _frame_bytes(cleaned)
+            yield cleaned
+        
+        if state['exact_duplicates']:
+            logger.info(f"Removed {state['exact_duplicates']} exact duplicate TimeCard rows")
+
+    def _mapped_chunks(
+        self,
+        file_path: Path,
+        file_type: str,
+        chunk_size: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read chunks with recognised columns renamed to canonical names and the rest dropped.
+        
+        Each chunk carries attrs['header_signature'] (file type, extension and
+        raw headers), which identifies the export a file came from.
+        """
+        mapping = None
+        for chunk in self.read_chunks(file_path, chunk_size):
+            if mapping is None:
+                signature = (file_type, Path(file_path).suffix.lower(), tuple(map(str, chunk.columns)))
+                mapping = self.map_headers(chunk.columns, file_type)
+                missing = [c for c in self.required_columns[file_type] if c not in mapping.values()]
+                if missing:
+                    raise ValueError(f"Missing required columns: {', '.join(missing)}")
+                unmapped = [c for c in chunk.columns if c not in mapping]
+                if unmapped:
+                    logger.info(f"Ignoring unmapped {file_type} columns: {', '.join(map(str, unmapped))}")
+            mapped = chunk[list(mapping)].rename(columns=mapping)
+            mapped.attrs['header_signature'] = signature
+            yield mapped
+
+    @staticmethod
+    def _concat_chunks(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Concatenate cleaned chunks, keeping categorical columns categorical.
+        
+        pd.concat falls back to object strings when chunk categories differ,
+        so each chunk is first re-coded onto the union of the categories.
+        """
+        for column in chunks[0].columns:
+            if isinstance(chunks[0][column].dtype, pd.CategoricalDtype):
+                categories = chunks[0][column].cat.categories
+                for chunk in chunks[1:]:
+                    categories = categories.union(chunk[column].cat.categories)
+                chunks = [
+                    chunk.assign(**{column: chunk[column].cat.set_categories(categories)})
+                    for chunk in chunks
+                ]
+        return pd.concat(chunks)
+
+    @staticmethod
+    def _map_ahead(executor: Executor, job: Callable, items: Iterable, lookahead: int) -> Iterator:
+        """Like map(job, items) on an executor, in order, with at most lookahead jobs in flight."""
+        pending = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(job, item))
+                if len(pending) >= lookahead:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _prepare_timecard_chunk(self, chunk: pd.DataFrame) -> Tuple[pd.DataFrame, IssueStore]:
+        """
+        Chunk-local TimeCard cleaning: type coercion, stateless rules and
+        the lookup of already loaded rows in the fingerprint index.
+        
+        Rows identical to a loaded row are dropped. Rows whose key was
+        loaded with different values are kept, flagged in REPLACES_LOADED,
+        so the loader replaces the loaded row instead of adding to it.
+        
+        Independent of other chunks, so it can run in a worker process.
+        
+        Returns:
+            Tuple of (cleaned_chunk, issues for this chunk)
+        """
+        issues = IssueStore('timecard')
+        issues.total_rows = len(chunk)
+        cleaned = self._clean_timecard_chunk(chunk, issues)
+        
+        # validation_rules, evaluated as vectorized masks
+        invalid, failures = self.rule_engines['timecard'].evaluate(cleaned, stateful=False)
+        for check, failing in failures:
+            self._record(issues, cleaned, failing, check.column, check.error)
+        cleaned = cleaned[~invalid]
+        
+        # Rows loaded by an earlier batch must not be appended again
+        status = timecard_fingerprints.classify(cleaned)
+        self._record(
+            issues, cleaned, status == DUPLICATE, 'DAILY_DATE',
+            'TimeCard already loaded (identical row skipped)'
+        )
+        self._record(
+            issues, cleaned, status == CHANGED, 'TIME_WORKED',
+            'TimeCard already loaded with different values (loaded row will be replaced)'
+        )
+        kept = status != DUPLICATE
+        return cleaned[kept].assign(REPLACES_LOADED=status[kept] == CHANGED), issues
+
+    def _finish_timecard_chunk(
+        self,
+        cleaned: pd.DataFrame,
+        issues: IssueStore,
+        state: Dict[str, Any]
+    ) -> pd.DataFrame:
+        """File-order TimeCard steps: stateful rules and duplicate removal."""
+        invalid, failures = self.rule_engines['timecard'].evaluate(cleaned, state['rules'], stateful=True)
+        for check, failing in failures:
+            self._record(issues, cleaned, failing, check.column, check.error)
+        cleaned = cleaned[~invalid]
+        
+        # Exact duplicates (all columns) are dropped silently
+        fresh, state['rows'] = first_occurrences(
+            pd.util.hash_pandas_object(cleaned, index=False).to_numpy(), state['rows']
+        )
+        state['exact_duplicates'] += int((~fresh).sum())
+        cleaned = cleaned[fresh]
+        
+        # Same employee, project and date: keep the first occurrence
+        fresh, state['keys'] = first_occurrences(
+            pd.util.hash_pandas_object(
+                cleaned[['EMPLOYEE_ID', 'PROJECT_NAME', 'DAILY_DATE']], index=False
+            ).to_numpy(),
+            state['keys']
+        )
+        self._record(
+            issues, cleaned, ~fresh, 'DAILY_DATE',
+            'Duplicate TimeCard for the same employee, project and date (first occurrence kept)'
+        )
+        return cleaned[fresh]
+
+    def _clean_timecard_chunk(self, chunk: pd.DataFrame, issues: IssueStore) -> pd.DataFrame:
+        """
+        Coerce one chunk of mapped TimeCard columns and drop unusable rows.
+        
+        Columns are converted to the compact dtypes in compact_dtypes;
+        DAILY_DATE goes through date_parser.
+        
+        Rows with a missing required value, an unparseable date or
+        non-numeric hours are recorded in issues and removed.
+        """
+        cleaned = pd.DataFrame(index=chunk.index)
+        dtypes = self.compact_dtypes['timecard']
+        
+        for column in ('EMPLOYEE_ID', 'EMPLOYEE_NAME', 'PROJECT_NAME', 'TIME_CARD_STATE', 'TASK_TYPE'):
+            if column in chunk.columns:
+                values = chunk[column].astype('string').str.strip().str.replace(r'\s+', ' ', regex=True)
+                if column == 'EMPLOYEE_ID':
+                    values = values.str.upper()
+                cleaned[column] = values.mask(values == '').astype(dtypes[column])
+        
+        cleaned['DAILY_DATE'] = self.date_parser.parse(
+            chunk['DAILY_DATE'], chunk.attrs.get('header_signature')
+        ).dt.normalize().astype(dtypes['DAILY_DATE'])
+        # TIME_WORKED is NUMBER(3,1), well within float32 precision
+        cleaned['TIME_WORKED'] = pd.to_numeric(
+            chunk['TIME_WORKED'], errors='coerce'
+        ).astype(dtypes['TIME_WORKED'])
+        
+        invalid = pd.Series(False, index=chunk.index)
+        for column in self.required_columns['timecard']:
+            raw = chunk[column]
+            missing = (raw.isna() | (raw.astype('string').str.strip() == '').fillna(True)) & ~invalid
+            self._record(issues, chunk, missing, column, 'Missing required value')
+            invalid |= missing
+        
+        for column, error in (
+            ('DAILY_DATE', 'Invalid date'),
+            ('TIME_WORKED', 'TIME_WORKED must be numeric')
+        ):
+            unparsed = cleaned[column].isna() & ~invalid
+            self._record(issues, chunk, unparsed, column, error)
+            invalid |= unparsed
+        
+        return cleaned[~invalid]
+
+    @staticmethod
+    def _record(issues: IssueStore, frame: pd.DataFrame, mask, column: str, error: str) -> None:
+        """Record the rows of frame selected by mask as failing (row = spreadsheet row)."""
+        mask = np.asarray(mask, dtype=bool)
+        if not mask.any():
+            return
+        positions = np.flatnonzero(mask)
+        issues.add(
+            column,
+            error,
+            frame.index[positions].to_numpy() + 2,
+            # Only the first few values are kept as samples
+            frame[column].iloc[positions[:issues.sample_size]] if column in frame.columns else None
+        )
+
+    def clean_employee_data(self, file_path: Path) -> Tuple[pd.DataFrame, IssueStore]:
         """
         Clean and validate Employee Excel data.
         
@@ -179,9 +738,9 @@ class DataCleaningService:
             file_path: Path to Employee Excel file
             
         Returns:
-            Tuple of (cleaned_dataframe, validation_issues)
+            Tuple of (cleaned_dataframe, issue_store)
         """
-        validation_issues = []
+        issues = IssueStore('employee', Path(file_path).name)
         
         try:
             # TODO: Step 1 - Read Excel with Pandas
@@ -235,16 +794,16 @@ class DataCleaningService:
             
         except Exception as e:
             logger.error(f"Error cleaning Employee data: {e}")
-            validation_issues.append(ValidationIssue(
+            issues.add_issue(ValidationIssue(
                 row=0,
                 column='SYSTEM',
                 error=f"File processing error: {str(e)}"
             ))
             cleaned_df = pd.DataFrame()
         
-        return cleaned_df, validation_issues
+        return cleaned_df, issues
 
-    def clean_project_data(self, file_path: Path) -> Tuple[pd.DataFrame, List[ValidationIssue]]:
+    def clean_project_data(self, file_path: Path) -> Tuple[pd.DataFrame, IssueStore]:
         """
         Clean and validate Project/SOW Excel data.
         
@@ -262,9 +821,9 @@ class DataCleaningService:
             file_path: Path to Project Excel file
             
         Returns:
-            Tuple of (cleaned_dataframe, validation_issues)
+            Tuple of (cleaned_dataframe, issue_store)
         """
-        validation_issues = []
+        issues = IssueStore('project', Path(file_path).name)
         
         try:
             # TODO: Step 1 - Read Excel with Pandas
@@ -316,29 +875,31 @@ class DataCleaningService:
             
         except Exception as e:
             logger.error(f"Error cleaning Project data: {e}")
-            validation_issues.append(ValidationIssue(
+            issues.add_issue(ValidationIssue(
                 row=0,
                 column='SYSTEM',
                 error=f"File processing error: {str(e)}"
             ))
             cleaned_df = pd.DataFrame()
         
-        return cleaned_df, validation_issues
+        return cleaned_df, issues
 
     def validate_referential_integrity(
         self, 
         timecard_df: pd.DataFrame, 
         employee_df: pd.DataFrame, 
         project_df: pd.DataFrame
-    ) -> List[ValidationIssue]:
+    ) -> IssueStore:
         """
         Validate referential integrity between datasets.
         
-        TODO: Implement cross-table validation
-        - TimeCard.EMPLOYEE_ID ∈ Employee.EMPLOYEE_ID
-        - TimeCard.PROJECT_NAME ∈ Project.PROJECT_NAME
-        - Check for orphaned records
-        - Validate business rules across tables
+        TimeCard.EMPLOYEE_ID and TimeCard.PROJECT_NAME must exist either in
+        Oracle (the cached reference key snapshot) or in the Employee and
+        Project files uploaded alongside. The check is a semi-join on key
+        hashes; no per-row database lookups are made. Keys are compared
+        exactly, as the loader resolves them. If the snapshot cannot be
+        read, the check is skipped rather than reporting keys that only
+        exist in Oracle; the loader still drops rows with unknown keys.
         
         Args:
             timecard_df: Cleaned TimeCard DataFrame
@@ -346,112 +907,180 @@ class DataCleaningService:
             project_df: Cleaned Project DataFrame
             
         Returns:
-            List of referential integrity validation issues
+            IssueStore of referential integrity issues (rows refer to the TimeCard file)
         """
-        issues = []
+        issues = IssueStore('referential')
+        issues.total_rows = len(timecard_df)
+        if timecard_df.empty:
+            return issues
+        
+        stored = reference_keys.keys()
+        if stored is None:
+            logger.warning("Reference key snapshot unavailable; referential integrity not verified")
+            issues.valid_rows = issues.total_rows
+            return issues
         
-        # TODO: Cross-table validation logic
-        # - Create sets of valid EMPLOYEE_IDs and PROJECT_NAMEs
-        # - Check TimeCard references against these sets
-        # - Generate detailed error messages for invalid references
-        # - Handle case sensitivity and normalization
+        orphaned = np.zeros(len(timecard_df), dtype=bool)
+        for column, df, error in (
+            ('EMPLOYEE_ID', employee_df, 'EMPLOYEE_ID not found in Employee data'),
+            ('PROJECT_NAME', project_df, 'PROJECT_NAME not found in Project data')
+        ):
+            if column not in timecard_df.columns:
+                continue
+            known = [stored[column]]
+            if column in df.columns:
+                known.append(hash_keys(df[column]))
+            missing = reference_keys.missing(timecard_df[column], *known)
+            self._record(issues, timecard_df, missing, column, error)
+            orphaned |= missing
         
+        issues.valid_rows = issues.total_rows - int(orphaned.sum())
         return issues
 
     def build_validation_report(
         self,
-        timecard_result: Tuple[pd.DataFrame, List[ValidationIssue]],
-        employee_result: Tuple[pd.DataFrame, List[ValidationIssue]],
-        project_result: Tuple[pd.DataFrame, List[ValidationIssue]],
-        referential_issues: List[ValidationIssue]
+        timecard_result: Optional[Tuple[pd.DataFrame, IssueStore]] = None,
+        employee_result: Optional[Tuple[pd.DataFrame, IssueStore]] = None,
+        project_result: Optional[Tuple[pd.DataFrame, IssueStore]] = None,
+        referential_issues: Optional[IssueStore] = None,
+        file_issues: Optional[IssueStore] = None
     ) -> ValidationReport:
         """
         Build comprehensive validation report from all cleaning results.
         
-        TODO: Aggregate validation results
-        - Count total files, rows, and issues
-        - Combine all validation issues
-        - Calculate success/failure rates
-        - Generate actionable insights
+        Each file contributes its row counts and the aggregated issue
+        summary (per-rule counts, samples and row ranges), so the report
+        size does not grow with the number of bad rows. The issue stores
+        are registered for paging and the report carries their upload_id.
         
         Args:
             timecard_result: (DataFrame, issues) for TimeCard
             employee_result: (DataFrame, issues) for Employee
             project_result: (DataFrame, issues) for Project
             referential_issues: Cross-table validation issues
+            file_issues: Uploads that could not be routed to a file type
             
         Returns:
             Comprehensive ValidationReport
         """
-        # TODO: Implement report building logic
-        # - Extract DataFrames and issues from results
-        # - Count rows and issues for each file type
-        # - Combine all validation issues
-        # - Calculate overall statistics
-        # - Generate file-specific UploadResult objects
+        stores = {
+            store.file_type: store
+            for store in (
+                result[1] for result in (timecard_result, employee_result, project_result) if result
+            )
+        }
+        if referential_issues is not None and referential_issues.count:
+            stores['referential'] = referential_issues
+        if file_issues is not None and file_issues.count:
+            stores['files'] = file_issues
         
-        # Placeholder return
+        uploads = [
+            UploadResult(
+                filename=store.filename or file_type,
+                file_type=file_type,
+                total_rows=store.total_rows,
+                valid_rows=store.valid_rows,
+                invalid_rows=store.invalid_rows,
+                validation_issues=store.samples(),
+                issue_count=store.count,
+                issue_summary=store.summary()
+            )
+            for file_type, store in stores.items()
+        ]
+        files = [upload for upload in uploads if upload.file_type not in ('referential', 'files')]
         return ValidationReport(
-            uploads=[],
-            total_files=3,
-            total_valid_rows=0,
-            total_invalid_rows=0,
-            has_errors=True
+            uploads=uploads,
+            total_files=len(files),
+            total_valid_rows=sum(upload.valid_rows for upload in files),
+            total_invalid_rows=sum(upload.invalid_rows for upload in files),
+            has_errors=any(upload.issue_count for upload in uploads),
+            upload_id=upload_issues.register(stores)
         )
 
     def clean_all_files(
         self,
         timecard_path: Optional[Path] = None,
         employee_path: Optional[Path] = None,
-        project_path: Optional[Path] = None
+        project_path: Optional[Path] = None,
+        file_paths: Optional[Iterable[Path]] = None
     ) -> Tuple[Dict[str, pd.DataFrame], ValidationReport]:
         """
         Clean all provided Excel files and generate validation report.
         
-        TODO: Orchestrate complete cleaning workflow
-        - Clean each file individually
-        - Validate referential integrity
-        - Build comprehensive report
-        - Handle errors gracefully
+        A TimeCard file of at least UPLOAD_PARALLEL_MIN_SIZE bytes is cleaned
+        chunk by chunk on a process pool; smaller files are cleaned
+        in-process, where starting workers would cost more than it saves.
+        Employee and Project files are small and always cleaned in-process.
+        Unlabelled files are routed by their headers (see classify_files);
+        a labelled path takes precedence over a routed file of the same type.
         
         Args:
             timecard_path: Path to TimeCard file (optional)
             employee_path: Path to Employee file (optional)
             project_path: Path to Project file (optional)
+            file_paths: Unlabelled files of any type (optional)
             
         Returns:
             Tuple of (cleaned_dataframes, validation_report)
         """
-        cleaned_dataframes = {}
-        all_issues = []
+        paths = {
+            file_type: Path(path)
+            for file_type, path in (
+                ('timecard', timecard_path), ('employee', employee_path), ('project', project_path)
+            )
+            if path
+        }
+        results: Dict[str, Tuple[pd.DataFrame, IssueStore]] = {}
+        file_issues = IssueStore('files')
         
         try:
-            # TODO: Implement complete cleaning workflow
-            # - Clean TimeCard if provided
-            # - Clean Employee if provided
-            # - Clean Project if provided
-            # - Validate referential integrity
-            # - Build comprehensive report
-            # - Handle partial file scenarios
-            
-            # Placeholder implementation
-            if timecard_path:
-                cleaned_dataframes['timecard'] = pd.DataFrame()
-            if employee_path:
-                cleaned_dataframes['employee'] = pd.DataFrame()
-            if project_path:
-                cleaned_dataframes['project'] = pd.DataFrame()
+            if file_paths:
+                routed, routing_issues = self.classify_files(file_paths)
+                for issue in routing_issues:
+                    file_issues.add_issue(issue)
+                for file_type, path in routed.items():
+                    if file_type in paths:
+                        file_issues.add_issue(ValidationIssue(
+                            row=1,
+                            column='HEADER',
+                            value=Path(path).name,
+                            error=f"More than one {file_type} file uploaded; using {paths[file_type].name}"
+                        ))
+                    else:
+                        paths[file_type] = Path(path)
             
-            validation_report = ValidationReport(
-                uploads=[],
-                total_files=len(cleaned_dataframes),
-                total_valid_rows=0,
-                total_invalid_rows=0,
-                has_errors=True
+            if 'timecard' in paths:
+                workers = min(settings.UPLOAD_CLEANING_WORKERS, os.cpu_count() or 1)
+                if workers < 2 or paths['timecard'].stat().st_size < settings.UPLOAD_PARALLEL_MIN_SIZE:
+                    results['timecard'] = self.clean_timecard_data(paths['timecard'])
+                else:
+                    # spawn: forking a threaded API worker can deadlock the children
+                    with ProcessPoolExecutor(
+                        max_workers=workers, mp_context=multiprocessing.get_context('spawn')
+                    ) as pool:
+                        results['timecard'] = self.clean_timecard_data(paths['timecard'], executor=pool)
+            if 'employee' in paths:
+                results['employee'] = self.clean_employee_data(paths['employee'])
+            if 'project' in paths:
+                results['project'] = self.clean_project_data(paths['project'])
+            
+            cleaned_dataframes = {file_type: result[0] for file_type, result in results.items()}
+            referential_issues = self.validate_referential_integrity(
+                cleaned_dataframes.get('timecard', pd.DataFrame()),
+                cleaned_dataframes.get('employee', pd.DataFrame()),
+                cleaned_dataframes.get('project', pd.DataFrame())
+            )
+            validation_report = self.build_validation_report(
+                results.get('timecard'),
+                results.get('employee'),
+                results.get('project'),
+                referential_issues,
+                file_issues
             )
             
         except Exception as e:
             logger.error(f"Error in complete cleaning workflow: {e}")
+            cleaned_dataframes = {}
             validation_report = ValidationReport(
                 uploads=[],
                 total_files=0,
@@ -460,4 +1089,20 @@ class DataCleaningService:
                 has_errors=True
             )
         
-        return cleaned_dataframes, validation_report 
\ No newline at end of file
+        return cleaned_dataframes, validation_report
+
+
+# Service instance of a cleaning worker process, created on its first job
+_worker_service: Optional[DataCleaningService] = None
+
+
+def _get_worker_service() -> DataCleaningService:
+    global _worker_service
+    if _worker_service is None:
+        _worker_service = DataCleaningService()
+    return _worker_service
+
+
+def _prepare_timecard_chunk_job(chunk: pd.DataFrame) -> Tuple[pd.DataFrame, IssueStore]:
+    """Chunk-local TimeCard cleaning in a pool worker."""
+    return _get_worker_service()._prepare_timecard_chunk(chunk)
@@ -0,0 +1,251 @@
+"""
+Cost Cube Service for Gross Calculator
+
+This service maintains the TIMECARD_COST_CUBE rollup used by the dashboard
+drill-down endpoints:
+- Hours and cost per project x month x task type x timecard state
+- Incremental refresh of the cells touched by an ingest batch
+- Full rebuild when employee costs change
+- Slice-and-dice queries served from the cube instead of TIMECARD
+"""
+
+import logging
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import date
+
+import pandas as pd
+
+from app.db.oracle import get_db_connection, execute_query
+
+logger = logging.getLogger(__name__)
+
+
+# Cube dimensions exposed to the API, mapped to columns of the cube (c)
+# joined to PROJECT (p); the cube is keyed by PROJECT_ID
+CUBE_DIMENSIONS = {
+    'project': 'p.PROJECT_NAME',
+    'month': 'c.MONTH_START',
+    'task_type': 'c.TASK_TYPE',
+    'time_card_state': 'c.TIME_CARD_STATE',
+}
+
+# Aggregates TIMECARD into cube cells; :cell_filter is replaced per use
+_CUBE_SOURCE_SQL = """
+    SELECT
+        t.PROJECT_ID,
+        TRUNC(t.DAILY_DATE, 'MM') AS MONTH_START,
+        NVL(tt.TASK_TYPE, 'UNSPECIFIED') AS TASK_TYPE,
+        NVL(s.TIME_CARD_STATE, 'UNSPECIFIED') AS TIME_CARD_STATE,
+        SUM(t.TIME_WORKED) AS TOTAL_HOURS,
+        ROUND(SUM(t.TIME_WORKED * NVL(emp.HOURLY_COST, 0)), 2) AS TOTAL_COST,
+        :batch_id AS LAST_BATCH_ID
+    FROM TIMECARD t
+    JOIN PROJECT p ON p.PROJECT_ID = t.PROJECT_ID
+    LEFT JOIN TASK_TYPE_LOOKUP tt ON tt.TASK_TYPE_ID = t.TASK_TYPE_ID
+    LEFT JOIN TIME_CARD_STATE_LOOKUP s ON s.TIME_CARD_STATE_ID = t.TIME_CARD_STATE_ID
+    LEFT JOIN (
+        SELECT EMPLOYEE_KEY,
+               margin_calc_pkg_02.f_decrypt_ctc(CTC) / 2112 AS HOURLY_COST
+        FROM EMPLOYEE
+    ) emp ON t.EMPLOYEE_KEY = emp.EMPLOYEE_KEY
+    WHERE t.DAILY_DATE IS NOT NULL
+      {cell_filter}
+    GROUP BY
+        t.PROJECT_ID,
+        TRUNC(t.DAILY_DATE, 'MM'),
+        NVL(tt.TASK_TYPE, 'UNSPECIFIED'),
+        NVL(s.TIME_CARD_STATE, 'UNSPECIFIED')
+"""
+
+_CUBE_COLUMNS = (
+    'PROJECT_ID, MONTH_START, TASK_TYPE, TIME_CARD_STATE, '
+    'TOTAL_HOURS, TOTAL_COST, LAST_BATCH_ID'
+)
+
+
+class CostCubeService:
+    """Service for maintaining and querying the timecard cost cube."""
+
+    def cells_from_timecards(self, df: pd.DataFrame) -> List[Tuple[str, date]]:
+        """
+        Get the (project, month) cells touched by a TimeCard DataFrame.
+
+        Args:
+            df: Cleaned TimeCard DataFrame
+
+        Returns:
+            Distinct (PROJECT_NAME, month start) pairs
+        """
+        if df.empty or not {'PROJECT_NAME', 'DAILY_DATE'} <= set(df.columns):
+            return []
+
+        months = pd.to_datetime(df['DAILY_DATE'], errors='coerce').dt.to_period('M').dt.start_time
+        cells = pd.DataFrame({'project': df['PROJECT_NAME'], 'month': months}).dropna().drop_duplicates()
+        return [
+            (project, month.date())
+            for project, month in cells.itertuples(index=False)
+        ]
+
+    def refresh_cells(self, cells: List[Tuple[str, date]], batch_id: str) -> int:
+        """
+        Recompute the cube rows for the given (project, month) cells.
+
+        Each cell is deleted and re-aggregated from TIMECARD, so the refresh
+        is idempotent and safe to retry for the same batch. Project names
+        are resolved to the cube's PROJECT_ID through PROJECT.
+
+        Args:
+            cells: (PROJECT_NAME, month start) pairs to recompute
+            batch_id: Ingest batch triggering the refresh
+
+        Returns:
+            Number of cells refreshed
+        """
+        if not cells:
+            return 0
+
+        binds = [
+            {'project_name': project, 'month_start': month, 'batch_id': batch_id}
+            for project, month in cells
+        ]
+        cell_filter = (
+            "AND p.PROJECT_NAME = :project_name "
+            "AND t.DAILY_DATE >= :month_start "
+            "AND t.DAILY_DATE < ADD_MONTHS(:month_start, 1)"
+        )
+
+        with get_db_connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.executemany(
+                    "DELETE FROM TIMECARD_COST_CUBE "
+                    "WHERE PROJECT_ID = (SELECT PROJECT_ID FROM PROJECT WHERE PROJECT_NAME = :project_name) "
+                    "AND MONTH_START = :month_start",
+                    [{'project_name': b['project_name'], 'month_start': b['month_start']} for b in binds]
+                )
+                cursor.executemany(
+                    f"INSERT INTO TIMECARD_COST_CUBE ({_CUBE_COLUMNS}) "
+                    + _CUBE_SOURCE_SQL.format(cell_filter=cell_filter),
+                    binds
+                )
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+
+        logger.info(f"Refreshed {len(cells)} cost cube cells for batch {batch_id}")
+        return len(cells)
+
+    def rebuild(self, batch_id: str) -> bool:
+        """
+        Rebuild the whole cube from TIMECARD.
+
+        Used after Employee loads, since a CTC change re-prices every cell
+        the employee has booked time against.
+
+        Args:
+            batch_id: Ingest batch triggering the rebuild
+
+        Returns:
+            True if rebuild successful, False otherwise
+        """
+        try:
+            with get_db_connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute("DELETE FROM TIMECARD_COST_CUBE")
+                    cursor.execute(
+                        f"INSERT INTO TIMECARD_COST_CUBE ({_CUBE_COLUMNS}) "
+                        + _CUBE_SOURCE_SQL.format(cell_filter=''),
+                        {'batch_id': batch_id}
+                    )
+                    connection.commit()
+                except Exception:
+                    connection.rollback()
+                    raise
+                finally:
+                    cursor.close()
+
+            logger.info(f"Rebuilt cost cube for batch {batch_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error rebuilding cost cube: {e}")
+            return False
+
+    def get_breakdown(
+        self,
+        group_by: List[str],
+        project_name: Optional[str] = None,
+        month_from: Optional[date] = None,
+        month_to: Optional[date] = None,
+        task_type: Optional[str] = None,
+        time_card_state: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Slice and aggregate the cube along the requested dimensions.
+
+        Args:
+            group_by: Dimension names from CUBE_DIMENSIONS
+            project_name: Optional project filter
+            month_from: Optional first month (inclusive)
+            month_to: Optional last month (inclusive)
+            task_type: Optional task type filter
+            time_card_state: Optional timecard state filter
+
+        Returns:
+            List of dicts with one key per dimension plus totalHours and totalCost
+        """
+        unknown = [dim for dim in group_by if dim not in CUBE_DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Unknown breakdown dimensions: {', '.join(unknown)}")
+
+        dimensions = list(dict.fromkeys(group_by))
+        columns = [CUBE_DIMENSIONS[dim] for dim in dimensions]
+
+        conditions = []
+        params: Dict[str, Any] = {}
+        if project_name:
+            conditions.append("p.PROJECT_NAME = :project_name")
+            params['project_name'] = project_name
+        if month_from:
+            conditions.append("c.MONTH_START >= TRUNC(:month_from, 'MM')")
+            params['month_from'] = month_from
+        if month_to:
+            conditions.append("c.MONTH_START <= TRUNC(:month_to, 'MM')")
+            params['month_to'] = month_to
+        if task_type:
+            conditions.append("c.TASK_TYPE = :task_type")
+            params['task_type'] = task_type
+        if time_card_state:
+            conditions.append("c.TIME_CARD_STATE = :time_card_state")
+            params['time_card_state'] = time_card_state
+
+        select_list = ', '.join(columns + [
+            'SUM(c.TOTAL_HOURS) AS TOTAL_HOURS',
+            'SUM(c.TOTAL_COST) AS TOTAL_COST'
+        ])
+        query = (
+            f"SELECT {select_list} FROM TIMECARD_COST_CUBE c "
+            "JOIN PROJECT p ON p.PROJECT_ID = c.PROJECT_ID"
+        )
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        if columns:
+            query += f" GROUP BY {', '.join(columns)} ORDER BY {', '.join(columns)}"
+
+        rows = execute_query(query, params or None)
+
+        breakdown = []
+        for row in rows:
+            item: Dict[str, Any] = {}
+            for dim, column in zip(dimensions, columns):
+                value = row[column.split('.')[-1]]
+                item[dim] = value.date().isoformat() if dim == 'month' and value else value
+            item['totalHours'] = float(row['TOTAL_HOURS'] or 0)
+            item['totalCost'] = float(row['TOTAL_COST'] or 0)
+            breakdown.append(item)
+
+        return breakdown
@@ -0,0 +1,223 @@
+"""
+Date Parser for Gross Calculator uploads
+
+DateParser converts a date column (DAILY_DATE) without letting pandas
+guess a format for every element:
+- datetime cells (Excel dates) are converted as they are
+- numbers in the Excel serial range are converted arithmetically
+- text is parsed with one fixed format, inferred from a sample and cached
+  per header signature, so later chunks and later uploads of the same
+  export skip inference; a cached format that no longer reads the whole
+  sample is dropped and the format re-inferred
+- only values no inferred format matches fall back to per-element parsing;
+  whatever is still unparsed comes back as NaT for the caller to report
+
+Ambiguous day/month text resolves month-first, as per-element parsing did.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from numbers import Number
+from typing import Hashable, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype, is_bool_dtype, is_datetime64_any_dtype, is_numeric_dtype
+
+
+class DateParser:
+    """Vectorized date parsing with a per-signature format cache."""
+
+    # Text formats tried during inference; on ties the earlier one wins
+    FORMATS = (
+        '%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y/%m/%d', '%Y%m%d',
+        '%m/%d/%Y', '%d/%m/%Y', '%m-%d-%Y', '%d-%m-%Y', '%d.%m.%Y',
+        '%m/%d/%y', '%d/%m/%y', '%d-%b-%Y', '%d-%b-%y', '%d %b %Y', '%b %d, %Y',
+        '%d %B %Y', '%B %d, %Y', '%m/%d/%Y %H:%M', '%d/%m/%Y %H:%M',
+        '%m/%d/%Y %H:%M:%S', '%d/%m/%Y %H:%M:%S'
+    )
+    # Formats tried per column before the per-element fallback
+    MAX_FORMATS = 3
+    # Header signatures whose inferred format is remembered
+    FORMAT_CACHE_SIZE = 256
+
+    # Excel day 0; numbers in [SERIAL_MIN, SERIAL_MAX) are read as 1950-2099 dates
+    EXCEL_EPOCH = np.datetime64('1899-12-30', 's')
+    SERIAL_MIN = 18264
+    SERIAL_MAX = 73051
+
+    def __init__(self, sample_size: int = 200):
+        """
+        Args:
+            sample_size: Distinct values used to infer a text format
+        """
+        self.sample_size = sample_size
+        self._formats: 'OrderedDict[Hashable, str]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def parse(self, values: pd.Series, signature: Optional[Hashable] = None) -> pd.Series:
+        """
+        Parse a column of dates.
+
+        Args:
+            values: Raw column values (text, datetime cells, serial numbers)
+            signature: Key the inferred text format is cached under, e.g.
+                file type, extension and raw headers (None = no caching)
+
+        Returns:
+            datetime64[s] Series on the same index, NaT where unparseable
+        """
+        if is_datetime64_any_dtype(values):
+            return values.astype('datetime64[s]')
+
+        parsed = np.full(len(values), np.datetime64('NaT'), dtype='datetime64[s]')
+        pending = values.notna().to_numpy()
+        if not pending.any():
+            return pd.Series(parsed, index=values.index)
+
+        if is_numeric_dtype(values) and not is_bool_dtype(values):
+            parsed[:] = self._serials(values.to_numpy(dtype=float, na_value=np.nan))
+            return pd.Series(parsed, index=values.index)
+
+        kind = infer_dtype(values, skipna=True)
+        if kind == 'string':
+            text = pending
+        elif kind in ('datetime', 'date'):
+            text = np.zeros(len(values), dtype=bool)
+            self._fill(parsed, pending, pd.to_datetime(values[pending], errors='coerce'))
+        elif kind in ('integer', 'floating', 'mixed-integer-float', 'decimal'):
+            text = np.zeros(len(values), dtype=bool)
+            parsed[:] = self._serials(pd.to_numeric(values, errors='coerce').to_numpy(dtype=float))
+        else:
+            # Mixed cells: split by type once, then parse each group vectorially
+            objects = values.to_numpy(dtype=object)
+            kinds = np.fromiter(
+                (
+                    1 if isinstance(value, str) else
+                    2 if isinstance(value, (datetime, date, np.datetime64)) else
+                    3 if isinstance(value, Number) and not isinstance(value, bool) else
+                    0
+                    for value in objects
+                ),
+                dtype=np.int8,
+                count=len(objects)
+            )
+            text = pending & (kinds == 1)
+            cells = pending & (kinds == 2)
+            numbers = pending & (kinds == 3)
+            if cells.any():
+                self._fill(parsed, cells, pd.to_datetime(pd.Series(objects[cells]), errors='coerce'))
+            if numbers.any():
+                parsed[numbers] = self._serials(objects[numbers].astype(float))
+
+        if text.any():
+            self._parse_text(values, text, parsed, signature)
+
+        # Slow path: per-element parsing for whatever is left
+        residual = pending & np.isnat(parsed)
+        if residual.any():
+            codes, uniques = pd.factorize(values[residual].astype(str).str.strip())
+            parsed[residual] = pd.Series(
+                pd.to_datetime(pd.Series(uniques), errors='coerce', format='mixed')
+            ).to_numpy(dtype='datetime64[s]')[codes]
+        return pd.Series(parsed, index=values.index)
+
+    def infer_format(self, text: pd.Series) -> Optional[str]:
+        """
+        Format in FORMATS matching the most values of a sample of text.
+
+        Returns:
+            The best format, or None if no format matches any value
+        """
+        sample = self._sample(text)
+
+        best, best_count = None, 0
+        for fmt in self.FORMATS:
+            count = self._matches(sample, fmt)
+            if count > best_count:
+                best, best_count = fmt, count
+                if count == len(sample):
+                    break
+        return best
+
+    def _parse_text(
+        self,
+        values: pd.Series,
+        mask: np.ndarray,
+        parsed: np.ndarray,
+        signature: Optional[Hashable]
+    ) -> None:
+        """
+        Parse text cells with cached or inferred fixed formats, then as serial numbers.
+
+        Each distinct text is parsed once; a timecard column repeats a few
+        hundred dates over many rows.
+        """
+        positions = np.flatnonzero(mask)
+        codes, uniques = pd.factorize(values.iloc[positions])
+        text = pd.Series(uniques).astype(str).str.strip()
+        counts = np.bincount(codes, minlength=len(text))
+        dates = np.full(len(text), np.datetime64('NaT'), dtype='datetime64[s]')
+        left = np.arange(len(text))
+        with self._lock:
+            fmt = self._formats.get(signature) if signature is not None else None
+        if fmt is not None:
+            # A cached format is only reused if it still reads the whole
+            # sample of this upload; otherwise it is dropped and re-inferred
+            sample = self._sample(text)
+            if self._matches(sample, fmt) < len(sample):
+                with self._lock:
+                    if self._formats.get(signature) == fmt:
+                        del self._formats[signature]
+                fmt = None
+
+        used = {}
+        for _ in range(self.MAX_FORMATS):
+            if fmt is None:
+                fmt = self.infer_format(text)
+                if fmt is None or fmt in used:
+                    break
+            result = pd.to_datetime(text, format=fmt, errors='coerce')
+            matched = result.notna().to_numpy()
+            used[fmt] = int(counts[left[matched]].sum())
+            dates[left[matched]] = result[matched].to_numpy(dtype='datetime64[s]')
+            left, text = left[~matched], text[~matched]
+            if not len(text):
+                break
+            fmt = None
+
+        if len(text):
+            # Serial numbers exported as text
+            dates[left] = self._serials(pd.to_numeric(text, errors='coerce').to_numpy(dtype=float))
+        parsed[positions] = dates[codes]
+
+        if signature is not None and used and max(used.values()):
+            with self._lock:
+                self._formats[signature] = max(used, key=used.get)
+                self._formats.move_to_end(signature)
+                while len(self._formats) > self.FORMAT_CACHE_SIZE:
+                    self._formats.popitem(last=False)
+
+    def _sample(self, text: pd.Series) -> pd.Series:
+        """Up to sample_size distinct values, spread over the column."""
+        if len(text) > self.sample_size * 5:
+            text = text.iloc[np.linspace(0, len(text) - 1, self.sample_size * 5).astype(np.intp)]
+        return text.drop_duplicates().head(self.sample_size)
+
+    @staticmethod
+    def _matches(sample: pd.Series, fmt: str) -> int:
+        """Number of sample values fmt parses."""
+        return int(pd.to_datetime(sample, format=fmt, errors='coerce').notna().sum())
+
+    def _serials(self, numbers: np.ndarray) -> np.ndarray:
+        """Excel serial day numbers (with fractional times) -> datetime64[s]; NaT outside the range."""
+        dates = np.full(len(numbers), np.datetime64('NaT'), dtype='datetime64[s]')
+        valid = (numbers >= self.SERIAL_MIN) & (numbers < self.SERIAL_MAX)
+        dates[valid] = self.EXCEL_EPOCH + np.round(numbers[valid] * 86400).astype('timedelta64[s]')
+        return dates
+
+    @staticmethod
+    def _fill(parsed: np.ndarray, mask: np.ndarray, result: pd.Series) -> None:
+        """Write a to_datetime result for the masked rows into parsed."""
+        parsed[mask] = pd.Series(result).to_numpy(dtype='datetime64[s]')
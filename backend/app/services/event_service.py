@@ -0,0 +1,121 @@
+"""
+Margin Event Service for Gross Calculator
+
+This service pushes margin updates to connected dashboards:
+- In-process broadcaster with one bounded asyncio queue per subscriber
+- Compact margin deltas published after each ingest batch or refresh
+- Version watcher so batches loaded by other workers still notify clients
+
+Subscribers are plain queues on the event loop, so idle connections cost
+no threads.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from app.core.config import settings
+from app.services.version_service import data_version
+
+logger = logging.getLogger(__name__)
+
+
+class MarginEventBroadcaster:
+    """Fan-out of margin update events to SSE subscribers."""
+
+    def __init__(self, queue_size: int = 32):
+        self.queue_size = queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._watcher: Optional[asyncio.Task] = None
+        self._published_versions: deque = deque(maxlen=16)
+        self._watched_version: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue]:
+        """
+        Register a subscriber queue for the lifetime of the context.
+
+        Yields:
+            Queue receiving event dictionaries
+        """
+        self._loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        if self._watcher is None or self._watcher.done():
+            self._watcher = self._loop.create_task(self._watch_versions())
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        """
+        Send an event to every subscriber.
+
+        Safe to call from request handlers, worker threads and the
+        event loop alike.
+
+        Args:
+            event: JSON-serializable event with at least 'type' and 'version'
+        """
+        with self._lock:
+            if event.get('version'):
+                self._published_versions.append(event['version'])
+        loop = self._loop
+        if loop is None or loop.is_closed() or not self._subscribers:
+            return
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._deliver(event)
+        else:
+            loop.call_soon_threadsafe(self._deliver, event)
+
+    def _deliver(self, event: Dict[str, Any]) -> None:
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Slow consumer: drop its backlog and ask it to resync
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({
+                    'type': 'resync',
+                    'version': event.get('version'),
+                    'fullResync': True
+                })
+
+    async def _watch_versions(self) -> None:
+        """Announce data versions loaded by other worker processes."""
+        while self._subscribers:
+            await asyncio.sleep(settings.DATA_VERSION_TTL)
+            try:
+                version = (await asyncio.to_thread(data_version.current)).batch_id
+            except Exception as e:
+                logger.error(f"Error checking data version for subscribers: {e}")
+                continue
+            with self._lock:
+                changed = (
+                    self._watched_version is not None
+                    and version != self._watched_version
+                    and version not in self._published_versions
+                )
+                self._watched_version = version
+            if changed:
+                self._deliver({'type': 'resync', 'version': version, 'fullResync': True})
+
+
+# Process-wide broadcaster shared by the margin service and the SSE route
+margin_events = MarginEventBroadcaster()
@@ -0,0 +1,247 @@
+"""
+TimeCard Fingerprint Index for Gross Calculator
+
+TIMECARD is loaded with the append strategy, so re-uploading an
+overlapping month would count the same hours twice. This index remembers
+every loaded TimeCard row as two 64-bit hashes:
+- a key hash of (EMPLOYEE_ID, PROJECT_NAME, DAILY_DATE)
+- a content hash of the loaded values (TIME_WORKED, TIME_CARD_STATE, TASK_TYPE)
+
+Each month is one .npy file of shape (2, n), sorted by key hash and opened
+memory-mapped, so an upload is classified as new, duplicate or changed
+rows with one searchsorted per month it touches. A month without a file
+(loaded before the index existed, or invalidated after a failed write) is
+built from TIMECARD the first time it is touched.
+"""
+
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Generator, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import settings
+from app.db.oracle import get_db_connection
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Row status returned by TimecardFingerprintIndex.classify
+NEW, DUPLICATE, CHANGED = 0, 1, 2
+
+KEY_COLUMNS = ('EMPLOYEE_ID', 'PROJECT_NAME', 'DAILY_DATE')
+CONTENT_COLUMNS = ('TIME_WORKED', 'TIME_CARD_STATE', 'TASK_TYPE')
+
+
+def _days(df: pd.DataFrame) -> np.ndarray:
+    return pd.to_datetime(df['DAILY_DATE']).to_numpy(dtype='datetime64[D]')
+
+
+def fingerprints(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Month, key hash and content hash of each cleaned TimeCard row.
+
+    Values are normalized before hashing (dates to days, hours to float64
+    rounded to the 1 decimal TIMECARD.TIME_WORKED stores, text as plain
+    strings), so fingerprints of an upload and of the rows read back from
+    TIMECARD agree whatever dtypes either was read with.
+
+    Returns:
+        Tuple of (datetime64[M] months, key hashes, content hashes)
+    """
+    days = _days(df)
+    keys = pd.DataFrame({
+        'EMPLOYEE_ID': df['EMPLOYEE_ID'].astype(object),
+        'PROJECT_NAME': df['PROJECT_NAME'].astype(object),
+        'DAILY_DATE': days.astype(np.int64)
+    })
+    content = pd.DataFrame({
+        'TIME_WORKED': pd.to_numeric(df['TIME_WORKED']).astype('float64').round(1).to_numpy(),
+        **{
+            column: df[column].astype(object) if column in df.columns else None
+            for column in CONTENT_COLUMNS[1:]
+        }
+    })
+    return (
+        days.astype('datetime64[M]'),
+        pd.util.hash_pandas_object(keys, index=False).to_numpy(),
+        pd.util.hash_pandas_object(content, index=False).to_numpy()
+    )
+
+
+class TimecardFingerprintIndex:
+    """Per-month sorted (key hash, content hash) files of loaded TimeCard rows."""
+
+    # Rows of one month of TIMECARD as uploaded, for building a missing month file
+    MONTH_QUERY = """
+        SELECT EMPLOYEE_ID, PROJECT_NAME, DAILY_DATE, TIME_WORKED, TIME_CARD_STATE, TASK_TYPE
+        FROM TIMECARD_DETAIL_VIEW
+        WHERE DAILY_DATE >= :month_start AND DAILY_DATE < ADD_MONTHS(:month_start, 1)
+    """
+    FETCH_ROWS = 10000
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = Path(settings.TIMECARD_FINGERPRINT_DIR if directory is None else directory)
+        self._lock = threading.Lock()
+
+    def classify(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Compare cleaned TimeCard rows with the rows already loaded.
+
+        Args:
+            df: Cleaned TimeCard DataFrame
+
+        Returns:
+            int8 array per row: NEW, DUPLICATE (same key and values) or
+            CHANGED (same key, different values)
+
+        Raises:
+            Exception: If a missing month file cannot be built from TIMECARD;
+                rows are never reported NEW without being checked
+        """
+        status = np.full(len(df), NEW, dtype=np.int8)
+        if df.empty:
+            return status
+        months = _days(df).astype('datetime64[M]')
+        touched = np.unique(months[~np.isnat(months)])
+        self._ensure(touched)
+
+        _, keys, contents = fingerprints(df)
+        for month in touched:
+            index = self._load(month)
+            if index is None or not index.shape[1]:
+                continue
+            rows = np.flatnonzero(months == month)
+            positions = np.searchsorted(index[0], keys[rows])
+            positions[positions == index.shape[1]] = 0
+            found = index[0][positions] == keys[rows]
+            status[rows[found]] = CHANGED
+            status[rows[found & (index[1][positions] == contents[rows])]] = DUPLICATE
+        return status
+
+    def record(self, df: pd.DataFrame) -> bool:
+        """
+        Add loaded TimeCard rows to the index.
+
+        A key that is already indexed takes the new content hash. Month
+        files are rewritten atomically, so concurrent readers see either
+        the old or the new file. If the update fails, the touched months
+        are invalidated so they are rebuilt from TIMECARD on next use.
+
+        Args:
+            df: TimeCard rows that were committed to TIMECARD
+
+        Returns:
+            True if the index was updated, False if months were invalidated
+        """
+        if df.empty:
+            return True
+        months, keys, contents = fingerprints(df)
+        touched = np.unique(months[~np.isnat(months)])
+        try:
+            self._ensure(touched)
+            with self._lock, self._file_lock():
+                for month in touched:
+                    rows = months == month
+                    existing = self._load(month)
+                    month_keys = np.concatenate([existing[0], keys[rows]])
+                    month_contents = np.concatenate([existing[1], contents[rows]])
+                    del existing
+                    self._write(month, month_keys, month_contents)
+            return True
+        except Exception as e:
+            logger.error(f"Error updating TimeCard fingerprint index: {e}")
+            self.invalidate(touched)
+            return False
+
+    def invalidate(self, months: Iterable[np.datetime64]) -> None:
+        """Drop month files so they are rebuilt from TIMECARD on next use."""
+        for month in months:
+            try:
+                self._path(month).unlink(missing_ok=True)
+            except OSError as e:
+                logger.error(f"Could not invalidate TimeCard fingerprints for {month}: {e}")
+
+    def _ensure(self, months: Iterable[np.datetime64]) -> None:
+        """Build the files of months that have none from the rows stored in TIMECARD."""
+        missing = [month for month in months if not self._path(month).exists()]
+        if not missing:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._lock, self._file_lock():
+            for month in missing:
+                # Another worker may have built it while we waited for the lock
+                if self._path(month).exists():
+                    continue
+                keys, contents = [np.empty(0, dtype=np.uint64)], [np.empty(0, dtype=np.uint64)]
+                for rows in self._read_month(month):
+                    _, month_keys, month_contents = fingerprints(rows)
+                    keys.append(month_keys)
+                    contents.append(month_contents)
+                self._write(month, np.concatenate(keys), np.concatenate(contents))
+                logger.info(
+                    f"Built TimeCard fingerprints for {np.datetime_as_string(month, unit='M')} "
+                    f"from TIMECARD ({sum(map(len, keys))} rows)"
+                )
+
+    def _read_month(self, month: np.datetime64) -> Iterator[pd.DataFrame]:
+        """Stored TimeCard rows of one month, in batches of FETCH_ROWS."""
+        with get_db_connection() as connection:
+            cursor = connection.cursor()
+            cursor.arraysize = self.FETCH_ROWS
+            try:
+                cursor.execute(self.MONTH_QUERY, {'month_start': month.astype('datetime64[D]').item()})
+                columns = [column[0] for column in cursor.description]
+                while True:
+                    rows = cursor.fetchmany()
+                    if not rows:
+                        break
+                    yield pd.DataFrame.from_records(rows, columns=columns)
+            finally:
+                cursor.close()
+
+    def _write(self, month: np.datetime64, keys: np.ndarray, contents: np.ndarray) -> None:
+        """Atomically replace a month file; for repeated keys the last content wins."""
+        order = np.argsort(keys, kind='stable')
+        keys, contents = keys[order], contents[order]
+        last = np.r_[keys[1:] != keys[:-1], True] if len(keys) else np.empty(0, dtype=bool)
+
+        path = self._path(month)
+        temp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+        np.save(temp_path, np.vstack([keys[last], contents[last]]))
+        os.replace(temp_path, path)
+
+    def _path(self, month: np.datetime64) -> Path:
+        return self.directory / f"{np.datetime_as_string(month, unit='M')}.npy"
+
+    def _load(self, month: np.datetime64) -> Optional[np.ndarray]:
+        """Memory-mapped (2, n) index of one month, or None if nothing was loaded for it."""
+        path = self._path(month)
+        if not path.exists():
+            return None
+        return np.load(path, mmap_mode='r')
+
+    @contextmanager
+    def _file_lock(self) -> Generator[None, None, None]:
+        """Serialize index writers across worker processes."""
+        if fcntl is None:
+            yield
+            return
+        with open(self.directory / '.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+# Process-wide index shared by TimeCard cleaning and the loader
+timecard_fingerprints = TimecardFingerprintIndex()
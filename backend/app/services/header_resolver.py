@@ -0,0 +1,131 @@
+"""
+Header Resolver for Gross Calculator uploads
+
+HeaderResolver compiles DataCleaningService.header_synonyms once into:
+- a single hash index from normalized header -> (file type, column) pairs
+- a cache of fuzzy matches for headers not listed as synonyms
+- required-column sets used to detect which file an upload is
+
+Normalization casefolds and drops whitespace and punctuation, so
+"Employee ID", "EmpId", "EMP_ID" and "employee-id " all compare equal to
+their listed synonym.
+"""
+
+import difflib
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_NOT_ALNUM = re.compile(r'[^0-9a-z]+')
+
+
+def normalize_header(header: object) -> str:
+    """Casefold a header and strip everything but letters and digits."""
+    return _NOT_ALNUM.sub('', str(header).casefold())
+
+
+class HeaderResolver:
+    """Precompiled header synonym lookup shared by all uploads."""
+
+    # Unseen headers whose fuzzy match is remembered
+    FUZZY_CACHE_SIZE = 4096
+
+    def __init__(
+        self,
+        synonyms: Dict[str, Dict[str, List[str]]],
+        required_columns: Dict[str, List[str]],
+        min_similarity: float = 0.85
+    ):
+        """
+        Args:
+            synonyms: file_type -> canonical column -> accepted headers
+            required_columns: file_type -> columns a file of that type must have
+            min_similarity: Lowest difflib ratio accepted for fuzzy matches
+        """
+        self.min_similarity = min_similarity
+        self.required_columns = {file_type: set(columns) for file_type, columns in required_columns.items()}
+        self._index: Dict[str, Dict[str, str]] = {}
+        self._keys: Dict[str, List[str]] = {file_type: [] for file_type in synonyms}
+        for file_type, columns in synonyms.items():
+            for canonical, names in columns.items():
+                for name in [canonical] + list(names):
+                    key = normalize_header(name)
+                    if key and file_type not in self._index.setdefault(key, {}):
+                        self._index[key][file_type] = canonical
+                        self._keys[file_type].append(key)
+        self._fuzzy: Dict[Tuple[str, str], Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def file_types(self) -> List[str]:
+        return list(self._keys)
+
+    def resolve(self, header: object, file_type: str) -> Optional[str]:
+        """
+        Canonical column for one header, or None if it is not recognised.
+        
+        Unlisted headers fall back to the closest synonym (difflib ratio of
+        at least min_similarity); the outcome is cached per header.
+        """
+        key = normalize_header(header)
+        canonical = self._index.get(key, {}).get(file_type)
+        if canonical is not None or not key:
+            return canonical
+        
+        cache_key = (file_type, key)
+        if cache_key not in self._fuzzy:
+            match = difflib.get_close_matches(key, self._keys[file_type], n=1, cutoff=self.min_similarity)
+            with self._lock:
+                if len(self._fuzzy) >= self.FUZZY_CACHE_SIZE:
+                    self._fuzzy.clear()
+                self._fuzzy[cache_key] = self._index[match[0]][file_type] if match else None
+        return self._fuzzy.get(cache_key)
+
+    def map_headers(self, headers: Iterable[object], file_type: str) -> Dict[object, str]:
+        """
+        Map file headers to canonical columns.
+        
+        Each canonical column is taken at most once; exact synonym matches
+        win over fuzzy ones, then the leftmost header wins.
+        
+        Returns:
+            Dict of file header -> canonical column for recognised headers
+        """
+        headers = list(headers)
+        exact = {
+            header: self._index.get(normalize_header(header), {}).get(file_type)
+            for header in headers
+        }
+        mapping: Dict[object, str] = {}
+        taken = set()
+        for fuzzy in (False, True):
+            for header in headers:
+                if header in mapping:
+                    continue
+                canonical = self.resolve(header, file_type) if fuzzy else exact[header]
+                if canonical is not None and canonical not in taken:
+                    mapping[header] = canonical
+                    taken.add(canonical)
+        return {header: mapping[header] for header in headers if header in mapping}
+
+    def detect_file_type(self, headers: Iterable[object]) -> Optional[str]:
+        """
+        Guess whether a header row belongs to a timecard, employee or project file.
+        
+        A file type qualifies when all of its required columns resolve;
+        among those, the one recognising the most headers wins.
+        
+        Returns:
+            File type, or None if no type's required columns are all present
+        """
+        headers = list(headers)
+        best: Optional[Tuple[int, int, str]] = None
+        for file_type in self._keys:
+            mapped = set(self.map_headers(headers, file_type).values())
+            if not self.required_columns.get(file_type, set()) <= mapped:
+                continue
+            # Prefer more recognised headers, then the more specific type
+            score = (len(mapped), len(self.required_columns.get(file_type, ())), file_type)
+            if best is None or score[:2] > best[:2]:
+                best = score
+        return best[2] if best else None
@@ -0,0 +1,257 @@
+"""
+Validation Issue Store for Gross Calculator uploads
+
+IssueStore aggregates validation failures per (column, error) instead of
+keeping one ValidationIssue per bad row:
+- a running count
+- the first UPLOAD_ISSUE_SAMPLES failing rows with their values
+- every failing row as compressed [first, last] row-number ranges
+
+A file with a million bad dates costs a few ranges rather than a million
+models, and the report built from it stays small. The full list can still
+be paged through (see UploadIssueRegistry and GET /upload/{id}/issues).
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import settings
+from app.models.upload import IssueSummary, ValidationIssue
+
+
+def _format_value(value: object) -> Optional[str]:
+    if value is None or (not isinstance(value, (list, tuple)) and pd.isna(value)):
+        return None
+    if isinstance(value, pd.Timestamp) and value == value.normalize():
+        return str(value.date())
+    return str(value)
+
+
+def _compress(rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorted unique row numbers -> (range starts, range ends), inclusive."""
+    breaks = np.flatnonzero(np.diff(rows) != 1) + 1
+    return rows[np.r_[0, breaks]], rows[np.r_[breaks - 1, len(rows) - 1]]
+
+
+class _RuleIssues:
+    """Failures recorded for one (column, error) pair."""
+
+    __slots__ = ('count', 'samples', 'starts', 'ends', '_sorted')
+
+    def __init__(self):
+        self.count = 0
+        self.samples: List[ValidationIssue] = []
+        self.starts: List[np.ndarray] = []
+        self.ends: List[np.ndarray] = []
+        self._sorted = True
+
+    def add_ranges(self, starts: np.ndarray, ends: np.ndarray) -> None:
+        if self.ends and starts[0] <= self.ends[-1][-1] + 1:
+            if starts[0] <= self.ends[-1][-1]:
+                self._sorted = False
+            elif self._sorted:
+                # Continues the previous range
+                self.ends[-1] = self.ends[-1].copy()
+                self.ends[-1][-1] = ends[0]
+                starts, ends = starts[1:], ends[1:]
+        if len(starts):
+            self.starts.append(starts)
+            self.ends.append(ends)
+
+    def ranges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """All failing rows as merged (starts, ends) arrays."""
+        if not self.starts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        starts = np.concatenate(self.starts)
+        ends = np.concatenate(self.ends)
+        if not self._sorted:
+            rows = np.unique(np.concatenate([
+                np.arange(start, end + 1) for start, end in zip(starts.tolist(), ends.tolist())
+            ]))
+            starts, ends = _compress(rows)
+            self.starts, self.ends, self._sorted = [starts], [ends], True
+        return starts, ends
+
+
+class IssueStore:
+    """Aggregated validation issues and row counts for one uploaded file."""
+
+    def __init__(self, file_type: str = '', filename: str = '', sample_size: Optional[int] = None):
+        self.file_type = file_type
+        self.filename = filename
+        self.sample_size = settings.UPLOAD_ISSUE_SAMPLES if sample_size is None else sample_size
+        self.total_rows = 0
+        self.valid_rows = 0
+        self._rules: Dict[Tuple[str, str], _RuleIssues] = {}
+
+    @property
+    def count(self) -> int:
+        """Total issues recorded (a row failing two rules counts twice)."""
+        return sum(rule.count for rule in self._rules.values())
+
+    @property
+    def invalid_rows(self) -> int:
+        return self.total_rows - self.valid_rows
+
+    def add(
+        self,
+        column: str,
+        error: str,
+        rows: Iterable[int],
+        values: Optional[Iterable[object]] = None
+    ) -> None:
+        """
+        Record one rule failing on a set of rows.
+        
+        Args:
+            column: Column the rule applies to
+            error: Error message (rules are grouped by column and message)
+            rows: Spreadsheet row numbers that failed
+            values: Failing values in the same order as rows; only the first
+                few are read, for samples
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if not len(rows):
+            return
+        rule = self._rules.setdefault((column, error), _RuleIssues())
+        rule.count += len(rows)
+        
+        wanted = self.sample_size - len(rule.samples)
+        if wanted > 0:
+            if values is None:
+                sample_values = [None] * min(wanted, len(rows))
+            elif isinstance(values, pd.Series):
+                sample = values.iloc[:wanted]
+                # float32 scalars print at their own precision (999.9, not 999.9000244140625)
+                sample_values = list(sample.to_numpy()) if sample.dtype == np.float32 else sample.tolist()
+            else:
+                sample_values = list(values)[:wanted]
+            rule.samples.extend(
+                ValidationIssue(row=int(row), column=column, value=_format_value(value), error=error)
+                for row, value in zip(rows[:wanted].tolist(), sample_values)
+            )
+        
+        rule.add_ranges(*_compress(np.unique(rows)))
+
+    def add_issue(self, issue: ValidationIssue) -> None:
+        """Record a single ValidationIssue (file-level problems, header errors)."""
+        self.add(issue.column, issue.error, [issue.row], [issue.value])
+
+    def merge(self, other: 'IssueStore') -> None:
+        """Fold another store's issues and row counts into this one."""
+        self.total_rows += other.total_rows
+        self.valid_rows += other.valid_rows
+        for (column, error), theirs in other._rules.items():
+            rule = self._rules.setdefault((column, error), _RuleIssues())
+            rule.count += theirs.count
+            rule.samples.extend(theirs.samples[:max(self.sample_size - len(rule.samples), 0)])
+            starts, ends = theirs.ranges()
+            if len(starts):
+                rule.add_ranges(starts, ends)
+
+    def samples(self) -> List[ValidationIssue]:
+        """Sampled issues of every rule, in the order rules first failed."""
+        return [issue for rule in self._rules.values() for issue in rule.samples]
+
+    def summary(self, max_ranges: Optional[int] = None) -> List[IssueSummary]:
+        """
+        Per-rule counts, samples and row ranges for the validation report.
+        
+        Args:
+            max_ranges: Ranges included per rule (default UPLOAD_ISSUE_RANGES)
+        """
+        max_ranges = settings.UPLOAD_ISSUE_RANGES if max_ranges is None else max_ranges
+        summaries = []
+        for (column, error), rule in self._rules.items():
+            starts, ends = rule.ranges()
+            summaries.append(IssueSummary(
+                column=column,
+                error=error,
+                count=rule.count,
+                samples=rule.samples,
+                row_ranges=np.column_stack([starts[:max_ranges], ends[:max_ranges]]).tolist(),
+                ranges_truncated=len(starts) > max_ranges
+            ))
+        return summaries
+
+    def page(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        column: Optional[str] = None,
+        error: Optional[str] = None
+    ) -> Tuple[int, List[ValidationIssue]]:
+        """
+        One page of the expanded issue list, rule by rule and row by row.
+        
+        Rows are expanded from the stored ranges only for the requested
+        page; values are filled in where the row was sampled.
+        
+        Returns:
+            Tuple of (total matching issues, issues on the page)
+        """
+        selected = [
+            (key, rule) for key, rule in self._rules.items()
+            if (column is None or key[0] == column) and (error is None or key[1] == error)
+        ]
+        total = 0
+        page: List[ValidationIssue] = []
+        for (rule_column, rule_error), rule in selected:
+            starts, ends = rule.ranges()
+            sizes = ends - starts + 1
+            rows_in_rule = int(sizes.sum())
+            skip = offset - total
+            total += rows_in_rule
+            if len(page) >= limit or skip >= rows_in_rule:
+                continue
+            sampled = {issue.row: issue.value for issue in rule.samples}
+            for row in self._expand(starts, ends, sizes, max(skip, 0)):
+                page.append(ValidationIssue(
+                    row=row, column=rule_column, value=sampled.get(row), error=rule_error
+                ))
+                if len(page) >= limit:
+                    break
+        return total, page
+
+    @staticmethod
+    def _expand(starts: np.ndarray, ends: np.ndarray, sizes: np.ndarray, skip: int) -> Iterator[int]:
+        """Row numbers from the ranges, starting after the first skip rows."""
+        first = int(np.searchsorted(np.cumsum(sizes), skip, side='right'))
+        skip -= int(sizes[:first].sum())
+        for start, end in zip(starts[first:].tolist(), ends[first:].tolist()):
+            yield from range(start + skip, end + 1)
+            skip = 0
+
+
+class UploadIssueRegistry:
+    """Recent uploads' issue stores, kept for paging through the full issue list."""
+
+    def __init__(self):
+        self._uploads: 'OrderedDict[str, Dict[str, IssueStore]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, stores: Dict[str, IssueStore]) -> str:
+        """
+        Keep an upload's stores (by file type) and return its upload_id.
+        
+        Only the last UPLOAD_ISSUE_RETENTION uploads are kept.
+        """
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self._uploads[upload_id] = stores
+            while len(self._uploads) > settings.UPLOAD_ISSUE_RETENTION:
+                self._uploads.popitem(last=False)
+        return upload_id
+
+    def get(self, upload_id: str, file_type: str) -> Optional[IssueStore]:
+        with self._lock:
+            return self._uploads.get(upload_id, {}).get(file_type)
+
+
+# Process-wide registry shared by the cleaning service and the upload routes
+upload_issues = UploadIssueRegistry()
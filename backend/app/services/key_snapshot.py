@@ -0,0 +1,159 @@
+"""
+Reference Key Snapshot for Gross Calculator
+
+Most uploads contain only TimeCards, whose EMPLOYEE_ID and PROJECT_NAME
+must already exist in Oracle. This module keeps the stored keys in memory
+so upload validation is a vectorized semi-join instead of per-row lookups:
+- EMPLOYEE.EMPLOYEE_ID and PROJECT.PROJECT_NAME are read once in bulk
+- each key is kept as a 64-bit hash in a sorted numpy array
+- ingest batches merge their keys in place; batches loaded by other
+  workers are picked up when the data version changes
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.db.oracle import get_db_connection
+from app.services.version_service import data_version
+
+logger = logging.getLogger(__name__)
+
+
+def _hash(values) -> np.ndarray:
+    """64-bit hashes of key values compared as strings."""
+    return pd.util.hash_array(np.asarray(values, dtype=object).astype(str))
+
+
+def hash_keys(values: Iterable) -> np.ndarray:
+    """Hashes of key values (None/NaN excluded), as a sorted unique array."""
+    return np.unique(_hash(pd.Series(list(values), dtype=object).dropna().unique()))
+
+
+class ReferenceKeySnapshot:
+    """Hashed EMPLOYEE_ID and PROJECT_NAME keys already stored in Oracle."""
+
+    # Column -> query returning every stored key in that column
+    QUERIES = {
+        'EMPLOYEE_ID': "SELECT EMPLOYEE_ID FROM EMPLOYEE",
+        'PROJECT_NAME': "SELECT PROJECT_NAME FROM PROJECT"
+    }
+    FETCH_ROWS = 10000
+
+    def __init__(self):
+        self.version: Optional[str] = None
+        self._lock = threading.Lock()
+        self._keys: Optional[Dict[str, np.ndarray]] = None
+
+    def keys(self) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Current key hashes per column, loading or reloading them if needed.
+
+        The snapshot is reloaded when the data version has moved past the
+        one it was read at (e.g. a batch loaded by another worker).
+
+        Returns:
+            Dict of column -> sorted key hashes, or None if Oracle could
+            not be read and no earlier snapshot exists
+        """
+        version = data_version.current().batch_id
+        if self._keys is None or version != self.version:
+            self.refresh(version)
+        return self._keys
+
+    def refresh(self, version: Optional[str] = None) -> bool:
+        """
+        Bulk-load every stored key from Oracle.
+
+        Readers keep using the previous snapshot until the new one is
+        swapped in; on errors the previous snapshot is kept.
+
+        Args:
+            version: Data version the keys are read at
+
+        Returns:
+            True if the snapshot was reloaded
+        """
+        try:
+            keys = {}
+            with get_db_connection() as connection:
+                cursor = connection.cursor()
+                cursor.arraysize = self.FETCH_ROWS
+                try:
+                    for column, query in self.QUERIES.items():
+                        cursor.execute(query)
+                        keys[column] = hash_keys(row[0] for row in cursor.fetchall())
+                finally:
+                    cursor.close()
+        except Exception as e:
+            logger.error(f"Error loading reference key snapshot: {e}")
+            return False
+
+        with self._lock:
+            self._keys = keys
+            self.version = version
+        logger.info(
+            f"Reference key snapshot loaded ({len(keys['EMPLOYEE_ID'])} employees, "
+            f"{len(keys['PROJECT_NAME'])} projects)"
+        )
+        return True
+
+    def add(self, dataframes: Dict[str, pd.DataFrame], version: Optional[str] = None) -> None:
+        """
+        Merge the keys of a loaded batch into the snapshot without re-reading Oracle.
+
+        Args:
+            dataframes: Loaded DataFrames by file type (employee, project)
+            version: Batch ID the snapshot now reflects
+        """
+        with self._lock:
+            if self._keys is None:
+                return
+            keys = dict(self._keys)
+            for file_type, column in (('employee', 'EMPLOYEE_ID'), ('project', 'PROJECT_NAME')):
+                df = dataframes.get(file_type)
+                if df is not None and column in df.columns:
+                    keys[column] = np.union1d(keys[column], hash_keys(df[column]))
+            self._keys = keys
+            self.version = version
+
+    def invalidate(self) -> None:
+        """Force a reload on next use (e.g. after a partially failed batch)."""
+        with self._lock:
+            self._keys = None
+            self.version = None
+
+    @staticmethod
+    def missing(values: pd.Series, *known: np.ndarray) -> np.ndarray:
+        """
+        Semi-join values against sets of known key hashes.
+
+        Values are factorized first, so each distinct key is hashed and
+        looked up once however many rows repeat it.
+
+        Args:
+            values: Key column to check (missing values never fail)
+            known: Sorted key hash arrays, e.g. the snapshot and the keys
+                of a file uploaded alongside
+
+        Returns:
+            Boolean mask of rows whose key is in none of the known sets
+        """
+        codes, uniques = pd.factorize(values)
+        if not len(uniques):
+            return np.zeros(len(values), dtype=bool)
+        hashes = _hash(uniques)
+        found = np.zeros(len(uniques), dtype=bool)
+        for keys in known:
+            if len(keys):
+                positions = np.searchsorted(keys, hashes)
+                positions[positions == len(keys)] = 0
+                found |= keys[positions] == hashes
+        return (codes >= 0) & ~found[np.maximum(codes, 0)]
+
+
+# Process-wide snapshot shared by upload validation and the loader
+reference_keys = ReferenceKeySnapshot()
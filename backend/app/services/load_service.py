@@ -11,13 +11,21 @@ This service handles database insertion and bulk loading of cleaned data with:
 
 import pandas as pd
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Dict, Generator, List, Optional, Tuple
 from datetime import datetime
 import uuid
 from contextlib import contextmanager
 
+from app.core.config import settings
 from app.db.oracle import get_db_connection, execute_query
 from app.models.upload import ValidationReport
+from app.services.cube_service import CostCubeService
+from app.services.event_service import margin_events
+from app.services.fingerprint_index import DUPLICATE, timecard_fingerprints
+from app.services.key_snapshot import reference_keys
+from app.services.margin_service import MarginCalculationService
+from app.services.version_service import data_version
+from app.services.scheduler_service import refresh_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +42,11 @@ class DataLoadService:
             'timecard': {
                 'table_name': 'TIMECARD',
                 'strategy': 'append',  # Always append new records
-                'key_columns': ['EMPLOYEE_ID', 'DAILY_DATE', 'PROJECT_NAME'],
+                'key_columns': ['EMPLOYEE_KEY', 'DAILY_DATE', 'PROJECT_ID'],
+                'insert_columns': [
+                    'EMPLOYEE_KEY', 'PROJECT_ID', 'DAILY_DATE',
+                    'TIME_WORKED', 'TIME_CARD_STATE_ID', 'TASK_TYPE_ID'
+                ],
                 'upsert_columns': None
             },
             'employee': {
@@ -50,6 +62,16 @@ class DataLoadService:
                 'upsert_columns': ['SOW', 'PROJECT_ID']
             }
         }
+        
+        # Low-cardinality TimeCard text columns stored as codes: column -> lookup table
+        self.timecard_lookups = {
+            'TIME_CARD_STATE': 'TIME_CARD_STATE_LOOKUP',
+            'TASK_TYPE': 'TASK_TYPE_LOOKUP'
+        }
+        
+        # Dashboard rollups and statistics maintained on ingest
+        self.cube_service = CostCubeService()
+        self.margin_service = MarginCalculationService()
 
     def generate_batch_id(self) -> str:
         """
@@ -72,33 +94,32 @@ class DataLoadService:
         return str(uuid.uuid4())
 
     @contextmanager
-    def transaction_context(self):
+    def transaction_context(self) -> Generator[Any, None, None]:
         """
         Database transaction context manager.
         
-        TODO: Implement transaction management
-        - Begin transaction
-        - Handle commit/rollback
-        - Log transaction status
-        - Ensure proper cleanup
-        """
-        # TODO: Implement transaction context
-        # - Begin transaction
-        # - Yield connection
-        # - Commit on success
-        # - Rollback on error
-        # - Log transaction details
+        Yields a pooled connection. The transaction is committed when the
+        block completes and rolled back if it raises; work the block
+        committed itself (e.g. direct-path chunks) stays committed.
         
-        try:
-            # TODO: Begin transaction
-            yield None
-            # TODO: Commit transaction
-        except Exception as e:
-            # TODO: Rollback transaction
-            logger.error(f"Transaction failed, rolling back: {e}")
-            raise
+        Yields:
+            Oracle connection to run the transaction's statements on
+        """
+        with get_db_connection() as connection:
+            try:
+                yield connection
+                connection.commit()
+            except Exception as e:
+                connection.rollback()
+                logger.error(f"Transaction failed, rolling back: {e}")
+                raise
 
-    def prepare_insert_statement(self, table_name: str, columns: List[str]) -> str:
+    def prepare_insert_statement(
+        self,
+        table_name: str,
+        columns: List[str],
+        hint: Optional[str] = None
+    ) -> str:
         """
         Prepare parameterized INSERT statement.
         
@@ -111,6 +132,7 @@ class DataLoadService:
         Args:
             table_name: Target table name
             columns: List of column names
+            hint: Optional optimizer hint, e.g. 'APPEND_VALUES'
             
         Returns:
             Parameterized INSERT SQL statement
@@ -124,7 +146,9 @@ class DataLoadService:
         placeholders = ', '.join([f':{col}' for col in columns])
         column_list = ', '.join(columns)
         
-        return f"INSERT INTO {table_name} ({column_list}) VALUES ({placeholders})"
+        hint_clause = f"/*+ {hint} */ " if hint else ''
+        
+        return f"INSERT {hint_clause}INTO {table_name} ({column_list}) VALUES ({placeholders})"
 
     def prepare_upsert_statement(
         self, 
@@ -215,6 +239,12 @@ class DataLoadService:
         """
         Load TimeCard data using append strategy.
         
+        Rows flagged in REPLACES_LOADED (their key was loaded by an earlier
+        batch with different values) replace the row that batch loaded;
+        all other rows are appended. The delete runs in the same
+        transaction as the insert, so a failed chunk leaves the loaded
+        row in place.
+        
         TODO: Implement TimeCard loading
         - Use append strategy (always insert new)
         - Process in chunks for performance
@@ -232,19 +262,67 @@ class DataLoadService:
         error_messages = []
         
         try:
-            # TODO: Implement TimeCard loading logic
-            # - Prepare INSERT statement
-            # - Process DataFrame in chunks
-            # - Execute inserts with bind variables
-            # - Track row counts
-            # - Handle errors gracefully
-            # - Log progress
-            
-            # Placeholder implementation
             if not df.empty:
-                # TODO: Actual loading logic
-                rows_inserted = len(df)
-                logger.info(f"Loaded {rows_inserted} TimeCard records for batch {batch_id}")
+                # DAILY_DATE is the partition key and cannot be NULL
+                undated = df['DAILY_DATE'].isna()
+                if undated.any():
+                    error_messages.append(f"Skipped {int(undated.sum())} TimeCard rows without DAILY_DATE")
+                    df = df[~undated]
+                
+                keyed, key_errors = self.resolve_timecard_keys(df)
+                error_messages.extend(key_errors)
+                keyed = self.encode_timecard_lookups(keyed)
+                config = self.table_configs['timecard']
+                columns = config['insert_columns']
+                
+                # Direct-path inserts write compressed blocks above the high-water
+                # mark. A transaction may issue only one direct-path insert per
+                # table, so each chunk (its replaced-row deletes and its insert)
+                # is committed on its own; memory stays bounded by the chunk
+                # size rather than the file size.
+                direct_path = settings.TIMECARD_DIRECT_PATH_LOAD
+                insert_sql = self.prepare_insert_statement(
+                    config['table_name'], columns,
+                    hint='APPEND_VALUES' if direct_path else None
+                )
+                
+                if 'REPLACES_LOADED' not in keyed.columns:
+                    keyed = keyed.assign(REPLACES_LOADED=False)
+                
+                committed, pending = [], []
+                replaced = 0
+                try:
+                    with self.transaction_context() as connection:
+                        cursor = connection.cursor()
+                        try:
+                            for chunk in self.chunk_dataframe(keyed, self.chunk_size):
+                                replacing = chunk['REPLACES_LOADED'].astype(bool)
+                                if replacing.any():
+                                    replaced += self.delete_replaced_timecards(cursor, chunk[replacing])
+                                values = chunk[columns].astype(object).where(chunk[columns].notna(), None)
+                                cursor.executemany(insert_sql, values.to_dict('records'))
+                                pending.append(chunk.index)
+                                if direct_path:
+                                    connection.commit()
+                                    committed.extend(pending)
+                                    pending = []
+                        finally:
+                            cursor.close()
+                    committed.extend(pending)
+                finally:
+                    rows_inserted = sum(len(index) for index in committed)
+                    if committed:
+                        logger.info(
+                            f"Loaded {rows_inserted} TimeCard records for batch {batch_id}"
+                            + (f" ({replaced} previously loaded records replaced)" if replaced else '')
+                        )
+                        # Remember the committed rows so re-uploads are detected,
+                        # including the chunks committed before a failure
+                        if not timecard_fingerprints.record(df.loc[committed[0].append(committed[1:])]):
+                            error_messages.append(
+                                "TimeCard fingerprint index not updated; the months of this "
+                                "batch will be re-indexed from TIMECARD on next use"
+                            )
             
         except Exception as e:
             error_msg = f"Error loading TimeCard data: {str(e)}"
@@ -253,6 +331,153 @@ class DataLoadService:
         
         return rows_inserted, error_messages
 
+    def delete_replaced_timecards(self, cursor: Any, df: pd.DataFrame) -> int:
+        """
+        Delete the TIMECARD rows that re-uploaded rows replace.
+        
+        Only the row an earlier batch loaded for each key is deleted: the
+        stored rows for the keys are read back and matched against the
+        fingerprint index, so other rows for the same employee, project
+        and day are kept. Runs on the caller's cursor, inside its
+        transaction.
+        
+        Args:
+            cursor: Cursor of the loading transaction
+            df: Keyed TimeCard rows (EMPLOYEE_KEY, PROJECT_ID, DAILY_DATE)
+            
+        Returns:
+            Number of rows deleted
+        """
+        binds = {}
+        tuples = []
+        for position, (employee_key, project_id, daily_date) in enumerate(
+            df[['EMPLOYEE_KEY', 'PROJECT_ID', 'DAILY_DATE']].itertuples(index=False)
+        ):
+            binds.update({
+                f"k{position}": int(employee_key),
+                f"p{position}": int(project_id),
+                f"d{position}": pd.Timestamp(daily_date).to_pydatetime()
+            })
+            tuples.append(f"(:k{position}, :p{position}, :d{position})")
+        
+        cursor.execute(
+            f"""
+            SELECT t.ROWID AS ROW_ID, e.EMPLOYEE_ID, p.PROJECT_NAME, t.DAILY_DATE,
+                   t.TIME_WORKED, s.TIME_CARD_STATE, tt.TASK_TYPE
+            FROM TIMECARD t
+            JOIN EMPLOYEE e ON e.EMPLOYEE_KEY = t.EMPLOYEE_KEY
+            JOIN PROJECT p ON p.PROJECT_ID = t.PROJECT_ID
+            LEFT JOIN TIME_CARD_STATE_LOOKUP s ON s.TIME_CARD_STATE_ID = t.TIME_CARD_STATE_ID
+            LEFT JOIN TASK_TYPE_LOOKUP tt ON tt.TASK_TYPE_ID = t.TASK_TYPE_ID
+            WHERE (t.EMPLOYEE_KEY, t.PROJECT_ID, t.DAILY_DATE) IN ({', '.join(tuples)})
+            """,
+            binds
+        )
+        stored = pd.DataFrame.from_records(
+            cursor.fetchall(), columns=[column[0] for column in cursor.description]
+        )
+        if stored.empty:
+            return 0
+        
+        loaded = stored.loc[timecard_fingerprints.classify(stored) == DUPLICATE, 'ROW_ID']
+        if len(loaded):
+            cursor.executemany(
+                "DELETE FROM TIMECARD WHERE ROWID = :row_id",
+                [{'row_id': row_id} for row_id in loaded]
+            )
+        return len(loaded)
+
+    def resolve_timecard_keys(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
+        """
+        Replace employee IDs and project names with their integer keys.
+        
+        TIMECARD stores EMPLOYEE_KEY and PROJECT_ID only. Both lookups are
+        read once per batch and applied with vectorized maps, so no
+        per-row queries are issued. Rows whose employee or project is
+        unknown are dropped and reported.
+        
+        Args:
+            df: Cleaned TimeCard DataFrame with EMPLOYEE_ID and PROJECT_NAME
+            
+        Returns:
+            Tuple of (DataFrame with EMPLOYEE_KEY and PROJECT_ID, error_messages)
+        """
+        employee_keys = {
+            row['EMPLOYEE_ID']: row['EMPLOYEE_KEY']
+            for row in execute_query("SELECT EMPLOYEE_ID, EMPLOYEE_KEY FROM EMPLOYEE")
+        }
+        project_ids = {
+            row['PROJECT_NAME']: row['PROJECT_ID']
+            for row in execute_query("SELECT PROJECT_NAME, PROJECT_ID FROM PROJECT")
+        }
+        
+        keyed = df.copy()
+        keyed['EMPLOYEE_KEY'] = keyed['EMPLOYEE_ID'].map(employee_keys)
+        keyed['PROJECT_ID'] = keyed['PROJECT_NAME'].map(project_ids)
+        
+        error_messages = []
+        unknown_employees = keyed.loc[keyed['EMPLOYEE_KEY'].isna(), 'EMPLOYEE_ID'].dropna().unique()
+        if len(unknown_employees):
+            error_messages.append(
+                f"Skipped TimeCard rows for {len(unknown_employees)} unknown employee(s): "
+                f"{', '.join(map(str, sorted(unknown_employees)[:10]))}"
+            )
+        unknown_projects = keyed.loc[keyed['PROJECT_ID'].isna(), 'PROJECT_NAME'].dropna().unique()
+        if len(unknown_projects):
+            error_messages.append(
+                f"Skipped TimeCard rows for {len(unknown_projects)} unknown project(s): "
+                f"{', '.join(map(str, sorted(unknown_projects)[:10]))}"
+            )
+        
+        keyed = keyed.dropna(subset=['EMPLOYEE_KEY', 'PROJECT_ID'])
+        keyed['EMPLOYEE_KEY'] = keyed['EMPLOYEE_KEY'].astype('int64')
+        keyed['PROJECT_ID'] = keyed['PROJECT_ID'].astype('int64')
+        return keyed, error_messages
+
+    def encode_timecard_lookups(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replace TIME_CARD_STATE and TASK_TYPE text with lookup codes.
+        
+        Values not yet present in a lookup table are added first, then the
+        full code dictionary is read once and applied with a vectorized map.
+        NULL text stays a NULL code.
+        
+        Args:
+            df: TimeCard DataFrame with TIME_CARD_STATE and TASK_TYPE
+            
+        Returns:
+            DataFrame with TIME_CARD_STATE_ID and TASK_TYPE_ID added
+        """
+        encoded = df.copy()
+        for column, lookup_table in self.timecard_lookups.items():
+            code_column = f"{column}_ID"
+            if column not in encoded.columns:
+                encoded[code_column] = pd.Series(pd.NA, index=encoded.index, dtype='Int64')
+                continue
+            
+            values = sorted(encoded[column].dropna().astype(str).unique())
+            if values:
+                with self.transaction_context() as connection:
+                    cursor = connection.cursor()
+                    try:
+                        cursor.executemany(
+                            f"MERGE INTO {lookup_table} target "
+                            f"USING (SELECT :value AS {column} FROM dual) source "
+                            f"ON (target.{column} = source.{column}) "
+                            f"WHEN NOT MATCHED THEN INSERT ({column}) VALUES (source.{column})",
+                            [{'value': value} for value in values]
+                        )
+                    finally:
+                        cursor.close()
+            
+            codes = {
+                row[column]: row[code_column]
+                for row in execute_query(f"SELECT {code_column}, {column} FROM {lookup_table}")
+            }
+            encoded[code_column] = encoded[column].map(codes).astype('Int64')
+        
+        return encoded
+
     def load_employee_data(
         self, 
         df: pd.DataFrame, 
@@ -379,6 +604,7 @@ class DataLoadService:
             'errors': [],
             'total_rows_processed': 0
         }
+        margin_event = None
         
         try:
             # TODO: Implement complete loading workflow
@@ -390,48 +616,62 @@ class DataLoadService:
             # - Manage transactions
             # - Track progress and statistics
             
-            with self.transaction_context():
-                # Load Employee data
-                if 'employee' in cleaned_dataframes:
-                    rows, errors = self.load_employee_data(
-                        cleaned_dataframes['employee'], 
-                        batch_id
-                    )
-                    results['results']['employee'] = {
-                        'rows_processed': rows,
-                        'errors': errors
-                    }
-                    results['total_rows_processed'] += rows
-                    results['errors'].extend(errors)
-                
-                # Load Project data
-                if 'project' in cleaned_dataframes:
-                    rows, errors = self.load_project_data(
-                        cleaned_dataframes['project'], 
-                        batch_id
-                    )
-                    results['results']['project'] = {
-                        'rows_processed': rows,
-                        'errors': errors
-                    }
-                    results['total_rows_processed'] += rows
-                    results['errors'].extend(errors)
-                
-                # Load TimeCard data (depends on Employee and Project)
-                if 'timecard' in cleaned_dataframes:
-                    rows, errors = self.load_timecard_data(
-                        cleaned_dataframes['timecard'], 
-                        batch_id
-                    )
-                    results['results']['timecard'] = {
-                        'rows_processed': rows,
-                        'errors': errors
-                    }
-                    results['total_rows_processed'] += rows
-                    results['errors'].extend(errors)
-                
-                # Set final status
-                results['status'] = 'completed' if not results['errors'] else 'completed_with_errors'
+            # Each load is its own transaction: TimeCard keys are resolved
+            # against the committed Employee and Project rows
+            
+            # Load Employee data
+            if 'employee' in cleaned_dataframes:
+                rows, errors = self.load_employee_data(
+                    cleaned_dataframes['employee'], 
+                    batch_id
+                )
+                results['results']['employee'] = {
+                    'rows_processed': rows,
+                    'errors': errors
+                }
+                results['total_rows_processed'] += rows
+                results['errors'].extend(errors)
+            
+            # Load Project data
+            if 'project' in cleaned_dataframes:
+                rows, errors = self.load_project_data(
+                    cleaned_dataframes['project'], 
+                    batch_id
+                )
+                results['results']['project'] = {
+                    'rows_processed': rows,
+                    'errors': errors
+                }
+                results['total_rows_processed'] += rows
+                results['errors'].extend(errors)
+            
+            # Load TimeCard data (depends on Employee and Project)
+            if 'timecard' in cleaned_dataframes:
+                rows, errors = self.load_timecard_data(
+                    cleaned_dataframes['timecard'], 
+                    batch_id
+                )
+                results['results']['timecard'] = {
+                    'rows_processed': rows,
+                    'errors': errors
+                }
+                results['total_rows_processed'] += rows
+                results['errors'].extend(errors)
+            
+            # Set final status
+            results['status'] = 'completed' if not results['errors'] else 'completed_with_errors'
+        
+            # Maintain dashboard rollups and statistics for the committed batch
+            affected_projects = self.collect_affected_projects(cleaned_dataframes)
+            results['affected_projects'] = affected_projects
+            self.refresh_rollups(cleaned_dataframes, batch_id, results)
+            margin_event = self.margin_service.on_batch_loaded(batch_id, affected_projects)
+            
+            # Keep upload validation's view of stored keys current
+            if results['status'] == 'completed':
+                reference_keys.add(cleaned_dataframes, batch_id)
+            else:
+                reference_keys.invalidate()
                 
         except Exception as e:
             results['status'] = 'failed'
@@ -442,9 +682,132 @@ class DataLoadService:
             results['end_time'] = datetime.now()
             if results['start_time'] and results['end_time']:
                 results['duration'] = (results['end_time'] - results['start_time']).total_seconds()
+            recorded = self.record_batch(results)
+        
+        if results['status'] != 'failed':
+            # Push margin deltas only once their version is committed
+            if recorded and margin_event is not None:
+                margin_events.publish(margin_event)
+            # Warm the serving caches for the new data version right away,
+            # then validate the stored margins in the background
+            refresh_scheduler.trigger(validate=True)
         
         return results
 
+    def record_batch(self, results: Dict[str, Any]) -> bool:
+        """
+        Record a finished batch in LOAD_BATCH and publish the new data version.
+        
+        The latest completed batch is the data version behind API ETags, so
+        the local tracker is bumped immediately; other workers pick the new
+        version up within DATA_VERSION_TTL. The projects the batch touched
+        are written to LOAD_BATCH_PROJECT for delta sync.
+        
+        Args:
+            results: Loading results from load_all_data
+            
+        Returns:
+            True if the batch was recorded
+        """
+        affected_projects = results.get('affected_projects', [])
+        try:
+            with self.transaction_context() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(
+                        """
+                        INSERT INTO LOAD_BATCH (
+                            BATCH_ID, STATUS, ROWS_PROCESSED, ALL_PROJECTS, STARTED_AT, COMPLETED_AT
+                        )
+                        VALUES (
+                            :batch_id, :status, :rows_processed, :all_projects, :started_at, :completed_at
+                        )
+                        """,
+                        {
+                            'batch_id': results['batch_id'],
+                            'status': results['status'],
+                            'rows_processed': results['total_rows_processed'],
+                            'all_projects': 'Y' if affected_projects is None else 'N',
+                            'started_at': results['start_time'],
+                            'completed_at': results['end_time']
+                        }
+                    )
+                    if affected_projects:
+                        cursor.executemany(
+                            "INSERT INTO LOAD_BATCH_PROJECT (BATCH_ID, PROJECT_NAME) "
+                            "VALUES (:batch_id, :project_name)",
+                            [
+                                {'batch_id': results['batch_id'], 'project_name': name}
+                                for name in affected_projects
+                            ]
+                        )
+                finally:
+                    cursor.close()
+            
+            if results['status'] != 'failed':
+                data_version.bump(results['batch_id'], results['end_time'])
+            return True
+        except Exception as e:
+            logger.error(f"Error recording batch {results['batch_id']}: {e}")
+            return False
+
+    def collect_affected_projects(
+        self,
+        cleaned_dataframes: Dict[str, pd.DataFrame]
+    ) -> Optional[List[str]]:
+        """
+        Get the projects whose margins a batch can change.
+        
+        Args:
+            cleaned_dataframes: Dictionary of cleaned DataFrames by type
+            
+        Returns:
+            Sorted project names, or None when every project is affected
+            (Employee loads re-price all timecards)
+        """
+        if 'employee' in cleaned_dataframes and not cleaned_dataframes['employee'].empty:
+            return None
+        
+        names = set()
+        for file_type in ('project', 'timecard'):
+            df = cleaned_dataframes.get(file_type)
+            if df is not None and 'PROJECT_NAME' in df.columns:
+                names.update(df['PROJECT_NAME'].dropna().unique())
+        
+        return sorted(names)
+
+    def refresh_rollups(
+        self,
+        cleaned_dataframes: Dict[str, pd.DataFrame],
+        batch_id: str,
+        results: Dict[str, Any]
+    ) -> None:
+        """
+        Refresh the TIMECARD_COST_CUBE cells affected by a loaded batch.
+        
+        Employee loads re-price every timecard, so they trigger a full
+        rebuild; TimeCard-only loads recompute just the touched
+        (project, month) cells. Failures are recorded but do not fail
+        the ingest, since the cube can always be rebuilt.
+        
+        Args:
+            cleaned_dataframes: Dictionary of cleaned DataFrames by type
+            batch_id: Unique batch identifier
+            results: Loading results dictionary to annotate
+        """
+        try:
+            if 'employee' in cleaned_dataframes and not cleaned_dataframes['employee'].empty:
+                rebuilt = self.cube_service.rebuild(batch_id)
+                results['cube'] = {'mode': 'rebuild', 'success': rebuilt}
+            elif 'timecard' in cleaned_dataframes:
+                cells = self.cube_service.cells_from_timecards(cleaned_dataframes['timecard'])
+                refreshed = self.cube_service.refresh_cells(cells, batch_id)
+                results['cube'] = {'mode': 'incremental', 'cells_refreshed': refreshed}
+        except Exception as e:
+            error_msg = f"Error refreshing cost cube: {str(e)}"
+            results['errors'].append(error_msg)
+            logger.error(error_msg)
+
     def get_loading_status(self, batch_id: str) -> Dict[str, Any]:
         """
         Get status of a specific loading batch.
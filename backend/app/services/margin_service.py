@@ -10,15 +10,34 @@ This service handles:
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 
+import numpy as np
+
+from app.core.config import settings
+from app.core.responses import EncodedBody, dumps
 from app.db.oracle import get_db_connection, execute_query, execute_stored_procedure
 from app.models.margin import MarginRow, MarginSummary, MarginFilter
+from app.services.stats_service import margin_distribution
+from app.services.version_service import data_version
+from app.services.event_service import margin_events
+from app.services.search_service import project_search
+from app.services.margin_table import MarginTable
 
 logger = logging.getLogger(__name__)
 
 
+def _to_float(value: Any) -> Optional[float]:
+    """Convert an Oracle NUMBER (int, float or Decimal) to float, keeping NULLs."""
+    return None if value is None else float(value)
+
+
 class MarginCalculationService:
     """Service for calculating and retrieving gross margin data."""
     
@@ -27,18 +46,63 @@ class MarginCalculationService:
         self.cache_duration = timedelta(minutes=15)  # TODO: Make configurable
         self._margin_cache = {}
         self._summary_cache = {}
+        self._body_cache: 'OrderedDict[Tuple, Tuple[MarginTable, EncodedBody]]' = OrderedDict()
+        self._body_lock = threading.Lock()
+        self._trend_cache = {}
         self._last_cache_update = None
 
+    def _get_margin_snapshot(self, force: bool = False) -> MarginTable:
+        """
+        Get one row per project from a single GROSS_MARGIN_VIEW scan.
+        
+        The snapshot is cached per data version (latest ingest batch) and
+        for at most cache_duration; margins, summary and the project list
+        are all derived from it. If the view cannot be read, the last
+        snapshot is served. Rows are held column-wise in a MarginTable.
+        
+        Args:
+            force: Re-read the view even if the cached snapshot is current
+            
+        Returns:
+            MarginTable with project ids, names, hours, budget and margin
+        """
+        version = data_version.current().batch_id
+        now = datetime.now()
+        if (
+            not force
+            and self._margin_cache
+            and self._margin_cache.get('version') == version
+            and self._last_cache_update
+            and now - self._last_cache_update < self.cache_duration
+        ):
+            return self._margin_cache['rows']
+        
+        try:
+            snapshot = MarginTable.from_rows(self._fetch_view_rows())
+        except Exception as e:
+            if self._margin_cache:
+                logger.error(f"Error reading GROSS_MARGIN_VIEW, serving cached snapshot: {e}")
+                return self._margin_cache['rows']
+            raise
+        
+        self._margin_cache = {
+            'version': version,
+            'rows': snapshot
+        }
+        self._summary_cache.clear()
+        with self._body_lock:
+            self._body_cache.clear()
+        self._last_cache_update = now
+        project_search.rebuild(zip(snapshot.project_ids.tolist(), snapshot.names), version)
+        return snapshot
+
     def get_project_margins(self, filters: Optional[MarginFilter] = None) -> List[MarginRow]:
         """
         Get gross margin data for all projects.
         
-        TODO: Implement margin data retrieval
-        - Call Oracle stored function or view
-        - Apply filtering if provided
-        - Shape results to MarginRow format
-        - Handle calculation errors gracefully
-        - Implement caching for performance
+        Rows come from the cached margin snapshot; filters are applied in
+        memory. Projects without a computable margin (no timecards or
+        zero SOW) are left out.
         
         Args:
             filters: Optional filtering criteria
@@ -47,167 +111,361 @@ class MarginCalculationService:
             List of MarginRow objects with project margin data
         """
         try:
-            # TODO: Implement margin data retrieval
-            # - Check cache first (if enabled and valid)
-            # - Build SQL query with filters
-            # - Execute query against GROSS_MARGIN_VIEW
-            # - Use margin_calc_pkg_02.f_get_gross_margin function
-            # - Handle Oracle-specific data types
-            # - Shape results to MarginRow format
-            # - Update cache with results
-            # - Return formatted data
-            
-            # Placeholder implementation using view
-            query = """
-            SELECT 
-                PROJECT_NAME,
-                TOTAL_HOURS,
-                BUDGET,
-                GROSS_MARGIN_PERCENTAGE
-            FROM GROSS_MARGIN_VIEW
-            """
+            return self._shape_margin_rows(self._get_margin_snapshot(), filters)
             
-            params = {}
-            if filters:
-                # TODO: Apply filters to query
-                # - Add WHERE clauses for each filter
-                # - Use bind variables for security
-                # - Handle different filter types
-                pass
+        except Exception as e:
+            logger.error(f"Error retrieving project margins: {e}")
+            return []
+
+    def get_project_margins_body(
+        self,
+        filters: Optional[MarginFilter] = None,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> EncodedBody:
+        """
+        Get the encoded /margins response body for the given filters.
+        
+        Encoded with orjson straight from the columnar snapshot (no MarginRow
+        models) and cached with its gzip variant until the snapshot changes,
+        so repeated requests reuse the same bytes.
+        
+        Args:
+            filters: Optional filtering criteria
+            fields: Optional MarginRow fields to include (None = all)
             
-            # TODO: Execute query and process results
-            # - Use execute_query function
-            # - Handle Oracle result format
-            # - Convert to MarginRow objects
-            # - Apply any post-processing
-            
-            # Placeholder return
-            return [
-                MarginRow(
-                    projectName="Sample Project",
-                    totalHours=100.0,
-                    budget=50000.0,
-                    grossMarginPercentage=35.5
-                )
-            ]
+        Returns:
+            EncodedBody holding a JSON array of MarginRow objects
+        """
+        try:
+            snapshot = self._get_margin_snapshot()
+            key = ('margins', fields) if filters is None else (
+                'margins',
+                fields,
+                filters.project_name.strip().upper() if filters.project_name else None,
+                filters.min_margin,
+                filters.max_margin,
+                filters.min_hours,
+                filters.max_hours
+            )
+            return self._encoded_body(
+                key, snapshot, lambda: snapshot.to_json(snapshot.select(filters), fields)
+            )
             
         except Exception as e:
             logger.error(f"Error retrieving project margins: {e}")
-            # TODO: Implement fallback logic
-            # - Try alternative calculation method
-            # - Return cached data if available
-            # - Provide meaningful error message
-            return []
+            return EncodedBody(raw=b'[]')
+
+    def get_margin_summary_body(self) -> Optional[EncodedBody]:
+        """
+        Get the encoded /margins/summary response body.
+        
+        Returns:
+            EncodedBody holding the MarginSummary JSON, or None on failure
+        """
+        try:
+            snapshot = self._get_margin_snapshot()
+            return self._encoded_body(
+                ('summary',), snapshot, lambda: dumps(self._summarize(snapshot).model_dump())
+            )
+            
+        except Exception as e:
+            logger.error(f"Error calculating margin summary: {e}")
+            return None
+
+    def _encoded_body(
+        self,
+        key: Tuple,
+        snapshot: MarginTable,
+        encode: Callable[[], bytes]
+    ) -> EncodedBody:
+        """Return the cached body for key if it was encoded from this snapshot, else encode it."""
+        with self._body_lock:
+            cached = self._body_cache.get(key)
+            if cached is not None and cached[0] is snapshot:
+                self._body_cache.move_to_end(key)
+                return cached[1]
+        
+        body = EncodedBody.from_bytes(encode())
+        with self._body_lock:
+            self._body_cache[key] = (snapshot, body)
+            self._body_cache.move_to_end(key)
+            while len(self._body_cache) > settings.RESPONSE_BODY_CACHE_SIZE:
+                self._body_cache.popitem(last=False)
+        return body
+
+    def get_projects_body(self, fields: Optional[Tuple[str, ...]] = None) -> EncodedBody:
+        """
+        Get the encoded /projects response body.
+        
+        Args:
+            fields: Optional project fields to include (None = all)
+            
+        Returns:
+            EncodedBody holding a JSON array of project dicts ordered by name
+        """
+        try:
+            snapshot = self._get_margin_snapshot()
+            return self._encoded_body(
+                ('projects', fields), snapshot, lambda: snapshot.projects_json(fields)
+            )
+            
+        except Exception as e:
+            logger.error(f"Error listing projects: {e}")
+            return EncodedBody(raw=b'[]')
+
+    def _shape_margin_rows(
+        self,
+        snapshot: MarginTable,
+        filters: Optional[MarginFilter] = None,
+        project_names: Optional[List[str]] = None
+    ) -> List[MarginRow]:
+        """Apply filters to snapshot rows and convert them to MarginRow objects."""
+        return snapshot.margin_rows(snapshot.select(filters, project_names))
 
     def get_margin_summary(self) -> Optional[MarginSummary]:
         """
         Get summary statistics for all project margins.
         
-        TODO: Implement summary calculation
-        - Aggregate margin data from projects
-        - Calculate totals and averages
-        - Handle edge cases (no data, division by zero)
-        - Implement caching for performance
-        - Return MarginSummary object
+        Totals are derived from the cached margin snapshot rather than a
+        separate COUNT/SUM/AVG query. As with AVG, NULL margins are ignored
+        in the average.
         
         Returns:
             MarginSummary with aggregated statistics
         """
         try:
-            # TODO: Implement summary calculation
-            # - Check cache first (if enabled and valid)
-            # - Aggregate data from GROSS_MARGIN_VIEW
-            # - Calculate total projects, hours, budget
-            # - Compute average margin percentage
-            # - Handle edge cases gracefully
-            # - Update cache with results
-            # - Return MarginSummary object
+            return self._summarize(self._get_margin_snapshot())
             
-            # Placeholder implementation
-            summary_query = """
-            SELECT 
-                COUNT(*) as total_projects,
-                SUM(TOTAL_HOURS) as total_hours,
-                SUM(BUDGET) as total_budget,
-                AVG(GROSS_MARGIN_PERCENTAGE) as avg_margin_percentage
-            FROM GROSS_MARGIN_VIEW
-            """
+        except Exception as e:
+            logger.error(f"Error calculating margin summary: {e}")
+            return None
+
+    def _summarize(self, snapshot: MarginTable) -> MarginSummary:
+        """Compute (and memoize per snapshot) the MarginSummary for snapshot rows."""
+        if 'summary' in self._summary_cache and self._summary_cache.get('rows') is snapshot:
+            return self._summary_cache['summary']
+        
+        margins = snapshot.margin[~np.isnan(snapshot.margin)]
+        summary = MarginSummary(
+            totalProjects=len(snapshot),
+            totalHours=round(float(snapshot.hours.sum()), 2),
+            totalBudget=round(float(snapshot.budget.sum()), 2),
+            averageMarginPercentage=round(float(margins.mean()), 2) if len(margins) else 0.0
+        )
+        self._summary_cache = {'rows': snapshot, 'summary': summary}
+        return summary
+
+    def list_projects(self) -> List[Dict[str, Any]]:
+        """
+        List all projects with basic information.
+        
+        Only PROJECT_ID, PROJECT_NAME and SOW are returned; no cost data.
+        
+        Returns:
+            List of dicts with project_id, project_name and sow
+        """
+        try:
+            return self._shape_projects(self._get_margin_snapshot())
             
-            # TODO: Execute summary query
-            # - Use execute_query function
-            # - Handle single row result
-            # - Convert to MarginSummary object
-            # - Apply any post-processing
-            
-            # Placeholder return
-            return MarginSummary(
-                totalProjects=0,
-                totalHours=0.0,
-                totalBudget=0.0,
-                averageMarginPercentage=0.0
-            )
+        except Exception as e:
+            logger.error(f"Error listing projects: {e}")
+            return []
+
+    def _shape_projects(self, snapshot: MarginTable) -> List[Dict[str, Any]]:
+        """Project listing rows (ID, name, SOW) for snapshot rows."""
+        return sorted(
+            (
+                {
+                    'project_id': project_id,
+                    'project_name': name,
+                    'sow': sow
+                }
+                for project_id, name, sow in zip(
+                    snapshot.project_ids.tolist(), snapshot.names, snapshot.budget.tolist()
+                )
+            ),
+            key=lambda project: project['project_name']
+        )
+
+    def search_projects(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Suggest project names for a partial or misspelled query.
+        
+        Served from the in-memory project name index, which is rebuilt
+        with each new margin snapshot.
+        
+        Args:
+            query: Text typed by the user
+            limit: Maximum number of suggestions
             
+        Returns:
+            List of dicts with project_id, project_name and score, best first
+        """
+        try:
+            self._get_margin_snapshot()
         except Exception as e:
-            logger.error(f"Error calculating margin summary: {e}")
-            # TODO: Implement fallback logic
-            # - Try alternative calculation method
-            # - Return cached data if available
-            # - Provide meaningful error message
+            logger.error(f"Error refreshing project index, searching last known names: {e}")
+        return project_search.search(query, limit)
+
+    def get_dashboard(self) -> Optional[Dict[str, Any]]:
+        """
+        Get margins, summary and projects for the dashboard in one call.
+        
+        All three are derived from the same margin snapshot, so the
+        dashboard costs at most one GROSS_MARGIN_VIEW scan.
+        
+        Returns:
+            Dictionary with margins, summary and projects, or None on failure
+        """
+        try:
+            snapshot = self._get_margin_snapshot()
+            return {
+                'margins': self._shape_margin_rows(snapshot),
+                'summary': self._summarize(snapshot),
+                'projects': self._shape_projects(snapshot)
+            }
+            
+        except Exception as e:
+            logger.error(f"Error building dashboard data: {e}")
             return None
 
-    def calculate_project_margin(self, project_name: str) -> Optional[float]:
+    def warm_caches(self) -> bool:
         """
-        Calculate gross margin for a specific project using Oracle package.
+        Re-read the margin snapshot and precompute summary, trends,
+        distribution and the unfiltered /margins, /margins/summary and
+        /projects bodies so the next request is served from memory.
         
-        TODO: Implement individual project margin calculation
-        - Call margin_calc_pkg_02.f_get_gross_margin function
-        - Handle Oracle stored procedure execution
-        - Process function return value
-        - Handle calculation errors gracefully
-        - Return margin percentage or None
+        The current snapshot keeps being served until the new one is read,
+        and is kept if the view cannot be read.
+        
+        Returns:
+            True if warm-up succeeded, False otherwise
+        """
+        try:
+            snapshot = self._get_margin_snapshot(force=True)
+            self._summarize(snapshot)
+            self.get_project_margins_body()
+            self.get_margin_summary_body()
+            self.get_projects_body()
+            self.get_margin_trends()
+            self.get_margin_distribution(force=True)
+            logger.info(f"Margin caches warmed ({len(snapshot)} projects)")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error warming margin caches: {e}")
+            return False
+
+    def get_margin_changes(self, since: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the margin rows changed since a given ingest batch.
+        
+        Uses the per-batch affected-project record (LOAD_BATCH_PROJECT), so
+        the work is proportional to the number of changed projects. Clients
+        are told to resync fully when the since batch is unknown or a later
+        batch affected every project (Employee loads).
         
         Args:
-            project_name: Name of the project to calculate
+            since: Version token (batch_id) the client last synced to
             
         Returns:
-            Gross margin percentage or None if calculation fails
+            Dictionary with version, fullResync, changed rows and removed
+            project names, or None on failure
         """
         try:
-            # TODO: Implement individual project calculation
-            # - Call Oracle stored function
-            # - Use execute_stored_procedure or direct function call
-            # - Handle Oracle-specific data types
-            # - Process function return value
-            # - Handle calculation errors
-            # - Return margin percentage
-            
-            # Option 1: Direct function call
-            function_query = """
-            SELECT margin_calc_pkg_02.f_get_gross_margin(:project_name) as margin_percentage
-            FROM DUAL
-            """
+            version = data_version.current().batch_id
+            if since == version:
+                return {'version': version, 'fullResync': False, 'changed': [], 'removed': []}
             
-            # Option 2: Stored procedure call
-            # execute_stored_procedure('margin_calc_pkg_02.p_get_gross_percent', {'p_project_name': project_name})
+            since_batch = execute_query(
+                "SELECT BATCH_SEQ FROM LOAD_BATCH WHERE BATCH_ID = :since",
+                {'since': since}
+            )
+            rows = []
+            if since_batch:
+                rows = execute_query(
+                    """
+                    SELECT b.ALL_PROJECTS, bp.PROJECT_NAME
+                    FROM LOAD_BATCH b
+                    LEFT JOIN LOAD_BATCH_PROJECT bp ON bp.BATCH_ID = b.BATCH_ID
+                    WHERE b.STATUS != 'failed'
+                      AND b.BATCH_SEQ > :since_seq
+                    """,
+                    {'since_seq': since_batch[0]['BATCH_SEQ']}
+                )
             
-            # TODO: Execute function query
-            # - Use execute_query with bind variables
-            # - Handle single row result
-            # - Extract margin percentage
-            # - Convert to float
-            # - Handle NULL results
+            snapshot = self._get_margin_snapshot()
+            if not since_batch or any(row['ALL_PROJECTS'] == 'Y' for row in rows):
+                return {
+                    'version': version,
+                    'fullResync': True,
+                    'changed': self._shape_margin_rows(snapshot),
+                    'removed': []
+                }
             
-            # Placeholder return
-            return 35.5
+            changed_names = {row['PROJECT_NAME'] for row in rows if row['PROJECT_NAME']}
+            changed = self._shape_margin_rows(snapshot, project_names=changed_names)
+            present = {row.projectName for row in changed}
+            return {
+                'version': version,
+                'fullResync': False,
+                'changed': changed,
+                'removed': sorted(changed_names - present)
+            }
             
         except Exception as e:
-            logger.error(f"Error calculating margin for project {project_name}: {e}")
-            # TODO: Implement fallback logic
-            # - Try alternative calculation method
-            # - Log detailed error information
-            # - Return None for failed calculations
+            logger.error(f"Error retrieving margin changes since {since}: {e}")
             return None
 
+    def calculate_project_margin(self, project_name: str) -> Dict[str, Any]:
+        """
+        Get the gross margin for a single project by name.
+        
+        The name is resolved against the project name index (ignoring case
+        and punctuation) and the margin is read from the cached snapshot,
+        which holds margin_calc_pkg_02.f_get_gross_margin per project.
+        Unknown names get ranked "did you mean" suggestions from the index
+        instead of a LIKE scan over PROJECT.
+        
+        Args:
+            project_name: Name of the project to calculate
+            
+        Returns:
+            Dictionary with project_name, found, margin_percentage and
+            suggestions
+        """
+        result = {
+            'project_name': project_name,
+            'found': False,
+            'margin_percentage': None,
+            'suggestions': []
+        }
+        if not project_name or not project_name.strip():
+            return result
+        
+        try:
+            self._get_margin_snapshot()
+            snapshot = self._margin_cache.get('rows')
+            resolved = project_search.find(project_name)
+            position = snapshot.position(resolved) if snapshot is not None and resolved else None
+            if position is None:
+                result['suggestions'] = [
+                    match['project_name'] for match in project_search.search(project_name, limit=5)
+                ]
+                return result
+            
+            row = snapshot.row(position)
+            result.update(
+                project_name=row['project_name'],
+                found=True,
+                margin_percentage=row['margin']
+            )
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error calculating margin for project {project_name}: {e}")
+            return result
+
     def refresh_margin_data(self) -> bool:
         """
         Refresh margin data by clearing cache and recalculating.
@@ -234,6 +492,9 @@ class MarginCalculationService:
             # Clear caches
             self._margin_cache.clear()
             self._summary_cache.clear()
+            with self._body_lock:
+                self._body_cache.clear()
+            self._trend_cache.clear()
             self._last_cache_update = None
             
             # TODO: Refresh materialized views
@@ -246,6 +507,12 @@ class MarginCalculationService:
             # - Update statistics
             # - Handle any Oracle maintenance tasks
             
+            margin_events.publish({
+                'type': 'refresh',
+                'version': data_version.current().batch_id,
+                'fullResync': True
+            })
+            
             logger.info("Margin data refresh completed successfully")
             return True
             
@@ -257,6 +524,142 @@ class MarginCalculationService:
             # - Provide detailed error information
             return False
 
+    def get_margins_by_project(
+        self,
+        project_names: Optional[List[str]] = None
+    ) -> Dict[str, Optional[float]]:
+        """
+        Get the margin percentage of each project from GROSS_MARGIN_VIEW.
+        
+        Args:
+            project_names: Projects to fetch (None = all projects)
+            
+        Returns:
+            Dictionary of margin percentage by project name
+        """
+        return {
+            row['project_name']: row['margin']
+            for row in self._fetch_view_rows(project_names)
+        }
+
+    def _fetch_view_rows(
+        self,
+        project_names: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Read GROSS_MARGIN_VIEW rows (snapshot shape) for some or all projects.
+        
+        Args:
+            project_names: Projects to fetch (None = all projects)
+            
+        Returns:
+            List of dicts with project_id, project_name, total_hours,
+            budget and margin
+        """
+        query = """
+        SELECT PROJECT_ID, PROJECT_NAME, TOTAL_HOURS, BUDGET, GROSS_MARGIN_PERCENTAGE
+        FROM GROSS_MARGIN_VIEW
+        """
+        if project_names is None:
+            rows = execute_query(query)
+        else:
+            rows = []
+            names = list(project_names)
+            # Oracle caps IN lists at 1000 expressions
+            for start in range(0, len(names), 1000):
+                chunk = names[start:start + 1000]
+                binds = {f"p{i}": name for i, name in enumerate(chunk)}
+                placeholders = ', '.join(f":{key}" for key in binds)
+                rows.extend(execute_query(f"{query} WHERE PROJECT_NAME IN ({placeholders})", binds))
+        
+        return [
+            {
+                'project_id': row['PROJECT_ID'],
+                'project_name': row['PROJECT_NAME'],
+                'total_hours': _to_float(row['TOTAL_HOURS']) or 0.0,
+                'budget': _to_float(row['BUDGET']) or 0.0,
+                'margin': _to_float(row['GROSS_MARGIN_PERCENTAGE'])
+            }
+            for row in rows
+        ]
+
+    def get_margin_distribution(self, force: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get margin buckets, percentiles and negative-margin count.
+        
+        Served from the in-memory distribution maintained by
+        on_batch_loaded. The view is read in full the first time, and
+        again when the data version has moved past the distribution's
+        (e.g. a batch loaded by another worker).
+        
+        Args:
+            force: Rebuild from the view even if the version matches
+            
+        Returns:
+            Distribution snapshot or None if it cannot be loaded
+        """
+        try:
+            version = data_version.current().batch_id
+            if force or not margin_distribution.loaded or margin_distribution.version != version:
+                margin_distribution.replace_all(self.get_margins_by_project(), version)
+            return margin_distribution.snapshot()
+            
+        except Exception as e:
+            logger.error(f"Error calculating margin distribution: {e}")
+            return None
+
+    def on_batch_loaded(
+        self,
+        batch_id: str,
+        affected_projects: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Bring derived margin statistics up to date after an ingest batch
+        and build the margin deltas for subscribed dashboards.
+        
+        The event is returned rather than published: its version is the
+        batch ID, which clients may only see once the batch is recorded.
+        
+        Args:
+            batch_id: Ingest batch that was loaded
+            affected_projects: Projects touched by the batch (None = all)
+            
+        Returns:
+            'margins' event for margin_events, or None on errors
+        """
+        try:
+            if affected_projects is None:
+                margin_distribution.replace_all(self.get_margins_by_project(), batch_id)
+                return {
+                    'type': 'margins',
+                    'version': batch_id,
+                    'fullResync': True,
+                    'changed': [],
+                    'removed': []
+                }
+            
+            rows = self._fetch_view_rows(affected_projects)
+            margins = {row['project_name']: row['margin'] for row in rows}
+            removed = [name for name in affected_projects if name not in margins]
+            if margin_distribution.loaded:
+                margin_distribution.apply(margins, removed=removed, version=batch_id)
+            else:
+                margin_distribution.replace_all(self.get_margins_by_project(), batch_id)
+            
+            changed = self._shape_margin_rows(MarginTable.from_rows(rows))
+            present = {row.projectName for row in changed}
+            return {
+                'type': 'margins',
+                'version': batch_id,
+                'fullResync': False,
+                'changed': [row.model_dump() for row in changed],
+                'removed': sorted(set(affected_projects) - present)
+            }
+            
+        except Exception as e:
+            logger.error(f"Error updating margin statistics for batch {batch_id}: {e}")
+            return None
+
     def get_margin_trends(
         self, 
         days_back: int = 30
@@ -264,99 +667,198 @@ class MarginCalculationService:
         """
         Get margin trends over time.
         
-        TODO: Implement trend analysis
-        - Query historical margin data
-        - Calculate trends over specified period
-        - Handle time-based aggregations
-        - Return trend data in chart-friendly format
-        - Implement performance optimization
+        Each point is the average cumulative margin of the projects that
+        booked time that day. Only the TIMECARD partitions inside the window
+        (plus the days of its first month before the window) are scanned;
+        costs from earlier months come from TIMECARD_COST_CUBE.
         
         Args:
             days_back: Number of days to look back
             
         Returns:
-            List of trend data points
+            List of trend data points ordered by date
         """
+        window_start = datetime.combine(datetime.now().date() - timedelta(days=days_back), datetime.min.time())
+        cache_key = (days_back, window_start, data_version.current().batch_id)
+        if cache_key in self._trend_cache:
+            return self._trend_cache[cache_key]
+        
         try:
-            # TODO: Implement trend analysis
-            # - Query historical data from audit logs
-            # - Calculate daily/weekly trends
-            # - Aggregate margin changes over time
-            # - Handle time-based calculations
-            # - Return structured trend data
-            
-            # Placeholder implementation
             trend_query = """
-            SELECT 
-                TRUNC(DAILY_DATE) as date,
-                AVG(GROSS_MARGIN_PERCENTAGE) as avg_margin,
-                COUNT(*) as project_count
-            FROM GROSS_MARGIN_VIEW
-            WHERE DAILY_DATE >= SYSDATE - :days_back
-            GROUP BY TRUNC(DAILY_DATE)
-            ORDER BY date
+            WITH emp AS (
+                SELECT EMPLOYEE_KEY,
+                       margin_calc_pkg_02.f_decrypt_ctc(CTC) / 2112 AS HOURLY_COST
+                FROM EMPLOYEE
+            ),
+            prior AS (
+                SELECT c.PROJECT_ID, SUM(c.TOTAL_COST) AS COST
+                FROM TIMECARD_COST_CUBE c
+                WHERE c.MONTH_START < TRUNC(:window_start, 'MM')
+                GROUP BY c.PROJECT_ID
+                UNION ALL
+                SELECT t.PROJECT_ID, SUM(t.TIME_WORKED * NVL(emp.HOURLY_COST, 0))
+                FROM TIMECARD t
+                LEFT JOIN emp ON emp.EMPLOYEE_KEY = t.EMPLOYEE_KEY
+                WHERE t.DAILY_DATE >= TRUNC(:window_start, 'MM')
+                  AND t.DAILY_DATE < :window_start
+                GROUP BY t.PROJECT_ID
+            ),
+            daily AS (
+                SELECT t.PROJECT_ID,
+                       TRUNC(t.DAILY_DATE) AS WORK_DATE,
+                       SUM(t.TIME_WORKED) AS HOURS,
+                       SUM(t.TIME_WORKED * NVL(emp.HOURLY_COST, 0)) AS COST
+                FROM TIMECARD t
+                LEFT JOIN emp ON emp.EMPLOYEE_KEY = t.EMPLOYEE_KEY
+                WHERE t.DAILY_DATE >= :window_start
+                GROUP BY t.PROJECT_ID, TRUNC(t.DAILY_DATE)
+            ),
+            cumulative AS (
+                SELECT d.WORK_DATE,
+                       d.HOURS,
+                       p.SOW,
+                       NVL(pr.COST, 0) + SUM(d.COST) OVER (
+                           PARTITION BY d.PROJECT_ID ORDER BY d.WORK_DATE
+                       ) AS COST_TO_DATE
+                FROM daily d
+                JOIN PROJECT p ON p.PROJECT_ID = d.PROJECT_ID
+                LEFT JOIN (
+                    SELECT PROJECT_ID, SUM(COST) AS COST FROM prior GROUP BY PROJECT_ID
+                ) pr ON pr.PROJECT_ID = d.PROJECT_ID
+            )
+            SELECT
+                WORK_DATE,
+                ROUND(AVG(CASE WHEN SOW > 0 THEN (SOW - COST_TO_DATE) / SOW * 100 END), 2) AS AVG_MARGIN,
+                COUNT(*) AS PROJECT_COUNT,
+                SUM(HOURS) AS TOTAL_HOURS
+            FROM cumulative
+            GROUP BY WORK_DATE
+            ORDER BY WORK_DATE
             """
             
-            # TODO: Execute trend query
-            # - Use execute_query with bind variables
-            # - Process time-series results
-            # - Format for charting
-            # - Handle empty result sets
-            
-            # Placeholder return
-            return [
+            rows = execute_query(trend_query, {'window_start': window_start})
+            trends = [
                 {
-                    'date': '2024-01-01',
-                    'avg_margin': 35.5,
-                    'project_count': 5
+                    'date': row['WORK_DATE'].date().isoformat(),
+                    'avg_margin': _to_float(row['AVG_MARGIN']),
+                    'project_count': int(row['PROJECT_COUNT']),
+                    'total_hours': _to_float(row['TOTAL_HOURS'])
                 }
+                for row in rows
             ]
             
+            # Trends only change with new data; keep one entry per window
+            self._trend_cache = {
+                key: value for key, value in self._trend_cache.items()
+                if key[0] != days_back
+            }
+            self._trend_cache[cache_key] = trends
+            return trends
+            
         except Exception as e:
             logger.error(f"Error calculating margin trends: {e}")
-            # TODO: Implement fallback logic
-            # - Return cached trend data if available
-            # - Provide meaningful error message
-            # - Handle calculation failures gracefully
+            for key, trends in self._trend_cache.items():
+                if key[0] == days_back:
+                    return trends
             return []
 
-    def validate_margin_calculations(self) -> Dict[str, Any]:
+    def validate_margin_calculations(
+        self,
+        sample_size: Optional[int] = None,
+        time_budget: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Validate margin calculations for data integrity.
         
-        TODO: Implement calculation validation
-        - Cross-check stored function results
-        - Validate against manual calculations
-        - Check for data consistency
-        - Identify calculation anomalies
-        - Return validation report
+        Computes an independent, set-based margin for every project in a
+        single pass over TIMECARD and cross-checks it against
+        margin_calc_pkg_02.f_get_gross_margin. The stored function is only
+        called for a stratified sample of projects (or all of them when
+        sample_size is 0), on a bounded number of pool connections and
+        within a time budget, so the job can run after every ingest without
+        starving dashboard requests. The budget covers the reference query
+        too; every database call gets the remaining budget as its
+        call_timeout, so no connection is held past the deadline.
         
+        Args:
+            sample_size: Projects to cross-check (defaults to settings, 0 = all)
+            time_budget: Seconds allowed for the whole validation run
+            
         Returns:
             Dictionary with validation results and issues
         """
+        started = time.monotonic()
+        if sample_size is None:
+            sample_size = settings.MARGIN_VALIDATION_SAMPLE_SIZE
+        if time_budget is None:
+            time_budget = settings.MARGIN_VALIDATION_TIME_BUDGET
+        deadline = started + time_budget
+        
         try:
-            # TODO: Implement calculation validation
-            # - Compare stored function results with view data
-            # - Validate mathematical consistency
-            # - Check for data type issues
-            # - Identify calculation errors
-            # - Return detailed validation report
-            
             validation_results = {
                 'status': 'pending',
                 'checks_performed': [],
                 'issues_found': [],
-                'recommendations': []
+                'recommendations': [],
+                'summary': {}
             }
+            issues = validation_results['issues_found']
+            
+            # Check 1 - independent set-based margins for every project
+            reference = self._compute_reference_margins(deadline)
+            validation_results['checks_performed'].append('set_based_reference_margins')
+            
+            candidates = []
+            for row in reference:
+                if row['sow'] is None or row['sow'] == 0:
+                    issues.append({
+                        'type': 'division_by_zero',
+                        'project_name': row['project_name'],
+                        'detail': 'SOW is NULL or zero; margin percentage is undefined'
+                    })
+                elif row['expected_margin'] is None:
+                    issues.append({
+                        'type': 'null_margin',
+                        'project_name': row['project_name'],
+                        'detail': 'No costed timecards for project'
+                    })
+                else:
+                    candidates.append(row)
+            validation_results['checks_performed'].append('sow_and_null_checks')
             
-            # TODO: Perform validation checks
-            # - Check stored function accuracy
-            # - Validate view calculations
-            # - Cross-reference with source data
-            # - Identify inconsistencies
-            # - Generate recommendations
+            # Check 2 - cross-check the stored function on a sample
+            sample = self._select_validation_sample(candidates, sample_size)
+            checked, timed_out = self._cross_check_stored_margins(
+                sample,
+                deadline,
+                issues
+            )
+            validation_results['checks_performed'].append('stored_function_cross_check')
             
-            validation_results['status'] = 'completed'
+            if any(issue['type'] == 'drift' for issue in issues):
+                validation_results['recommendations'].append(
+                    'Stored margins drift from timecard data; rebuild TIMECARD_COST_CUBE '
+                    '(cube_service.rebuild), refresh the margin snapshot '
+                    '(refresh_scheduler.trigger) and review margin_calc_pkg_02.f_get_gross_margin'
+                )
+            if any(issue['type'] == 'division_by_zero' for issue in issues):
+                validation_results['recommendations'].append(
+                    'Set a non-zero SOW for projects flagged with division_by_zero'
+                )
+            if timed_out:
+                validation_results['recommendations'].append(
+                    'Time budget exhausted; lower the sample size or raise '
+                    'MARGIN_VALIDATION_TIME_BUDGET'
+                )
+            
+            validation_results['summary'] = {
+                'projects_total': len(reference),
+                'projects_sampled': len(sample),
+                'projects_checked': checked,
+                'timed_out': timed_out,
+                'duration_seconds': round(time.monotonic() - started, 3)
+            }
+            validation_results['status'] = 'completed' if not timed_out else 'partial'
             
             return validation_results
             
@@ -370,6 +872,211 @@ class MarginCalculationService:
                 'recommendations': []
             }
 
+    def _compute_reference_margins(self, deadline: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Compute hours, cost and margin for every project in one scan.
+        
+        CTC is decrypted once per employee rather than once per timecard row,
+        and TIMECARD is aggregated a single time for all projects.
+        
+        Args:
+            deadline: time.monotonic() value the query must finish by
+            
+        Returns:
+            List of dicts with project_name, sow, total_hours, total_cost
+            and expected_margin
+        """
+        query = """
+        WITH emp AS (
+            SELECT EMPLOYEE_KEY,
+                   margin_calc_pkg_02.f_decrypt_ctc(CTC) / 2112 AS HOURLY_COST
+            FROM EMPLOYEE
+        ),
+        tc AS (
+            SELECT t.PROJECT_ID,
+                   SUM(t.TIME_WORKED) AS TOTAL_HOURS,
+                   SUM(t.TIME_WORKED * emp.HOURLY_COST) AS TOTAL_COST
+            FROM TIMECARD t
+            JOIN emp ON t.EMPLOYEE_KEY = emp.EMPLOYEE_KEY
+            GROUP BY t.PROJECT_ID
+        )
+        SELECT
+            p.PROJECT_NAME,
+            p.SOW,
+            tc.TOTAL_HOURS,
+            tc.TOTAL_COST,
+            CASE
+                WHEN p.SOW IS NULL OR p.SOW = 0 OR tc.TOTAL_COST IS NULL THEN NULL
+                ELSE ROUND(((p.SOW - tc.TOTAL_COST) / p.SOW) * 100, 2)
+            END AS EXPECTED_MARGIN
+        FROM PROJECT p
+        LEFT JOIN tc ON tc.PROJECT_ID = p.PROJECT_ID
+        """
+        
+        rows = self._query_before(deadline, query)
+        return [
+            {
+                'project_name': row['PROJECT_NAME'],
+                'sow': _to_float(row['SOW']),
+                'total_hours': _to_float(row['TOTAL_HOURS']),
+                'total_cost': _to_float(row['TOTAL_COST']),
+                'expected_margin': _to_float(row['EXPECTED_MARGIN'])
+            }
+            for row in rows
+        ]
+
+    def _select_validation_sample(
+        self,
+        candidates: List[Dict[str, Any]],
+        sample_size: int,
+        strata: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Pick a cost-stratified sample of projects to cross-check.
+        
+        Projects are ordered by total cost and split into equal-sized strata;
+        each stratum contributes proportionally (at least one project) so
+        that small and large projects are both represented.
+        
+        Args:
+            candidates: Reference rows eligible for cross-checking
+            sample_size: Target sample size (0 or >= len(candidates) = all)
+            strata: Number of cost bands
+            
+        Returns:
+            Sampled reference rows
+        """
+        if sample_size <= 0 or sample_size >= len(candidates):
+            return list(candidates)
+        
+        ordered = sorted(candidates, key=lambda row: row['total_cost'] or 0.0)
+        band_size = -(-len(ordered) // strata)
+        sample = []
+        for start in range(0, len(ordered), band_size):
+            band = ordered[start:start + band_size]
+            quota = max(1, round(sample_size * len(band) / len(ordered)))
+            sample.extend(random.sample(band, min(quota, len(band))))
+        
+        return sample[:sample_size]
+
+    def _cross_check_stored_margins(
+        self,
+        sample: List[Dict[str, Any]],
+        deadline: float,
+        issues: List[Dict[str, Any]]
+    ) -> Tuple[int, bool]:
+        """
+        Compare f_get_gross_margin against the reference margins in parallel.
+        
+        Calls run on at most MARGIN_VALIDATION_MAX_WORKERS pool connections.
+        At the deadline, queued calls are cancelled and running calls are
+        interrupted by their call_timeout, so the pool connections are
+        returned before this method does.
+        
+        Args:
+            sample: Reference rows to check
+            deadline: time.monotonic() value the cross-check must finish by
+            issues: List that drift/NULL/error issues are appended to
+            
+        Returns:
+            Tuple of (projects_checked, timed_out)
+        """
+        if not sample:
+            return 0, False
+        
+        tolerance = settings.MARGIN_VALIDATION_TOLERANCE
+        max_workers = max(1, min(settings.MARGIN_VALIDATION_MAX_WORKERS, len(sample)))
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='margin-validate')
+        futures = {
+            executor.submit(self._call_stored_margin, row['project_name'], deadline): row
+            for row in sample
+        }
+        done, not_done = wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+        # Running calls end at the deadline through their call_timeout
+        executor.shutdown(wait=True, cancel_futures=True)
+        
+        for future in done:
+            row = futures[future]
+            try:
+                actual = future.result()
+            except TimeoutError:
+                not_done.add(future)
+                continue
+            except Exception as e:
+                issues.append({
+                    'type': 'function_error',
+                    'project_name': row['project_name'],
+                    'detail': str(e)
+                })
+                continue
+            
+            if actual is None:
+                issues.append({
+                    'type': 'null_margin',
+                    'project_name': row['project_name'],
+                    'expected': row['expected_margin'],
+                    'detail': 'Stored function returned NULL'
+                })
+            elif abs(actual - row['expected_margin']) > tolerance:
+                issues.append({
+                    'type': 'drift',
+                    'project_name': row['project_name'],
+                    'expected': row['expected_margin'],
+                    'actual': actual,
+                    'difference': round(actual - row['expected_margin'], 4)
+                })
+        
+        return len(done) - len(not_done & done), bool(not_done)
+
+    def _call_stored_margin(self, project_name: str, deadline: Optional[float] = None) -> Optional[float]:
+        """Call margin_calc_pkg_02.f_get_gross_margin for a single project."""
+        rows = self._query_before(
+            deadline,
+            """
+            SELECT margin_calc_pkg_02.f_get_gross_margin(:project_name) AS MARGIN_PERCENTAGE
+            FROM DUAL
+            """,
+            {'project_name': project_name}
+        )
+        return _to_float(rows[0]['MARGIN_PERCENTAGE']) if rows else None
+
+    @staticmethod
+    def _query_before(
+        deadline: Optional[float],
+        query: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a SELECT that must finish by deadline (time.monotonic(); None = no limit).
+        
+        The remaining time is set as the connection's call_timeout, so a
+        slow statement is interrupted instead of holding its pool
+        connection past the deadline.
+        
+        Raises:
+            TimeoutError: If the deadline passed before or during the call
+        """
+        with get_db_connection() as connection:
+            if deadline is not None:
+                remaining_ms = int((deadline - time.monotonic()) * 1000)
+                if remaining_ms <= 0:
+                    raise TimeoutError("Margin validation time budget exhausted")
+                connection.call_timeout = remaining_ms
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, params or {})
+                columns = [column[0] for column in cursor.description]
+                return [dict(zip(columns, row)) for row in cursor.fetchall()]
+            except Exception as e:
+                # DPI-1067: call timeout exceeded
+                if deadline is not None and ('DPI-1067' in str(e) or time.monotonic() >= deadline):
+                    raise TimeoutError("Margin validation time budget exhausted") from e
+                raise
+            finally:
+                cursor.close()
+                # Pooled connections are reused; clear the timeout
+                connection.call_timeout = 0
+
     def export_margin_data(
         self, 
         format: str = 'csv',
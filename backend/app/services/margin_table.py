@@ -0,0 +1,208 @@
+"""
+Columnar margin snapshot for Gross Calculator
+
+MarginTable holds one GROSS_MARGIN_VIEW snapshot as parallel arrays:
+- numpy float arrays for hours, budget and margin (NaN = NULL margin)
+- an interned project-name table with a name -> position map
+- a precomputed ranking by margin, so filtered results keep the API order
+
+Filters are vectorized masks over the arrays, and /margins response bytes
+are written straight from them without building MarginRow models.
+"""
+
+import sys
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import orjson
+
+from app.models.margin import MarginRow, MarginFilter
+
+# Response fields selectable with ?fields=, in serialization order
+MARGIN_FIELDS = ('projectName', 'totalHours', 'budget', 'grossMarginPercentage')
+PROJECT_FIELDS = ('project_id', 'project_name', 'sow')
+
+
+class MarginTable:
+    """Immutable column store for one margin snapshot."""
+
+    __slots__ = (
+        'project_ids', 'names', 'hours', 'budget', 'margin',
+        '_positions', '_upper_names', '_ranked', '_by_name'
+    )
+
+    def __init__(
+        self,
+        project_ids: np.ndarray,
+        names: List[str],
+        hours: np.ndarray,
+        budget: np.ndarray,
+        margin: np.ndarray
+    ):
+        self.project_ids = project_ids
+        self.names = names
+        self.hours = hours
+        self.budget = budget
+        self.margin = margin
+        self._positions = {name: position for position, name in enumerate(names)}
+        self._upper_names: Optional[np.ndarray] = None
+        # Projects with a computable margin, highest margin first (stable on ties)
+        valid = np.flatnonzero(~np.isnan(margin))
+        self._ranked = valid[np.argsort(-margin[valid], kind='stable')]
+        self._by_name: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]]) -> 'MarginTable':
+        """
+        Build a table from snapshot-shaped dicts.
+
+        Args:
+            rows: Dicts with project_id, project_name, total_hours, budget
+                and margin (None for NULL)
+        """
+        rows = list(rows)
+        return cls(
+            project_ids=np.array([row['project_id'] for row in rows], dtype=np.int64),
+            names=[sys.intern(row['project_name']) for row in rows],
+            hours=np.array([row['total_hours'] for row in rows], dtype=np.float64),
+            budget=np.array([row['budget'] for row in rows], dtype=np.float64),
+            margin=np.array(
+                [np.nan if row['margin'] is None else row['margin'] for row in rows],
+                dtype=np.float64
+            )
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def position(self, project_name: str) -> Optional[int]:
+        """Row position of a project, or None if it is not in the snapshot."""
+        return self._positions.get(project_name)
+
+    def row(self, position: int) -> Dict[str, Any]:
+        """One project as a snapshot-shaped dict."""
+        margin = float(self.margin[position])
+        return {
+            'project_id': int(self.project_ids[position]),
+            'project_name': self.names[position],
+            'total_hours': float(self.hours[position]),
+            'budget': float(self.budget[position]),
+            'margin': None if np.isnan(margin) else margin
+        }
+
+    def select(
+        self,
+        filters: Optional[MarginFilter] = None,
+        project_names: Optional[Iterable[str]] = None
+    ) -> np.ndarray:
+        """
+        Positions of the projects matching the filters, highest margin first.
+
+        Projects without a computable margin are never selected.
+
+        Args:
+            filters: Optional name, margin and hours filters
+            project_names: Optional set of projects to restrict to
+
+        Returns:
+            Array of row positions
+        """
+        ranked = self._ranked
+        if project_names is not None:
+            wanted = np.zeros(len(self.names), dtype=bool)
+            wanted[np.array(
+                [p for p in map(self._positions.get, project_names) if p is not None],
+                dtype=np.intp
+            )] = True
+            ranked = ranked[wanted[ranked]]
+        if not filters:
+            return ranked
+
+        mask = np.ones(len(ranked), dtype=bool)
+        margin = self.margin[ranked]
+        hours = self.hours[ranked]
+        if filters.min_margin is not None:
+            mask &= margin >= filters.min_margin
+        if filters.max_margin is not None:
+            mask &= margin <= filters.max_margin
+        if filters.min_hours is not None:
+            mask &= hours >= filters.min_hours
+        if filters.max_hours is not None:
+            mask &= hours <= filters.max_hours
+        if filters.project_name and filters.project_name.strip():
+            if self._upper_names is None:
+                self._upper_names = np.array([name.upper() for name in self.names], dtype=object)
+            needle = filters.project_name.strip().upper()
+            mask &= np.fromiter(
+                (needle in name for name in self._upper_names[ranked]),
+                dtype=bool,
+                count=len(ranked)
+            )
+        return ranked[mask]
+
+    def margin_rows(self, positions: np.ndarray) -> List[MarginRow]:
+        """MarginRow models for the given positions (for typed responses and events)."""
+        return [
+            MarginRow.model_construct(
+                projectName=self.names[position],
+                totalHours=hours,
+                budget=budget,
+                grossMarginPercentage=margin
+            )
+            for position, hours, budget, margin in zip(
+                positions.tolist(),
+                self.hours[positions].tolist(),
+                self.budget[positions].tolist(),
+                self.margin[positions].tolist()
+            )
+        ]
+
+    def to_json(self, positions: np.ndarray, fields: Optional[Iterable[str]] = None) -> bytes:
+        """
+        Encode the given rows as a JSON array of MarginRow objects.
+
+        Produces the same document FastAPI would for List[MarginRow],
+        without constructing or validating models. Only the requested
+        columns are materialized.
+
+        Args:
+            positions: Row positions to encode, in output order
+            fields: Subset of MARGIN_FIELDS to include (None = all)
+        """
+        selected = [field for field in MARGIN_FIELDS if fields is None or field in fields]
+        index = positions.tolist()
+        columns = {
+            'projectName': lambda: list(map(self.names.__getitem__, index)),
+            'totalHours': lambda: self.hours[positions].tolist(),
+            'budget': lambda: self.budget[positions].tolist(),
+            'grossMarginPercentage': lambda: self.margin[positions].tolist()
+        }
+        return self._encode_rows(selected, [columns[field]() for field in selected], len(index))
+
+    def projects_json(self, fields: Optional[Iterable[str]] = None) -> bytes:
+        """
+        Encode the project listing (ID, name, SOW) ordered by name.
+
+        Args:
+            fields: Subset of PROJECT_FIELDS to include (None = all)
+        """
+        if self._by_name is None:
+            self._by_name = np.array(
+                sorted(range(len(self.names)), key=self.names.__getitem__), dtype=np.intp
+            )
+        positions = self._by_name
+        selected = [field for field in PROJECT_FIELDS if fields is None or field in fields]
+        index = positions.tolist()
+        columns = {
+            'project_id': lambda: self.project_ids[positions].tolist(),
+            'project_name': lambda: list(map(self.names.__getitem__, index)),
+            'sow': lambda: self.budget[positions].tolist()
+        }
+        return self._encode_rows(selected, [columns[field]() for field in selected], len(index))
+
+    @staticmethod
+    def _encode_rows(fields: List[str], columns: List[List[Any]], count: int) -> bytes:
+        """orjson-encode parallel columns as a list of row objects."""
+        if not fields:
+            return orjson.dumps([{}] * count)
+        return orjson.dumps([dict(zip(fields, values)) for values in zip(*columns)])
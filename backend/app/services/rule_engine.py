@@ -0,0 +1,179 @@
+"""
+Validation Rule Engine for Gross Calculator uploads
+
+ValidationRuleEngine compiles the declarative validation_rules of
+DataCleaningService into vectorized checks. Each check turns a column into
+a boolean "failing" mask with pandas/numpy operations, so a chunk is
+validated in one pass per rule without looping over rows; issue records
+are only built for the rows that fail.
+
+Supported rule keys: required, type ('numeric' or 'date'), min, max,
+max_date ('today' or an ISO date), max_length, pattern, precision
+((digits, scale) as for Oracle NUMBER) and unique.
+"""
+
+import re
+from datetime import date
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def first_occurrences(hashes: np.ndarray, seen: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mask of hashes not seen earlier in this chunk or in previous chunks.
+    
+    Args:
+        hashes: 64-bit hashes of the chunk's rows or keys
+        seen: Sorted hashes from previous chunks
+        
+    Returns:
+        Tuple of (first-occurrence mask, updated sorted array of seen hashes)
+    """
+    fresh = ~pd.Series(hashes).duplicated().to_numpy()
+    if len(seen):
+        positions = np.searchsorted(seen, hashes)
+        positions[positions == len(seen)] = 0
+        fresh &= seen[positions] != hashes
+    # Two sorted runs: the stable sort (timsort) merges them in linear time
+    merged = np.concatenate([seen, np.sort(hashes[fresh])])
+    merged.sort(kind='stable')
+    return fresh, merged
+
+
+class RuleCheck(NamedTuple):
+    """One compiled rule: test(values, state) returns True where a row fails."""
+    column: str
+    rule: str
+    error: str
+    test: Callable[[pd.Series, Dict[str, Any]], np.ndarray]
+    # Whether the check depends on earlier chunks of the file (e.g. unique)
+    stateful: bool = False
+
+
+class ValidationRuleEngine:
+    """Vectorized evaluator for one file type's validation rules."""
+
+    def __init__(self, rules: Dict[str, Dict[str, Any]]):
+        """
+        Args:
+            rules: column -> rule dict, as in DataCleaningService.validation_rules
+        """
+        self.checks: List[RuleCheck] = []
+        for column, rule in rules.items():
+            self.checks.extend(self._compile(column, rule))
+
+    def evaluate(
+        self,
+        frame: pd.DataFrame,
+        state: Optional[Dict[str, Any]] = None,
+        stateful: Optional[bool] = None
+    ) -> Tuple[np.ndarray, List[Tuple[RuleCheck, np.ndarray]]]:
+        """
+        Run every check against a chunk.
+        
+        Checks for columns the frame does not have are skipped, and NULLs
+        only fail the 'required' rule.
+        
+        Args:
+            frame: Cleaned chunk (coerced dtypes)
+            state: Per-file dict carried between chunks of one file (used by
+                'unique'); pass the same dict for every chunk
+            stateful: Only run stateless (False) or stateful (True) checks,
+                so chunks can be validated independently and the stateful
+                checks applied afterwards in file order (None = all)
+            
+        Returns:
+            Tuple of (mask of rows failing any rule, [(check, failing mask)]
+            for the checks that failed at least one row)
+        """
+        state = {} if state is None else state
+        invalid = np.zeros(len(frame), dtype=bool)
+        failures = []
+        for check in self.checks:
+            if check.column not in frame.columns or stateful not in (None, check.stateful):
+                continue
+            failing = np.asarray(check.test(frame[check.column], state), dtype=bool)
+            if failing.any():
+                failures.append((check, failing))
+                invalid |= failing
+        return invalid, failures
+
+    def _compile(self, column: str, rule: Dict[str, Any]) -> List[RuleCheck]:
+        checks = []
+        
+        def add(
+            name: str,
+            error: str,
+            test: Callable[[pd.Series, Dict[str, Any]], np.ndarray],
+            stateful: bool = False
+        ) -> None:
+            checks.append(RuleCheck(column, name, error, test, stateful))
+        
+        if rule.get('required'):
+            add('required', 'Missing required value', lambda values, state: values.isna().to_numpy())
+        
+        kind = rule.get('type')
+        if kind == 'numeric':
+            add('type', f"{column} must be numeric", lambda values, state: (
+                np.zeros(len(values), dtype=bool) if pd.api.types.is_numeric_dtype(values)
+                else (values.notna() & pd.to_numeric(values, errors='coerce').isna()).to_numpy()
+            ))
+        elif kind == 'date':
+            add('type', f"{column} must be a date", lambda values, state: (
+                np.zeros(len(values), dtype=bool) if pd.api.types.is_datetime64_any_dtype(values)
+                else (values.notna() & pd.to_datetime(values, errors='coerce', format='mixed').isna()).to_numpy()
+            ))
+        
+        if 'min' in rule:
+            minimum = rule['min']
+            add('min', f"{column} must be at least {minimum}", lambda values, state: (
+                pd.to_numeric(values, errors='coerce') < minimum
+            ).fillna(False).to_numpy())
+        if 'max' in rule:
+            maximum = rule['max']
+            add('max', f"{column} must be at most {maximum}", lambda values, state: (
+                pd.to_numeric(values, errors='coerce') > maximum
+            ).fillna(False).to_numpy())
+        
+        if 'max_date' in rule:
+            limit = rule['max_date']
+            add('max_date', f"{column} is after {limit}", lambda values, state: (
+                pd.to_datetime(values, errors='coerce')
+                > pd.Timestamp(date.today() if limit == 'today' else limit)
+            ).fillna(False).to_numpy())
+        
+        if 'max_length' in rule:
+            length = rule['max_length']
+            add('max_length', f"{column} is longer than {length} characters", lambda values, state: (
+                values.astype('string').str.len() > length
+            ).fillna(False).to_numpy())
+        
+        if 'pattern' in rule:
+            pattern = re.compile(rule['pattern'])
+            add('pattern', f"{column} does not match {rule['pattern']}", lambda values, state: (
+                ~values.astype('string').str.match(pattern).fillna(True)
+            ).to_numpy(dtype=bool))
+        
+        if 'precision' in rule:
+            digits, scale = rule['precision']
+            bound = 10.0 ** (digits - scale)
+            add('precision', f"{column} does not fit NUMBER({digits},{scale})", lambda values, state: (
+                pd.to_numeric(values, errors='coerce').abs().round(scale) >= bound
+            ).fillna(False).to_numpy())
+        
+        if rule.get('unique'):
+            def duplicated(values: pd.Series, state: Dict[str, Any]) -> np.ndarray:
+                present = values.notna().to_numpy()
+                hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+                fresh, state[column] = first_occurrences(
+                    hashes[present], state.get(column, np.empty(0, dtype=np.uint64))
+                )
+                failing = np.zeros(len(values), dtype=bool)
+                failing[present] = ~fresh
+                return failing
+            
+            add('unique', f"Duplicate {column}", duplicated, stateful=True)
+        
+        return checks
@@ -0,0 +1,167 @@
+"""
+Refresh Scheduler Service for Gross Calculator
+
+This service keeps the margin caches warm:
+- Warm-up at application startup, before the first request is served
+- Periodic refresh on a configurable cadence
+- Immediate refresh after each ingest batch, followed by a margin
+  validation run off the request path
+- At most one refresh at a time across workers (Oracle row lock)
+"""
+
+import asyncio
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Generator, Optional
+
+import oracledb
+
+from app.core.config import settings
+from app.db.oracle import get_db_connection
+from app.services.margin_service import MarginCalculationService
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshScheduler:
+    """Lifespan-managed background refresher for the margin caches."""
+
+    LOCK_NAME = 'margin_refresh'
+
+    def __init__(self):
+        self.interval = settings.MARGIN_REFRESH_INTERVAL
+        self.lock_timeout = settings.MARGIN_REFRESH_LOCK_TIMEOUT
+        self.last_refresh: Optional[datetime] = None
+        self._service: Optional[MarginCalculationService] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._local_lock = threading.Lock()
+        self._validate_pending = False
+
+    async def start(self, service: MarginCalculationService) -> None:
+        """
+        Warm the caches once and start the background refresh loop.
+
+        Args:
+            service: Margin service instance serving API requests
+        """
+        self._service = service
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        await asyncio.to_thread(self.run_once)
+        self._task = self._loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background refresh loop."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def trigger(self, validate: bool = False) -> None:
+        """
+        Request an immediate refresh (e.g. after an ingest batch).
+
+        Safe to call from worker threads; a no-op before start().
+
+        Args:
+            validate: Also run validate_margin_calculations after the refresh
+        """
+        if self._loop is None or self._wake is None or self._loop.is_closed():
+            return
+        if validate:
+            self._validate_pending = True
+        self._loop.call_soon_threadsafe(self._wake.set)
+
+    def run_once(self) -> bool:
+        """
+        Refresh the margin caches if no other refresh is running.
+
+        Returns:
+            True if a refresh ran and succeeded, False otherwise
+        """
+        if self._service is None or not self._local_lock.acquire(blocking=False):
+            return False
+        try:
+            with self._cluster_lock() as acquired:
+                if not acquired:
+                    logger.info("Margin refresh skipped: lock held by another worker")
+                    return False
+                refreshed = self._service.warm_caches()
+                if refreshed:
+                    self.last_refresh = datetime.now()
+                return refreshed
+        except Exception as e:
+            logger.error(f"Scheduled margin refresh failed: {e}")
+            return False
+        finally:
+            self._local_lock.release()
+
+    def run_validation(self) -> None:
+        """Cross-check stored margins within MARGIN_VALIDATION_TIME_BUDGET and log the outcome."""
+        if self._service is None:
+            return
+        result = self._service.validate_margin_calculations()
+        summary = result.get('summary', {})
+        if result['status'] == 'failed':
+            logger.error(f"Margin validation failed: {result.get('error')}")
+        elif result['issues_found']:
+            logger.warning(
+                f"Margin validation found {len(result['issues_found'])} issues "
+                f"({summary.get('projects_checked', 0)} projects checked, status {result['status']})"
+            )
+        else:
+            logger.info(
+                f"Margin validation passed ({summary.get('projects_checked', 0)} projects checked, "
+                f"status {result['status']})"
+            )
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await asyncio.to_thread(self.run_once)
+            if self._validate_pending:
+                self._validate_pending = False
+                await asyncio.to_thread(self.run_validation)
+
+    @contextmanager
+    def _cluster_lock(self) -> Generator[bool, None, None]:
+        """
+        Hold the REFRESH_LOCK row for the duration of a refresh.
+
+        Workers wait up to MARGIN_REFRESH_LOCK_TIMEOUT for each other, so
+        refreshes are serialized rather than skipped. The lock is released
+        when the transaction is rolled back.
+        """
+        with get_db_connection() as connection:
+            cursor = connection.cursor()
+            try:
+                try:
+                    cursor.execute(
+                        "SELECT LOCK_NAME FROM REFRESH_LOCK WHERE LOCK_NAME = :lock_name "
+                        f"FOR UPDATE WAIT {int(self.lock_timeout)}",
+                        {'lock_name': self.LOCK_NAME}
+                    )
+                    acquired = cursor.fetchone() is not None
+                except oracledb.DatabaseError as e:
+                    # ORA-30006: resource busy; acquire with WAIT timeout expired
+                    logger.warning(f"Could not acquire {self.LOCK_NAME} lock: {e}")
+                    acquired = False
+                yield acquired
+            finally:
+                connection.rollback()
+                cursor.close()
+
+
+# Process-wide scheduler started from the application lifespan
+refresh_scheduler = RefreshScheduler()
@@ -0,0 +1,175 @@
+"""
+Project Search Service for Gross Calculator
+
+This service keeps an in-memory index over project names for:
+- Autocomplete (prefix of the name or of any word in it)
+- Typo-tolerant suggestions ranked by trigram similarity
+- "Did you mean" answers without scanning PROJECT
+
+The index is rebuilt from the margin snapshot whenever a new data version
+is read, so it follows ingest without extra queries.
+"""
+
+import bisect
+import logging
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+
+def _normalize(name: str) -> str:
+    """Lower-case a name and collapse punctuation and whitespace to single spaces."""
+    return _NON_ALNUM.sub(' ', name.casefold()).strip()
+
+
+def _trigrams(normalized: str) -> FrozenSet[str]:
+    """Word trigrams padded like pg_trgm ('  w', ' wo', 'wor', 'ord', 'rd ')."""
+    grams = set()
+    for word in normalized.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class ProjectNameIndex:
+    """Prefix and trigram index over project names."""
+
+    # Ranking bands: exact > name prefix > word prefix > fuzzy match
+    EXACT_SCORE = 1.0
+    PREFIX_SCORE = 0.9
+    WORD_PREFIX_SCORE = 0.8
+    FUZZY_WEIGHT = 0.75
+
+    def __init__(self, min_similarity: float = 0.3):
+        self.min_similarity = min_similarity
+        self.version: Optional[str] = None
+        self._lock = threading.Lock()
+        self._index: Dict[str, Any] = self._build([])
+
+    @property
+    def size(self) -> int:
+        return len(self._index['names'])
+
+    def rebuild(self, projects: Iterable[Tuple[Any, str]], version: Optional[str] = None) -> None:
+        """
+        Replace the index contents.
+
+        Readers keep using the previous index until the new one is swapped in.
+
+        Args:
+            projects: (project_id, project_name) pairs
+            version: Data version the names were read at
+        """
+        index = self._build(projects)
+        with self._lock:
+            self._index = index
+            self.version = version
+        logger.info(f"Project search index rebuilt ({len(index['names'])} projects)")
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Rank project names against a partial or misspelled query.
+
+        Args:
+            query: Text typed by the user
+            limit: Maximum number of suggestions
+
+        Returns:
+            List of dicts with project_id, project_name and score (0-1),
+            best match first
+        """
+        normalized = _normalize(query or '')
+        if not normalized or limit <= 0:
+            return []
+
+        index = self._index
+        scores: Dict[int, float] = {}
+
+        # Prefix matches on the whole name or any word in it
+        keys = index['prefix_keys']
+        position = bisect.bisect_left(keys, (normalized,))
+        while position < len(keys) and keys[position][0].startswith(normalized):
+            _, offset, entry = keys[position]
+            if offset == 0:
+                score = self.EXACT_SCORE if index['normalized'][entry] == normalized else self.PREFIX_SCORE
+            else:
+                score = self.WORD_PREFIX_SCORE
+            scores[entry] = max(scores.get(entry, 0.0), score)
+            position += 1
+
+        # Fuzzy matches: trigram Jaccard similarity over the posting lists
+        query_grams = _trigrams(normalized)
+        if query_grams:
+            shared = Counter()
+            for gram in query_grams:
+                shared.update(index['postings'].get(gram, ()))
+            for entry, common in shared.items():
+                similarity = common / (len(query_grams) + len(index['trigrams'][entry]) - common)
+                if similarity >= self.min_similarity:
+                    scores[entry] = max(scores.get(entry, 0.0), similarity * self.FUZZY_WEIGHT)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], index['names'][item[0]]))
+        return [
+            {
+                'project_id': index['ids'][entry],
+                'project_name': index['names'][entry],
+                'score': round(score, 3)
+            }
+            for entry, score in ranked[:limit]
+        ]
+
+    def find(self, name: str) -> Optional[str]:
+        """
+        Resolve a name ignoring case, punctuation and extra whitespace.
+
+        Returns:
+            The stored project name, or None if there is no such project
+        """
+        entry = self._index['by_normalized'].get(_normalize(name or ''))
+        return None if entry is None else self._index['names'][entry]
+
+    def _build(self, projects: Iterable[Tuple[Any, str]]) -> Dict[str, Any]:
+        ids: List[Any] = []
+        names: List[str] = []
+        normalized: List[str] = []
+        trigrams: List[FrozenSet[str]] = []
+        postings: Dict[str, List[int]] = {}
+        prefix_keys: List[Tuple[str, int, int]] = []
+        by_normalized: Dict[str, int] = {}
+
+        for project_id, name in projects:
+            if not name:
+                continue
+            entry = len(names)
+            norm = _normalize(name)
+            grams = _trigrams(norm)
+            ids.append(project_id)
+            names.append(name)
+            normalized.append(norm)
+            trigrams.append(grams)
+            by_normalized.setdefault(norm, entry)
+            for gram in grams:
+                postings.setdefault(gram, []).append(entry)
+            prefix_keys.append((norm, 0, entry))
+            for match in re.finditer(r' (?=\S)', norm):
+                prefix_keys.append((norm[match.end():], match.end(), entry))
+
+        prefix_keys.sort()
+        return {
+            'ids': ids,
+            'names': names,
+            'normalized': normalized,
+            'trigrams': trigrams,
+            'postings': postings,
+            'prefix_keys': prefix_keys,
+            'by_normalized': by_normalized
+        }
+
+
+# Process-wide index shared by the margin service and the search route
+project_search = ProjectNameIndex()
@@ -0,0 +1,144 @@
+"""
+Margin Statistics Service for Gross Calculator
+
+This service keeps distribution statistics of project margins in memory:
+- Histogram counts per margin bucket
+- Percentiles (p10/p50/p90) over a sorted margin list
+- Negative and NULL margin counts
+
+Statistics are updated per affected project after each ingest batch, so
+serving them never requires a full-table aggregate.
+"""
+
+import logging
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional, Any, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+# Lower edges of the margin buckets above the negative bucket
+DEFAULT_BUCKET_EDGES = (0.0, 20.0, 40.0, 60.0)
+
+
+class MarginDistributionStats:
+    """Incrementally maintained margin histogram and percentiles."""
+
+    def __init__(self, bucket_edges: Sequence[float] = DEFAULT_BUCKET_EDGES):
+        self.bucket_edges = tuple(bucket_edges)
+        self._lock = threading.Lock()
+        self._margins: Dict[str, Optional[float]] = {}
+        self._sorted: List[float] = []
+        self._counts: List[int] = [0] * (len(self.bucket_edges) + 1)
+        self.version: Optional[str] = None
+        self.loaded = False
+
+    def replace_all(self, margins: Dict[str, Optional[float]], version: Optional[str] = None) -> None:
+        """
+        Replace the tracked margins with a full snapshot.
+
+        Args:
+            margins: Margin percentage by project name (None for NULL margins)
+            version: Data version (ingest batch) the snapshot reflects
+        """
+        with self._lock:
+            self._margins = {}
+            self._sorted = []
+            self._counts = [0] * (len(self.bucket_edges) + 1)
+            for project_name, margin in margins.items():
+                self._set(project_name, margin)
+            self._sorted.sort()
+            self.version = version
+            self.loaded = True
+
+    def apply(
+        self,
+        margins: Dict[str, Optional[float]],
+        removed: Sequence[str] = (),
+        version: Optional[str] = None
+    ) -> None:
+        """
+        Update the statistics for the projects affected by a batch.
+
+        Args:
+            margins: New margin percentage by project name
+            removed: Projects that no longer exist
+            version: Data version (ingest batch) after the update
+        """
+        with self._lock:
+            for project_name in removed:
+                self._unset(project_name)
+            for project_name, margin in margins.items():
+                self._unset(project_name)
+                self._set(project_name, margin, keep_sorted=True)
+            if version is not None:
+                self.version = version
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the current distribution.
+
+        Returns:
+            Dictionary with buckets, percentiles and counts
+        """
+        with self._lock:
+            values = self._sorted
+            return {
+                'buckets': [
+                    {
+                        'label': self._bucket_label(index),
+                        'min': self.bucket_edges[index - 1] if index > 0 else None,
+                        'max': self.bucket_edges[index] if index < len(self.bucket_edges) else None,
+                        'count': count
+                    }
+                    for index, count in enumerate(self._counts)
+                ],
+                'p10': _percentile(values, 10),
+                'p50': _percentile(values, 50),
+                'p90': _percentile(values, 90),
+                'negativeCount': bisect_left(values, 0.0),
+                'nullMarginCount': len(self._margins) - len(values),
+                'totalProjects': len(self._margins),
+                'dataVersion': self.version
+            }
+
+    def _set(self, project_name: str, margin: Optional[float], keep_sorted: bool = False) -> None:
+        self._margins[project_name] = margin
+        if margin is None:
+            return
+        self._counts[bisect_right(self.bucket_edges, margin)] += 1
+        if keep_sorted:
+            insort(self._sorted, margin)
+        else:
+            self._sorted.append(margin)
+
+    def _unset(self, project_name: str) -> None:
+        if project_name not in self._margins:
+            return
+        margin = self._margins.pop(project_name)
+        if margin is None:
+            return
+        self._counts[bisect_right(self.bucket_edges, margin)] -= 1
+        del self._sorted[bisect_left(self._sorted, margin)]
+
+    def _bucket_label(self, index: int) -> str:
+        if index == 0:
+            return f"<{self.bucket_edges[0]:g}%"
+        if index == len(self.bucket_edges):
+            return f"{self.bucket_edges[-1]:g}%+"
+        return f"{self.bucket_edges[index - 1]:g}-{self.bucket_edges[index]:g}%"
+
+
+def _percentile(values: List[float], pct: float) -> Optional[float]:
+    """Linear-interpolated percentile of an already sorted list."""
+    if not values:
+        return None
+    rank = (len(values) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+    return round(values[low] + (values[high] - values[low]) * (rank - low), 2)
+
+
+# Process-wide distribution shared by the margin and load services
+margin_distribution = MarginDistributionStats()
@@ -0,0 +1,100 @@
+"""
+Data Version Service for Gross Calculator
+
+The data version is the BATCH_ID of the latest completed ingest batch in
+LOAD_BATCH. It is used to:
+- Build ETags for the margin and project endpoints
+- Send Last-Modified from the batch completion time
+- Key caches that must change whenever new data is loaded
+
+The version is cached in-process for a short TTL, so conditional requests
+can be answered without a database round trip.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from app.core.config import settings
+from app.db.oracle import execute_query
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DataVersion:
+    """Identity and completion time of the latest loaded batch."""
+
+    batch_id: Optional[str]
+    loaded_at: Optional[datetime]
+
+
+class DataVersionTracker:
+    """Tracks the current data version with a short-lived local cache."""
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        self.ttl_seconds = settings.DATA_VERSION_TTL if ttl_seconds is None else ttl_seconds
+        self._lock = threading.Lock()
+        self._version = DataVersion(batch_id=None, loaded_at=None)
+        self._checked_at: Optional[float] = None
+
+    def current(self) -> DataVersion:
+        """
+        Get the current data version.
+
+        Re-reads LOAD_BATCH at most once per TTL; on database errors the
+        last known version is kept.
+
+        Returns:
+            Current DataVersion
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._checked_at is not None and now - self._checked_at < self.ttl_seconds:
+                return self._version
+
+        try:
+            rows = execute_query(
+                """
+                SELECT BATCH_ID, COMPLETED_AT
+                FROM LOAD_BATCH
+                WHERE STATUS IN ('completed', 'completed_with_errors')
+                ORDER BY BATCH_SEQ DESC
+                FETCH FIRST 1 ROWS ONLY
+                """
+            )
+            version = (
+                DataVersion(batch_id=rows[0]['BATCH_ID'], loaded_at=rows[0]['COMPLETED_AT'])
+                if rows else DataVersion(batch_id=None, loaded_at=None)
+            )
+        except Exception as e:
+            logger.error(f"Error reading data version: {e}")
+            version = self._version
+
+        with self._lock:
+            self._version = version
+            self._checked_at = now
+            return version
+
+    def bump(self, batch_id: str, loaded_at: Optional[datetime] = None) -> DataVersion:
+        """
+        Record a newly completed batch in this process without waiting for the TTL.
+
+        Args:
+            batch_id: Batch that was just loaded
+            loaded_at: Batch completion time
+
+        Returns:
+            The new DataVersion
+        """
+        with self._lock:
+            self._version = DataVersion(batch_id=batch_id, loaded_at=loaded_at or datetime.now())
+            self._checked_at = time.monotonic()
+            return self._version
+
+
+# Process-wide data version tracker
+data_version = DataVersionTracker()
@@ -0,0 +1,95 @@
+"""
+Upload reader engine benchmark for Gross Calculator
+
+Generates TimeCard workbooks and CSVs of increasing size and measures how
+fast each reader engine streams them through DataCleaningService.read_chunks.
+
+Usage (from backend/):
+    python -m benchmarks.bench_readers
+    python -m benchmarks.bench_readers --rows 10000 100000 --formats xlsx
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+from app.services.cleaning_service import DataCleaningService
+
+HEADER = ['EMPLOYEE_ID', 'EMPLOYEE_NAME', 'DAILY_DATE', 'TIME_WORKED', 'PROJECT_NAME', 'TIME_CARD_STATE', 'TASK_TYPE']
+
+
+def generate_timecards(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Synthetic TimeCard rows with realistic cardinalities."""
+    rng = np.random.default_rng(seed)
+    employees = rng.integers(1, 5000, rows)
+    start = date(2024, 1, 1)
+    return pd.DataFrame({
+        'EMPLOYEE_ID': [f"E{n:05d}" for n in employees],
+        'EMPLOYEE_NAME': [f"Employee {n}" for n in employees],
+        'DAILY_DATE': [start + timedelta(days=int(n)) for n in rng.integers(0, 365, rows)],
+        'TIME_WORKED': rng.integers(1, 20, rows) / 2,
+        'PROJECT_NAME': [f"Project {n}" for n in rng.integers(1, 400, rows)],
+        'TIME_CARD_STATE': rng.choice(['APPROVED', 'SUBMITTED', 'REJECTED'], rows),
+        'TASK_TYPE': rng.choice(['DEVELOPMENT', 'TESTING', 'MEETING', 'SUPPORT'], rows)
+    }, columns=HEADER)
+
+
+def write_file(frame: pd.DataFrame, path: Path) -> None:
+    if path.suffix == '.csv':
+        frame.to_csv(path, index=False)
+        return
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet('TimeCard')
+    sheet.append(HEADER)
+    for row in frame.itertuples(index=False):
+        sheet.append(list(row))
+    workbook.save(path)
+
+
+def benchmark(rows_list: List[int], formats: List[str], work_dir: Path, repeat: int) -> None:
+    service = DataCleaningService()
+    print(f"{'file':<24}{'engine':<10}{'seconds':>10}{'rows/s':>14}")
+    for rows in rows_list:
+        frame = None
+        for fmt in formats:
+            path = work_dir / f"timecard_{rows}.{fmt}"
+            if not path.exists():
+                frame = generate_timecards(rows) if frame is None else frame
+                write_file(frame, path)
+            
+            for engine in service.reader_engines[path.suffix]:
+                try:
+                    service.select_reader_engines(path, engine)
+                    best = float('inf')
+                    for _ in range(repeat):
+                        started = time.perf_counter()
+                        read = sum(len(chunk) for chunk in service.read_chunks(path, engine=engine))
+                        best = min(best, time.perf_counter() - started)
+                except Exception as e:
+                    print(f"{path.name:<24}{engine:<10}{'skipped':>10}  ({e})")
+                    continue
+                print(f"{path.name:<24}{engine:<10}{best:>10.2f}{read / best:>14,.0f}")
+            print(f"{path.name:<24}{'auto':<10}{' -> ' + service.select_reader_engines(path)[0]:>10}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare upload reader engines")
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--formats', nargs='+', default=['xlsx', 'csv'], choices=['xlsx', 'csv'])
+    parser.add_argument('--work-dir', type=Path, default=Path(tempfile.gettempdir()) / 'gross_calculator_bench')
+    parser.add_argument('--repeat', type=int, default=1, help="Runs per engine (best time is reported)")
+    args = parser.parse_args()
+    
+    args.work_dir.mkdir(parents=True, exist_ok=True)
+    benchmark(args.rows, args.formats, args.work_dir, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,13 @@
+"""Shared pytest setup for the backend tests."""
+
+import os
+
+# Settings fields without defaults; the tests never connect to Oracle
+for name, value in (
+    ('ORACLE_HOST', 'localhost'),
+    ('ORACLE_SERVICE', 'test'),
+    ('ORACLE_USER', 'test'),
+    ('ORACLE_PASSWORD', 'test'),
+    ('JWT_SECRET', 'test'),
+):
+    os.environ.setdefault(name, value)
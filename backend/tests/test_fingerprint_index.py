@@ -0,0 +1,126 @@
+"""Tests for the TimeCard fingerprint index."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.fingerprint_index import CHANGED, DUPLICATE, NEW, TimecardFingerprintIndex
+
+TEXT_DTYPES = ['object', 'category', 'string[pyarrow]']
+TEXT_COLUMNS = ['EMPLOYEE_ID', 'PROJECT_NAME', 'TIME_CARD_STATE', 'TASK_TYPE']
+
+
+def timecards(text_dtype: str = 'object', hours=(8.0, 7.5, 4.0)) -> pd.DataFrame:
+    df = pd.DataFrame({
+        'EMPLOYEE_ID': ['E1', 'E2', 'E1'],
+        'PROJECT_NAME': ['Alpha', 'Alpha', 'Beta'],
+        'DAILY_DATE': pd.to_datetime(['2024-01-05', '2024-01-06', '2024-02-01']),
+        'TIME_WORKED': list(hours),
+        'TIME_CARD_STATE': ['APPROVED', None, 'SUBMITTED'],
+        'TASK_TYPE': ['DEV', 'DEV', None]
+    })
+    return df.astype({column: text_dtype for column in TEXT_COLUMNS})
+
+
+@pytest.fixture
+def stored_rows():
+    """TIMECARD rows that missing month files are built from (empty by default)."""
+    return []
+
+
+@pytest.fixture
+def index(tmp_path, stored_rows, monkeypatch):
+    index = TimecardFingerprintIndex(str(tmp_path))
+
+    def read_month(month):
+        for rows in stored_rows:
+            yield rows[pd.to_datetime(rows['DAILY_DATE']).to_numpy(dtype='datetime64[M]') == month]
+
+    monkeypatch.setattr(index, '_read_month', read_month)
+    return index
+
+
+def test_rows_not_in_timecard_are_new(index):
+    assert index.classify(timecards()).tolist() == [NEW, NEW, NEW]
+
+
+def test_missing_month_is_built_from_timecard(index, stored_rows, tmp_path):
+    # Rows as read back from TIMECARD_DETAIL_VIEW: Oracle NUMBER and DATE values
+    stored = timecards()
+    stored['DAILY_DATE'] = stored['DAILY_DATE'].dt.to_pydatetime()
+    stored_rows.append(stored.iloc[:2])
+
+    upload = timecards(hours=(8.0, 6.0, 4.0))
+
+    assert index.classify(upload).tolist() == [DUPLICATE, CHANGED, NEW]
+    assert (tmp_path / '2024-01.npy').exists()
+    assert np.load(tmp_path / '2024-02.npy').shape == (2, 0)
+
+
+def test_hours_compare_at_stored_precision(index):
+    assert index.record(timecards(hours=(8.25, 7.5, 4.0)))
+
+    assert index.classify(timecards(hours=(8.2, 7.5, 4.0))).tolist() == [DUPLICATE] * 3
+
+
+def test_failed_record_invalidates_months(index, tmp_path, monkeypatch):
+    assert index.record(timecards())
+
+    def fail(*args):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(index, '_write', fail)
+
+    assert not index.record(timecards(hours=(8.0, 6.0, 4.0)))
+    assert not list(tmp_path.glob('*.npy'))
+
+
+@pytest.mark.parametrize('recorded_dtype', TEXT_DTYPES)
+@pytest.mark.parametrize('classified_dtype', TEXT_DTYPES)
+def test_round_trip_across_dtypes(index, recorded_dtype, classified_dtype):
+    assert index.record(timecards(recorded_dtype))
+
+    reuploaded = timecards(classified_dtype)
+    reuploaded['TIME_WORKED'] = reuploaded['TIME_WORKED'].astype('float32')
+    reuploaded['DAILY_DATE'] = reuploaded['DAILY_DATE'].astype('datetime64[s]')
+
+    assert index.classify(reuploaded).tolist() == [DUPLICATE, DUPLICATE, DUPLICATE]
+
+
+@pytest.mark.parametrize('text_dtype', TEXT_DTYPES)
+def test_changed_and_new_rows(index, text_dtype):
+    assert index.record(timecards(text_dtype))
+
+    upload = pd.concat(
+        [timecards(hours=(8.0, 6.0, 4.0)), timecards().iloc[:1].assign(EMPLOYEE_ID='E9')],
+        ignore_index=True
+    ).astype({column: text_dtype for column in TEXT_COLUMNS})
+
+    assert index.classify(upload).tolist() == [DUPLICATE, CHANGED, DUPLICATE, NEW]
+
+
+def test_record_replaces_changed_content(index):
+    assert index.record(timecards())
+    changed = timecards(hours=(8.0, 6.0, 4.0))
+    assert index.classify(changed).tolist() == [DUPLICATE, CHANGED, DUPLICATE]
+
+    assert index.record(changed)
+
+    assert index.classify(changed).tolist() == [DUPLICATE, DUPLICATE, DUPLICATE]
+    assert index.classify(timecards()).tolist() == [DUPLICATE, CHANGED, DUPLICATE]
+
+
+def test_one_file_per_month(index, tmp_path):
+    assert index.record(timecards())
+
+    assert sorted(path.name for path in tmp_path.glob('*.npy')) == ['2024-01.npy', '2024-02.npy']
+    january = np.load(tmp_path / '2024-01.npy')
+    assert january.shape == (2, 2)
+    assert (january[0][1:] >= january[0][:-1]).all()
+
+
+def test_empty_frame(index):
+    empty = timecards().iloc[:0]
+
+    assert index.record(empty)
+    assert index.classify(empty).tolist() == []
@@ -58,21 +58,14 @@ CREATE OR REPLACE PACKAGE BODY margin_calc_pkg_02 IS
     ) RETURN NUMBER IS
         v_gross NUMBER;
     BEGIN
-        WITH project_costs AS (
-            SELECT 
-                t.project_name,
-                -- Decrypt CTC and calculate hourly rate, then multiply by time worked
-                SUM(t.time_worked * (f_decrypt_ctc(e.ctc) / 2112)) AS total_cost
-            FROM timecard t
-            JOIN employee e ON t.employee_id = e.employee_id
-            GROUP BY t.project_name
-        )
-        SELECT ROUND(((p.sow - SUM(pc.total_cost)) / p.sow) * 100, 2)
+        -- Resolve the project once, then join timecards on integer keys
+        SELECT ROUND(((p.sow - SUM(t.time_worked * (f_decrypt_ctc(e.ctc) / 2112))) / p.sow) * 100, 2)
         INTO v_gross
-        FROM project_costs pc
-        JOIN project p ON pc.project_name = p.project_name
-        WHERE pc.project_name = p_name
-        GROUP BY pc.project_name, p.sow;
+        FROM project p
+        JOIN timecard t ON t.project_id = p.project_id
+        JOIN employee e ON e.employee_key = t.employee_key
+        WHERE p.project_name = p_name
+        GROUP BY p.project_id, p.sow;
         
         RETURN v_gross;
     END f_get_gross_margin;
@@ -106,27 +99,19 @@ CREATE OR REPLACE PACKAGE BODY margin_calc_pkg_02 IS
                 DECLARE
                     v_cnt NUMBER := 0;
                 BEGIN
+                    -- Console helper only; the API answers "did you mean" from
+                    -- its in-memory project name index (GET /projects/search)
                     DBMS_OUTPUT.put_line('SUGGESTED NAME: ');
                     FOR i IN (
                         SELECT project_name
                         FROM project
                         WHERE UPPER(project_name) LIKE '%' || UPPER(v_project_name) || '%'
+                        FETCH FIRST 10 ROWS ONLY
                     ) LOOP
                         v_cnt := v_cnt + 1;
                         DBMS_OUTPUT.put_line(v_cnt || '. ' || i.project_name);
                     END LOOP;
                     
-                    IF v_cnt = 0 THEN
-                        FOR i IN (
-                            SELECT project_name
-                            FROM project
-                            WHERE UPPER(project_name) LIKE '%' || UPPER(v_project_name) || '%'
-                        ) LOOP
-                            v_cnt := v_cnt + 1;
-                            DBMS_OUTPUT.put_line(v_cnt || '. ' || i.project_name);
-                        END LOOP;
-                    END IF;
-                    
                     IF v_cnt = 0 THEN
                         RAISE NO_DATA_FOUND;
                     END IF;
@@ -0,0 +1,73 @@
+-- Migration 001: integer surrogate keys for TIMECARD joins
+--
+-- Replaces TIMECARD.EMPLOYEE_ID / EMPLOYEE_NAME / PROJECT_NAME with
+-- EMPLOYEE_KEY and PROJECT_ID so margin and cube queries join on NUMBER
+-- columns instead of VARCHAR2 names. Run once against an existing
+-- schema.sql deployment, then re-run functions.sql.
+
+-- 1. Surrogate key on EMPLOYEE (existing rows are numbered by the identity)
+ALTER TABLE EMPLOYEE ADD (EMPLOYEE_KEY NUMBER GENERATED BY DEFAULT AS IDENTITY);
+ALTER TABLE EMPLOYEE MODIFY (EMPLOYEE_KEY NOT NULL);
+ALTER TABLE EMPLOYEE ADD CONSTRAINT uk_employee_key UNIQUE (EMPLOYEE_KEY);
+
+-- 2. Key columns on TIMECARD, backfilled from the name columns
+ALTER TABLE TIMECARD ADD (EMPLOYEE_KEY NUMBER, PROJECT_ID NUMBER);
+
+MERGE INTO TIMECARD t
+USING EMPLOYEE e
+ON (t.EMPLOYEE_ID = e.EMPLOYEE_ID)
+WHEN MATCHED THEN UPDATE SET t.EMPLOYEE_KEY = e.EMPLOYEE_KEY;
+
+MERGE INTO TIMECARD t
+USING PROJECT p
+ON (t.PROJECT_NAME = p.PROJECT_NAME)
+WHEN MATCHED THEN UPDATE SET t.PROJECT_ID = p.PROJECT_ID;
+
+-- Rows that match no employee or project cannot be costed. They are moved
+-- to TIMECARD_ORPHAN with their name columns, not deleted: once the missing
+-- employee or project is loaded they can be re-keyed and inserted back
+-- into TIMECARD.
+CREATE TABLE TIMECARD_ORPHAN AS
+SELECT t.ROWID AS SOURCE_ROWID, t.*, SYSTIMESTAMP AS QUARANTINED_AT
+FROM TIMECARD t
+WHERE t.EMPLOYEE_KEY IS NULL OR t.PROJECT_ID IS NULL;
+
+SELECT EMPLOYEE_ID, PROJECT_NAME, COUNT(*) AS ORPHAN_ROWS
+FROM TIMECARD_ORPHAN
+GROUP BY EMPLOYEE_ID, PROJECT_NAME;
+
+-- Only the rows copied above are removed
+DELETE FROM TIMECARD
+WHERE ROWID IN (SELECT SOURCE_ROWID FROM TIMECARD_ORPHAN);
+
+COMMIT;
+
+-- 3. Drop the name columns
+ALTER TABLE TIMECARD MODIFY (EMPLOYEE_KEY NOT NULL, PROJECT_ID NOT NULL);
+ALTER TABLE TIMECARD DROP (EMPLOYEE_ID, EMPLOYEE_NAME, PROJECT_NAME);
+
+-- 4. Views over the keyed table
+CREATE OR REPLACE VIEW TIMECARD_DETAIL_VIEW AS
+SELECT
+    e.EMPLOYEE_ID,
+    e.EMPLOYEE_NAME,
+    t.DAILY_DATE,
+    t.TIME_WORKED,
+    t.TIME_CARD_STATE,
+    t.TASK_TYPE,
+    p.PROJECT_NAME
+FROM TIMECARD t
+JOIN EMPLOYEE e ON e.EMPLOYEE_KEY = t.EMPLOYEE_KEY
+JOIN PROJECT p ON p.PROJECT_ID = t.PROJECT_ID;
+
+CREATE OR REPLACE VIEW GROSS_MARGIN_VIEW AS
+SELECT 
+    p.PROJECT_ID,
+    p.PROJECT_NAME,
+    SUM(t.TIME_WORKED) as TOTAL_HOURS,
+    p.SOW as BUDGET,
+    margin_calc_pkg_02.f_get_gross_margin(p.PROJECT_NAME) as GROSS_MARGIN_PERCENTAGE
+FROM PROJECT p
+LEFT JOIN TIMECARD t ON t.PROJECT_ID = p.PROJECT_ID
+GROUP BY p.PROJECT_ID, p.PROJECT_NAME, p.SOW
+ORDER BY GROSS_MARGIN_PERCENTAGE DESC;
@@ -0,0 +1,41 @@
+-- Migration 002: date-partitioned TIMECARD with local composite indexes
+--
+-- Converts TIMECARD to monthly interval partitions on DAILY_DATE and
+-- replaces the indexes schema.sql used to declare on the non-existent
+-- TIME_CARD table. Requires Oracle 12.2+ (online partitioning of an
+-- existing table) and migration 001.
+
+-- 1. Partition key must be NOT NULL; report and remove undated rows
+SELECT EMPLOYEE_KEY, PROJECT_ID, COUNT(*) AS UNDATED_ROWS
+FROM TIMECARD
+WHERE DAILY_DATE IS NULL
+GROUP BY EMPLOYEE_KEY, PROJECT_ID;
+
+DELETE FROM TIMECARD WHERE DAILY_DATE IS NULL;
+COMMIT;
+
+ALTER TABLE TIMECARD MODIFY (DAILY_DATE NOT NULL);
+
+-- 2. Repartition in place; DML keeps running during the conversion
+ALTER TABLE TIMECARD MODIFY
+    PARTITION BY RANGE (DAILY_DATE)
+    INTERVAL (NUMTOYMINTERVAL(1, 'MONTH'))
+    (
+        PARTITION p_timecard_initial VALUES LESS THAN (DATE '2020-01-01')
+    )
+    ONLINE;
+
+-- 3. Local composite indexes (one segment per monthly partition)
+CREATE INDEX idx_timecard_project_date ON TIMECARD(PROJECT_ID, DAILY_DATE) LOCAL ONLINE;
+CREATE INDEX idx_timecard_employee_date ON TIMECARD(EMPLOYEE_KEY, DAILY_DATE) LOCAL ONLINE;
+
+-- 4. Refresh optimizer statistics for the new partitions
+BEGIN
+    DBMS_STATS.GATHER_TABLE_STATS(
+        ownname     => USER,
+        tabname     => 'TIMECARD',
+        granularity => 'AUTO',
+        cascade     => TRUE
+    );
+END;
+/
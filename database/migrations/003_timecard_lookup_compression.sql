@@ -0,0 +1,80 @@
+-- Migration 003: lookup codes and basic compression for TIMECARD
+--
+-- Moves TIME_CARD_STATE and TASK_TYPE into lookup tables, stores their
+-- integer codes in TIMECARD and compresses the existing partitions.
+-- New partitions inherit COMPRESS BASIC; the loader keeps them compressed
+-- by inserting with APPEND_VALUES (TIMECARD_DIRECT_PATH_LOAD).
+-- Requires migrations 001 and 002.
+
+-- 1. Lookup tables seeded from the distinct values already stored
+CREATE TABLE TIME_CARD_STATE_LOOKUP (
+    TIME_CARD_STATE_ID NUMBER(5) GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    TIME_CARD_STATE VARCHAR2(50) NOT NULL UNIQUE
+);
+
+CREATE TABLE TASK_TYPE_LOOKUP (
+    TASK_TYPE_ID NUMBER(5) GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    TASK_TYPE VARCHAR2(50) NOT NULL UNIQUE
+);
+
+INSERT INTO TIME_CARD_STATE_LOOKUP (TIME_CARD_STATE)
+SELECT DISTINCT TIME_CARD_STATE FROM TIMECARD WHERE TIME_CARD_STATE IS NOT NULL;
+
+INSERT INTO TASK_TYPE_LOOKUP (TASK_TYPE)
+SELECT DISTINCT TASK_TYPE FROM TIMECARD WHERE TASK_TYPE IS NOT NULL;
+
+COMMIT;
+
+-- 2. Code columns, backfilled from the text columns
+ALTER TABLE TIMECARD ADD (TIME_CARD_STATE_ID NUMBER(5), TASK_TYPE_ID NUMBER(5));
+
+MERGE INTO TIMECARD t
+USING TIME_CARD_STATE_LOOKUP s
+ON (t.TIME_CARD_STATE = s.TIME_CARD_STATE)
+WHEN MATCHED THEN UPDATE SET t.TIME_CARD_STATE_ID = s.TIME_CARD_STATE_ID;
+
+MERGE INTO TIMECARD t
+USING TASK_TYPE_LOOKUP tt
+ON (t.TASK_TYPE = tt.TASK_TYPE)
+WHEN MATCHED THEN UPDATE SET t.TASK_TYPE_ID = tt.TASK_TYPE_ID;
+
+COMMIT;
+
+ALTER TABLE TIMECARD DROP (TIME_CARD_STATE, TASK_TYPE);
+
+-- 3. Compress new partitions by default and rewrite the existing ones
+ALTER TABLE TIMECARD MODIFY DEFAULT ATTRIBUTES COMPRESS BASIC;
+
+BEGIN
+    FOR part IN (
+        SELECT PARTITION_NAME
+        FROM USER_TAB_PARTITIONS
+        WHERE TABLE_NAME = 'TIMECARD'
+        ORDER BY PARTITION_POSITION
+    ) LOOP
+        EXECUTE IMMEDIATE 'ALTER TABLE TIMECARD MOVE PARTITION ' || part.PARTITION_NAME
+            || ' COMPRESS BASIC UPDATE INDEXES ONLINE';
+    END LOOP;
+END;
+/
+
+-- 4. Name view over the coded table
+CREATE OR REPLACE VIEW TIMECARD_DETAIL_VIEW AS
+SELECT
+    e.EMPLOYEE_ID,
+    e.EMPLOYEE_NAME,
+    t.DAILY_DATE,
+    t.TIME_WORKED,
+    s.TIME_CARD_STATE,
+    tt.TASK_TYPE,
+    p.PROJECT_NAME
+FROM TIMECARD t
+JOIN EMPLOYEE e ON e.EMPLOYEE_KEY = t.EMPLOYEE_KEY
+JOIN PROJECT p ON p.PROJECT_ID = t.PROJECT_ID
+LEFT JOIN TIME_CARD_STATE_LOOKUP s ON s.TIME_CARD_STATE_ID = t.TIME_CARD_STATE_ID
+LEFT JOIN TASK_TYPE_LOOKUP tt ON tt.TASK_TYPE_ID = t.TASK_TYPE_ID;
+
+BEGIN
+    DBMS_STATS.GATHER_TABLE_STATS(ownname => USER, tabname => 'TIMECARD', cascade => TRUE);
+END;
+/
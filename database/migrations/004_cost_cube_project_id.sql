@@ -0,0 +1,54 @@
+-- Migration 004: key TIMECARD_COST_CUBE on PROJECT_ID
+--
+-- The cube was keyed and joined by PROJECT_NAME; it now stores
+-- PROJECT.PROJECT_ID like TIMECARD, and readers join PROJECT for the name.
+-- The cube only holds derived rollups, so it is recreated and rebuilt
+-- from TIMECARD (the same aggregation as CostCubeService.rebuild).
+-- Requires migrations 001 to 003.
+
+-- 1. Recreate the cube keyed by PROJECT_ID
+DROP TABLE TIMECARD_COST_CUBE PURGE;
+
+CREATE TABLE TIMECARD_COST_CUBE (
+    PROJECT_ID NUMBER NOT NULL, -- PROJECT.PROJECT_ID
+    MONTH_START DATE NOT NULL,
+    TASK_TYPE VARCHAR2(50) NOT NULL,
+    TIME_CARD_STATE VARCHAR2(50) NOT NULL,
+    TOTAL_HOURS NUMBER(12,1),
+    TOTAL_COST NUMBER(20,2),
+    LAST_BATCH_ID VARCHAR2(64),
+    CONSTRAINT pk_timecard_cost_cube PRIMARY KEY (PROJECT_ID, MONTH_START, TASK_TYPE, TIME_CARD_STATE)
+);
+
+CREATE INDEX idx_cost_cube_month ON TIMECARD_COST_CUBE(MONTH_START, PROJECT_ID);
+
+-- 2. Rebuild the cells from TIMECARD
+INSERT INTO TIMECARD_COST_CUBE (
+    PROJECT_ID, MONTH_START, TASK_TYPE, TIME_CARD_STATE,
+    TOTAL_HOURS, TOTAL_COST, LAST_BATCH_ID
+)
+SELECT
+    t.PROJECT_ID,
+    TRUNC(t.DAILY_DATE, 'MM'),
+    NVL(tt.TASK_TYPE, 'UNSPECIFIED'),
+    NVL(s.TIME_CARD_STATE, 'UNSPECIFIED'),
+    SUM(t.TIME_WORKED),
+    ROUND(SUM(t.TIME_WORKED * NVL(emp.HOURLY_COST, 0)), 2),
+    'migration_004'
+FROM TIMECARD t
+JOIN PROJECT p ON p.PROJECT_ID = t.PROJECT_ID
+LEFT JOIN TASK_TYPE_LOOKUP tt ON tt.TASK_TYPE_ID = t.TASK_TYPE_ID
+LEFT JOIN TIME_CARD_STATE_LOOKUP s ON s.TIME_CARD_STATE_ID = t.TIME_CARD_STATE_ID
+LEFT JOIN (
+    SELECT EMPLOYEE_KEY,
+           margin_calc_pkg_02.f_decrypt_ctc(CTC) / 2112 AS HOURLY_COST
+    FROM EMPLOYEE
+) emp ON t.EMPLOYEE_KEY = emp.EMPLOYEE_KEY
+WHERE t.DAILY_DATE IS NOT NULL
+GROUP BY
+    t.PROJECT_ID,
+    TRUNC(t.DAILY_DATE, 'MM'),
+    NVL(tt.TASK_TYPE, 'UNSPECIFIED'),
+    NVL(s.TIME_CARD_STATE, 'UNSPECIFIED');
+
+COMMIT;
@@ -7,6 +7,7 @@ ALTER SESSION SET CONSTRAINTS = DEFERRED;
 -- Create tables
 CREATE TABLE EMPLOYEE (
     EMPLOYEE_ID VARCHAR2(10) PRIMARY KEY,
+    EMPLOYEE_KEY NUMBER GENERATED BY DEFAULT AS IDENTITY NOT NULL UNIQUE, -- compact join key for TIMECARD
     EMPLOYEE_NAME VARCHAR2(120),
     CTC RAW(2000), -- RAW to store encrypted data directly
     CTCPHR NUMBER(10,6)
@@ -18,21 +19,84 @@ CREATE TABLE PROJECT (
     SOW NUMBER(20,2)
 );
 
+-- Lookup tables for low-cardinality TIMECARD text columns
+CREATE TABLE TIME_CARD_STATE_LOOKUP (
+    TIME_CARD_STATE_ID NUMBER(5) GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    TIME_CARD_STATE VARCHAR2(50) NOT NULL UNIQUE
+);
+
+CREATE TABLE TASK_TYPE_LOOKUP (
+    TASK_TYPE_ID NUMBER(5) GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    TASK_TYPE VARCHAR2(50) NOT NULL UNIQUE
+);
+
+-- Employee, project, state and task type are stored as integer codes
+-- resolved at ingest; TIMECARD_DETAIL_VIEW exposes the text values.
+-- Monthly interval partitions on DAILY_DATE let date-windowed margin,
+-- trend and cube-refresh queries prune to the months they touch.
+-- Basic compression applies to direct-path (APPEND_VALUES) loads.
 CREATE TABLE TIMECARD (
-    EMPLOYEE_ID VARCHAR2(10),
-    EMPLOYEE_NAME VARCHAR2(120),
-    DAILY_DATE DATE,
+    EMPLOYEE_KEY NUMBER NOT NULL, -- EMPLOYEE.EMPLOYEE_KEY
+    PROJECT_ID NUMBER NOT NULL, -- PROJECT.PROJECT_ID
+    DAILY_DATE DATE NOT NULL,
     TIME_WORKED NUMBER(3,1),
-    TIME_CARD_STATE VARCHAR2(50),
-    TASK_TYPE VARCHAR2(50),
-    PROJECT_NAME VARCHAR2(120)
+    TIME_CARD_STATE_ID NUMBER(5), -- TIME_CARD_STATE_LOOKUP.TIME_CARD_STATE_ID
+    TASK_TYPE_ID NUMBER(5) -- TASK_TYPE_LOOKUP.TASK_TYPE_ID
+)
+COMPRESS BASIC
+PARTITION BY RANGE (DAILY_DATE)
+INTERVAL (NUMTOYMINTERVAL(1, 'MONTH'))
+(
+    PARTITION p_timecard_initial VALUES LESS THAN (DATE '2020-01-01')
 );
 
--- Create indexes for better performance
-CREATE INDEX idx_timecard_emp_id ON TIME_CARD(EMP_ID);
-CREATE INDEX idx_timecard_project ON TIME_CARD(PROJECT_NAME);
-CREATE INDEX idx_timecard_date ON TIME_CARD(WORK_DATE);
-CREATE INDEX idx_timecard_emp_project_date ON TIME_CARD(EMP_ID, PROJECT_NAME, WORK_DATE);
+-- Create local (per-partition) indexes for per-project and per-employee scans
+CREATE INDEX idx_timecard_project_date ON TIMECARD(PROJECT_ID, DAILY_DATE) LOCAL;
+CREATE INDEX idx_timecard_employee_date ON TIMECARD(EMPLOYEE_KEY, DAILY_DATE) LOCAL;
+
+-- Create rollup cube for dashboard drill-downs (maintained on ingest)
+-- One row per project x month x task type x timecard state
+CREATE TABLE TIMECARD_COST_CUBE (
+    PROJECT_ID NUMBER NOT NULL, -- PROJECT.PROJECT_ID
+    MONTH_START DATE NOT NULL,
+    TASK_TYPE VARCHAR2(50) NOT NULL,
+    TIME_CARD_STATE VARCHAR2(50) NOT NULL,
+    TOTAL_HOURS NUMBER(12,1),
+    TOTAL_COST NUMBER(20,2),
+    LAST_BATCH_ID VARCHAR2(64),
+    CONSTRAINT pk_timecard_cost_cube PRIMARY KEY (PROJECT_ID, MONTH_START, TASK_TYPE, TIME_CARD_STATE)
+);
+
+CREATE INDEX idx_cost_cube_month ON TIMECARD_COST_CUBE(MONTH_START, PROJECT_ID);
+
+-- Create ingest batch log; the latest completed batch is the data version
+-- used for HTTP caching (ETag / Last-Modified)
+CREATE TABLE LOAD_BATCH (
+    BATCH_SEQ NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    BATCH_ID VARCHAR2(64) NOT NULL UNIQUE,
+    STATUS VARCHAR2(30) NOT NULL,
+    ROWS_PROCESSED NUMBER DEFAULT 0,
+    ALL_PROJECTS CHAR(1) DEFAULT 'N' NOT NULL,
+    STARTED_AT TIMESTAMP,
+    COMPLETED_AT TIMESTAMP DEFAULT SYSTIMESTAMP
+);
+
+CREATE INDEX idx_load_batch_status ON LOAD_BATCH(STATUS, BATCH_SEQ);
+
+-- Projects whose margin inputs (hours, cost, SOW) a batch touched;
+-- backs the /margins/changes delta-sync endpoint
+CREATE TABLE LOAD_BATCH_PROJECT (
+    BATCH_ID VARCHAR2(64) NOT NULL,
+    PROJECT_NAME VARCHAR2(200) NOT NULL,
+    CONSTRAINT pk_load_batch_project PRIMARY KEY (BATCH_ID, PROJECT_NAME)
+);
+
+-- Create lock rows serializing background jobs across API workers
+CREATE TABLE REFRESH_LOCK (
+    LOCK_NAME VARCHAR2(50) PRIMARY KEY
+);
+
+INSERT INTO REFRESH_LOCK (LOCK_NAME) VALUES ('margin_refresh');
 
 -- Create audit table for tracking changes
 CREATE TABLE AUDIT_LOG (
@@ -50,16 +114,33 @@ CREATE TABLE AUDIT_LOG (
 -- Create sequence for audit log
 CREATE SEQUENCE audit_log_seq START WITH 1 INCREMENT BY 1;
 
+-- Create view exposing timecards with employee and project names
+CREATE OR REPLACE VIEW TIMECARD_DETAIL_VIEW AS
+SELECT
+    e.EMPLOYEE_ID,
+    e.EMPLOYEE_NAME,
+    t.DAILY_DATE,
+    t.TIME_WORKED,
+    s.TIME_CARD_STATE,
+    tt.TASK_TYPE,
+    p.PROJECT_NAME
+FROM TIMECARD t
+JOIN EMPLOYEE e ON e.EMPLOYEE_KEY = t.EMPLOYEE_KEY
+JOIN PROJECT p ON p.PROJECT_ID = t.PROJECT_ID
+LEFT JOIN TIME_CARD_STATE_LOOKUP s ON s.TIME_CARD_STATE_ID = t.TIME_CARD_STATE_ID
+LEFT JOIN TASK_TYPE_LOOKUP tt ON tt.TASK_TYPE_ID = t.TASK_TYPE_ID;
+
 -- Create view for gross margin calculation using the package function
 CREATE OR REPLACE VIEW GROSS_MARGIN_VIEW AS
 SELECT 
+    p.PROJECT_ID,
     p.PROJECT_NAME,
     SUM(t.TIME_WORKED) as TOTAL_HOURS,
     p.SOW as BUDGET,
     margin_calc_pkg_02.f_get_gross_margin(p.PROJECT_NAME) as GROSS_MARGIN_PERCENTAGE
 FROM PROJECT p
-LEFT JOIN TIMECARD t ON p.PROJECT_NAME = t.PROJECT_NAME
-GROUP BY p.PROJECT_NAME, p.SOW
+LEFT JOIN TIMECARD t ON t.PROJECT_ID = p.PROJECT_ID
+GROUP BY p.PROJECT_ID, p.PROJECT_NAME, p.SOW
 ORDER BY GROSS_MARGIN_PERCENTAGE DESC;
 
 -- Create materialized view for performance (refresh as needed)
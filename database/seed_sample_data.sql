@@ -17,18 +17,48 @@ INSERT INTO PROJECT (PROJECT_ID, PROJECT_NAME, SOW) VALUES
 (4, 'Cloud Migration', 75000.00),
 (5, 'Security Audit', 15000.00);
 
+-- Insert timecard lookup values
+INSERT INTO TIME_CARD_STATE_LOOKUP (TIME_CARD_STATE) VALUES ('APPROVED');
+
+INSERT INTO TASK_TYPE_LOOKUP (TASK_TYPE)
+SELECT 'DEVELOPMENT' FROM DUAL UNION ALL
+SELECT 'TESTING' FROM DUAL UNION ALL
+SELECT 'DESIGN' FROM DUAL UNION ALL
+SELECT 'ANALYSIS' FROM DUAL UNION ALL
+SELECT 'ARCHITECTURE' FROM DUAL UNION ALL
+SELECT 'IMPLEMENTATION' FROM DUAL UNION ALL
+SELECT 'AUDIT' FROM DUAL UNION ALL
+SELECT 'REPORTING' FROM DUAL;
+
 -- Insert sample timecards
-INSERT INTO TIMECARD (EMPLOYEE_ID, EMPLOYEE_NAME, DAILY_DATE, TIME_WORKED, TIME_CARD_STATE, TASK_TYPE, PROJECT_NAME) VALUES
-('EMP001', 'John Smith', DATE '2024-01-15', 8.0, 'APPROVED', 'DEVELOPMENT', 'E-commerce Platform'),
-('EMP001', 'John Smith', DATE '2024-01-16', 7.5, 'APPROVED', 'DEVELOPMENT', 'E-commerce Platform'),
-('EMP002', 'Jane Doe', DATE '2024-01-15', 6.0, 'APPROVED', 'TESTING', 'E-commerce Platform'),
-('EMP002', 'Jane Doe', DATE '2024-01-15', 2.0, 'APPROVED', 'DESIGN', 'Mobile App Development'),
-('EMP003', 'Bob Johnson', DATE '2024-01-15', 8.0, 'APPROVED', 'DEVELOPMENT', 'Mobile App Development'),
-('EMP003', 'Bob Johnson', DATE '2024-01-16', 6.5, 'APPROVED', 'ANALYSIS', 'Data Analytics Dashboard'),
-('EMP004', 'Alice Brown', DATE '2024-01-15', 8.0, 'APPROVED', 'ARCHITECTURE', 'Cloud Migration'),
-('EMP004', 'Alice Brown', DATE '2024-01-16', 8.0, 'APPROVED', 'IMPLEMENTATION', 'Cloud Migration'),
-('EMP005', 'Charlie Wilson', DATE '2024-01-15', 4.0, 'APPROVED', 'AUDIT', 'Security Audit'),
-('EMP005', 'Charlie Wilson', DATE '2024-01-16', 4.0, 'APPROVED', 'REPORTING', 'Security Audit');
+INSERT INTO TIMECARD (EMPLOYEE_KEY, PROJECT_ID, DAILY_DATE, TIME_WORKED, TIME_CARD_STATE_ID, TASK_TYPE_ID)
+SELECT e.EMPLOYEE_KEY, p.PROJECT_ID, src.DAILY_DATE, src.TIME_WORKED, s.TIME_CARD_STATE_ID, tt.TASK_TYPE_ID
+FROM (
+    SELECT 'EMP001' AS EMPLOYEE_ID, DATE '2024-01-15' AS DAILY_DATE, 8.0 AS TIME_WORKED,
+           'APPROVED' AS TIME_CARD_STATE, 'DEVELOPMENT' AS TASK_TYPE, 'E-commerce Platform' AS PROJECT_NAME FROM DUAL
+    UNION ALL
+    SELECT 'EMP001', DATE '2024-01-16', 7.5, 'APPROVED', 'DEVELOPMENT', 'E-commerce Platform' FROM DUAL
+    UNION ALL
+    SELECT 'EMP002', DATE '2024-01-15', 6.0, 'APPROVED', 'TESTING', 'E-commerce Platform' FROM DUAL
+    UNION ALL
+    SELECT 'EMP002', DATE '2024-01-15', 2.0, 'APPROVED', 'DESIGN', 'Mobile App Development' FROM DUAL
+    UNION ALL
+    SELECT 'EMP003', DATE '2024-01-15', 8.0, 'APPROVED', 'DEVELOPMENT', 'Mobile App Development' FROM DUAL
+    UNION ALL
+    SELECT 'EMP003', DATE '2024-01-16', 6.5, 'APPROVED', 'ANALYSIS', 'Data Analytics Dashboard' FROM DUAL
+    UNION ALL
+    SELECT 'EMP004', DATE '2024-01-15', 8.0, 'APPROVED', 'ARCHITECTURE', 'Cloud Migration' FROM DUAL
+    UNION ALL
+    SELECT 'EMP004', DATE '2024-01-16', 8.0, 'APPROVED', 'IMPLEMENTATION', 'Cloud Migration' FROM DUAL
+    UNION ALL
+    SELECT 'EMP005', DATE '2024-01-15', 4.0, 'APPROVED', 'AUDIT', 'Security Audit' FROM DUAL
+    UNION ALL
+    SELECT 'EMP005', DATE '2024-01-16', 4.0, 'APPROVED', 'REPORTING', 'Security Audit' FROM DUAL
+) src
+JOIN EMPLOYEE e ON e.EMPLOYEE_ID = src.EMPLOYEE_ID
+JOIN PROJECT p ON p.PROJECT_NAME = src.PROJECT_NAME
+JOIN TIME_CARD_STATE_LOOKUP s ON s.TIME_CARD_STATE = src.TIME_CARD_STATE
+JOIN TASK_TYPE_LOOKUP tt ON tt.TASK_TYPE = src.TASK_TYPE;
 
 -- Commit the data
 COMMIT;
@@ -1,10 +1,83 @@
 
-import { ValidationReport } from '@/types'
+import { useState } from 'react'
+import apiService from '@/services/api'
+import { IssueSummary, ValidationIssue, ValidationReport } from '@/types'
+
+// Issues fetched per "show more" click
+const ISSUE_PAGE_SIZE = 100
 
 interface DataQualityReportProps {
   report: ValidationReport
 }
 
+interface IssueGroupProps {
+  uploadId: string | null
+  fileType: string
+  summary: IssueSummary
+}
+
+function IssueGroup({ uploadId, fileType, summary }: IssueGroupProps) {
+  const [issues, setIssues] = useState<ValidationIssue[]>(summary.samples)
+  const [loading, setLoading] = useState(false)
+
+  const loadMore = async () => {
+    if (!uploadId) return
+    setLoading(true)
+    try {
+      // Samples are the first rows of the rule, so paging continues after them
+      const page = await apiService.fetchUploadIssues(uploadId, fileType, {
+        column: summary.column,
+        error: summary.error,
+        offset: issues.length,
+        limit: ISSUE_PAGE_SIZE,
+      })
+      setIssues([...issues, ...page.issues])
+    } finally {
+      setLoading(false)
+    }
+  }
+
+  return (
+    <div>
+      <p className="text-sm font-medium text-gray-900 mb-2">
+        {summary.column} • {summary.error}
+        <span className="ml-2 text-red-600">{summary.count} rows</span>
+      </p>
+      <div className="space-y-2">
+        {issues.map((issue, issueIndex) => (
+          <div key={issueIndex} className="bg-red-50 border-l-4 border-red-400 p-3">
+            <div className="flex items-start">
+              <div className="flex-shrink-0">
+                <svg className="h-5 w-5 text-red-400" viewBox="0 0 20 20" fill="currentColor">
+                  <path fillRule="evenodd" d="M10 18a8 8 0 100-16 8 8 0 000 16zM8.707 7.293a1 1 0 00-1.414 1.414L8.586 10l-1.293 1.293a1 1 0 101.414 1.414L10 11.414l1.293 1.293a1 1 0 001.414-1.414L11.414 10l1.293-1.293a1 1 0 00-1.414-1.414L10 8.586 8.707 7.293z" clipRule="evenodd" />
+                </svg>
+              </div>
+              <div className="ml-3">
+                <p className="text-sm text-red-800">
+                  <span className="font-medium">Row {issue.row}</span>
+                  {issue.value && (
+                    <span className="ml-2">• Value: <span className="font-medium">{issue.value}</span></span>
+                  )}
+                </p>
+              </div>
+            </div>
+          </div>
+        ))}
+      </div>
+      {uploadId && issues.length < summary.count && (
+        <button
+          type="button"
+          onClick={loadMore}
+          disabled={loading}
+          className="mt-2 text-sm font-medium text-blue-600 hover:text-blue-800 disabled:text-gray-400"
+        >
+          {loading ? 'Loading…' : `Show more (${summary.count - issues.length} remaining)`}
+        </button>
+      )}
+    </div>
+  )
+}
+
 export default function DataQualityReport({ report }: DataQualityReportProps) {
   const totalFiles = report.total_files
   const totalValidRows = report.total_valid_rows
@@ -74,33 +147,20 @@ export default function DataQualityReport({ report }: DataQualityReportProps) {
               </div>
             </div>
 
-            {/* Validation Issues */}
-            {upload.validation_issues.length > 0 && (
+            {/* Validation Issues (aggregated per column and rule) */}
+            {upload.issue_summary.length > 0 && (
               <div className="mt-4">
-                <h6 className="font-medium text-gray-900 mb-2">Validation Issues:</h6>
-                <div className="space-y-2">
-                  {upload.validation_issues.map((issue, issueIndex) => (
-                    <div key={issueIndex} className="bg-red-50 border-l-4 border-red-400 p-3">
-                      <div className="flex items-start">
-                        <div className="flex-shrink-0">
-                          <svg className="h-5 w-5 text-red-400" viewBox="0 0 20 20" fill="currentColor">
-                            <path fillRule="evenodd" d="M10 18a8 8 0 100-16 8 8 0 000 16zM8.707 7.293a1 1 0 00-1.414 1.414L8.586 10l-1.293 1.293a1 1 0 101.414 1.414L10 11.414l1.293 1.293a1 1 0 001.414-1.414L11.414 10l1.293-1.293a1 1 0 00-1.414-1.414L10 8.586 8.707 7.293z" clipRule="evenodd" />
-                          </svg>
-                        </div>
-                        <div className="ml-3">
-                          <p className="text-sm text-red-800">
-                            <span className="font-medium">Row {issue.row}</span>
-                            {issue.column && (
-                              <span className="ml-2">• Column: <span className="font-medium">{issue.column}</span></span>
-                            )}
-                            {issue.value && (
-                              <span className="ml-2">• Value: <span className="font-medium">{issue.value}</span></span>
-                            )}
-                          </p>
-                          <p className="text-sm text-red-700 mt-1">{issue.error}</p>
-                        </div>
-                      </div>
-                    </div>
+                <h6 className="font-medium text-gray-900 mb-2">
+                  Validation Issues ({upload.issue_count}):
+                </h6>
+                <div className="space-y-4">
+                  {upload.issue_summary.map((summary) => (
+                    <IssueGroup
+                      key={`${summary.column}|${summary.error}`}
+                      uploadId={report.upload_id}
+                      fileType={upload.file_type}
+                      summary={summary}
+                    />
                   ))}
                 </div>
               </div>
@@ -9,23 +9,26 @@ export default function DashboardPage() {
   
 const [sortBy, setSortBy] = useState<keyof MarginRow>('grossMarginPercentage')
 const [sortOrder, setSortOrder] = useState<'asc' | 'desc'>('desc')
+  const [projectQuery, setProjectQuery] = useState('')
   // TODO: Add filtering options
   // TODO: Add date range selection
-  // TODO: Add project search
   // TODO: Add margin range filters
 
-  // Fetch margin data
-  const { data: marginData, isLoading: marginsLoading, error: marginsError } = useQuery({
-    queryKey: ['margins'],
-    queryFn: () => apiService.fetchMargins(),
+  // Fetch margins and summary in one round trip
+  const { data: dashboardData, isLoading: marginsLoading, error: marginsError } = useQuery({
+    queryKey: ['dashboard'],
+    queryFn: () => apiService.fetchDashboard(),
     staleTime: 5 * 60 * 1000, // 5 minutes
   })
 
-  // Fetch margin summary
-  const { data: marginSummary, error: summaryError } = useQuery({
-    queryKey: ['marginSummary'],
-    queryFn: () => apiService.fetchMarginSummary(),
-    staleTime: 5 * 60 * 1000, // 5 minutes
+  // Autocomplete suggestions (prefix and typo-tolerant matches)
+  const trimmedQuery = projectQuery.trim()
+  const { data: suggestions } = useQuery({
+    queryKey: ['projectSearch', trimmedQuery],
+    queryFn: () => apiService.searchProjects(trimmedQuery),
+    enabled: trimmedQuery.length >= 2,
+    keepPreviousData: true,
+    staleTime: 5 * 60 * 1000,
   })
 
   const handleSort = (key: keyof MarginRow) => {
@@ -42,8 +45,16 @@ const [sortOrder, setSortOrder] = useState<'asc' | 'desc'>('desc')
   // TODO: Add data export
   // TODO: Add refresh functionality
 
-  const sortedData = marginData?.data || []
-  const summary = marginSummary?.data
+  const allRows = dashboardData?.data?.margins || []
+  const suggestedNames = new Set((suggestions || []).map((match) => match.projectName))
+  const sortedData = trimmedQuery
+    ? allRows.filter(
+        (row) =>
+          row.projectName.toLowerCase().includes(trimmedQuery.toLowerCase()) ||
+          suggestedNames.has(row.projectName)
+      )
+    : allRows
+  const summary = dashboardData?.data?.summary
 
   // Table columns configuration
   const columns = [
@@ -72,13 +83,13 @@ const [sortOrder, setSortOrder] = useState<'asc' | 'desc'>('desc')
     },
   ]
 
-  if (marginsError || summaryError) {
+  if (marginsError) {
     return (
       <div className="text-center py-12">
         <div className="text-6xl mb-4">❌</div>
         <h3 className="text-lg font-medium text-gray-900 mb-2">Error Loading Data</h3>
         <p className="text-gray-500">
-         {(marginsError as any)?.message || (summaryError as any)?.message || 'Failed to load dashboard data'}
+         {(marginsError as any)?.message || 'Failed to load dashboard data'}
         </p>
         {/* TODO: Add retry button */}
       </div>
@@ -139,6 +150,21 @@ const [sortOrder, setSortOrder] = useState<'asc' | 'desc'>('desc')
       <div className="bg-white rounded-lg shadow p-6">
         <div className="flex items-center justify-between mb-6">
           <h2 className="text-xl font-semibold text-gray-900">Project Details</h2>
+          <div>
+            <input
+              type="search"
+              list="project-suggestions"
+              value={projectQuery}
+              onChange={(event) => setProjectQuery(event.target.value)}
+              placeholder="Search projects..."
+              className="border border-gray-300 rounded-md px-3 py-2 text-sm"
+            />
+            <datalist id="project-suggestions">
+              {(suggestions || []).map((match) => (
+                <option key={match.projectName} value={match.projectName} />
+              ))}
+            </datalist>
+          </div>
           
           {/* TODO: Add table controls */}
           {/* - Export button */}
@@ -175,7 +201,6 @@ const [sortOrder, setSortOrder] = useState<'asc' | 'desc'>('desc')
       {/* - Export functionality */}
       {/* - Advanced filtering */}
       {/* - Date range selection */}
-      {/* - Project search */}
       {/* - Margin trend analysis */}
       {/* - Performance metrics */}
     </div>
@@ -2,8 +2,13 @@ import axios, { AxiosInstance, AxiosResponse } from 'axios'
 import { 
   ApiResponse, 
   ValidationReport,
+  IssuePage,
   MarginRow, 
   MarginSummary,
+  MarginDistribution,
+  DashboardData,
+  MarginChanges,
+  ProjectSuggestion,
   AskRequest, 
   AskResponse 
 } from '@/types'
@@ -98,6 +103,23 @@ class ApiService {
     }
   }
 
+  async fetchUploadIssues(
+    uploadId: string,
+    fileType: string,
+    filters: { column?: string; error?: string; offset?: number; limit?: number } = {}
+  ): Promise<IssuePage> {
+    // One page of the full issue list; the upload report only carries samples
+    try {
+      const response = await this.api.get(`/api/v1/upload/${uploadId}/issues`, {
+        params: { file_type: fileType, ...filters },
+      })
+      return response.data
+    } catch (error) {
+      console.error('Failed to fetch upload issues:', error)
+      throw error
+    }
+  }
+
   async ingestValidatedData(): Promise<ApiResponse<any>> {
     // TODO: Implement data ingestion
     // - Call ingest endpoint
@@ -114,14 +136,15 @@ class ApiService {
   }
 
   // Margin APIs
-  async fetchMargins(): Promise<ApiResponse<MarginRow[]>> {
+  async fetchMargins(fields?: (keyof MarginRow)[]): Promise<ApiResponse<MarginRow[]>> {
     // TODO: Implement margin data fetching
     // - Call margins endpoint
     // - Handle data formatting
     // - Add caching if needed
     
     try {
-      const response = await this.api.get('/api/v1/margins')
+      const params = fields?.length ? { fields: fields.join(',') } : undefined
+      const response = await this.api.get('/api/v1/margins', { params })
       return response.data
     } catch (error) {
       console.error('Failed to fetch margins:', error)
@@ -144,14 +167,84 @@ class ApiService {
     }
   }
 
-  async fetchProjects(): Promise<ApiResponse<any[]>> {
+  async fetchDashboard(): Promise<ApiResponse<DashboardData>> {
+    // Margins, summary and projects in a single authenticated round trip
+    try {
+      const response = await this.api.get('/api/v1/dashboard')
+      return response.data
+    } catch (error) {
+      console.error('Failed to fetch dashboard:', error)
+      throw error
+    }
+  }
+
+  async fetchMarginChanges(since: string): Promise<ApiResponse<MarginChanges>> {
+    // Only rows changed since the given version token
+    try {
+      const response = await this.api.get('/api/v1/margins/changes', { params: { since } })
+      return response.data
+    } catch (error) {
+      console.error('Failed to fetch margin changes:', error)
+      throw error
+    }
+  }
+
+  subscribeToMarginUpdates(onEvent: (type: string, payload: any) => void): () => void {
+    // Server-sent events over fetch so the Authorization header can be sent
+    const controller = new AbortController()
+    const token = localStorage.getItem('auth_token')
+
+    const run = async () => {
+      const response = await fetch(`${BACKEND_URL}/api/v1/margins/stream`, {
+        headers: token ? { Authorization: `Bearer ${token}` } : {},
+        signal: controller.signal,
+      })
+      if (!response.body) return
+      const reader = response.body.pipeThrough(new TextDecoderStream()).getReader()
+      let buffer = ''
+      while (true) {
+        const { value, done } = await reader.read()
+        if (done) break
+        buffer += value
+        const frames = buffer.split('\n\n')
+        buffer = frames.pop() || ''
+        for (const frame of frames) {
+          const eventLine = frame.split('\n').find((line) => line.startsWith('event: '))
+          const dataLine = frame.split('\n').find((line) => line.startsWith('data: '))
+          if (eventLine && dataLine) {
+            onEvent(eventLine.slice(7), JSON.parse(dataLine.slice(6)))
+          }
+        }
+      }
+    }
+
+    run().catch((error) => {
+      if (error.name !== 'AbortError') {
+        console.error('Margin update stream failed:', error)
+      }
+    })
+    return () => controller.abort()
+  }
+
+  async fetchMarginDistribution(): Promise<ApiResponse<MarginDistribution>> {
+    try {
+      const response = await this.api.get('/api/v1/margins/distribution')
+      return response.data
+    } catch (error) {
+      console.error('Failed to fetch margin distribution:', error)
+      throw error
+    }
+  }
+
+  async fetchProjects(fields?: string[]): Promise<ApiResponse<any[]>> {
     // TODO: Implement projects fetching
     // - Call projects endpoint
     // - Handle project data
     // - Add filtering options
     
     try {
-      const response = await this.api.get('/api/v1/projects')
+      const params = fields?.length ? { fields: fields.join(',') } : undefined
+      const response = await this.api.get('/api/v1/projects', { params })
       return response.data
     } catch (error) {
       console.error('Failed to fetch projects:', error)
@@ -159,6 +252,17 @@ class ApiService {
     }
   }
 
+  async searchProjects(query: string, limit = 10): Promise<ProjectSuggestion[]> {
+    // Ranked suggestions from the server-side project name index
+    try {
+      const response = await this.api.get('/api/v1/projects/search', { params: { q: query, limit } })
+      return response.data
+    } catch (error) {
+      console.error('Failed to search projects:', error)
+      throw error
+    }
+  }
+
   // AI APIs
   async askAI(request: AskRequest): Promise<ApiResponse<AskResponse>> {
     // TODO: Implement AI question processing
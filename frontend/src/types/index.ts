@@ -14,6 +14,15 @@ export interface ValidationIssue {
   error: string
 }
 
+export interface IssueSummary {
+  column: string
+  error: string
+  count: number
+  samples: ValidationIssue[]
+  row_ranges: [number, number][]
+  ranges_truncated: boolean
+}
+
 export interface UploadResult {
   filename: string
   file_type: string
@@ -21,6 +30,8 @@ export interface UploadResult {
   valid_rows: number
   invalid_rows: number
   validation_issues: ValidationIssue[]
+  issue_count: number
+  issue_summary: IssueSummary[]
 }
 
 export interface ValidationReport {
@@ -29,6 +40,16 @@ export interface ValidationReport {
   total_valid_rows: number
   total_invalid_rows: number
   has_errors: boolean
+  upload_id: string | null
+}
+
+export interface IssuePage {
+  upload_id: string
+  file_type: string
+  total: number
+  offset: number
+  limit: number
+  issues: ValidationIssue[]
 }
 
 // Margin Types
@@ -46,6 +67,49 @@ export interface MarginSummary {
   averageMarginPercentage: number
 }
 
+export interface ProjectInfo {
+  project_id: number
+  project_name: string
+  sow: number
+}
+
+export interface ProjectSuggestion {
+  projectId: number | null
+  projectName: string
+  score: number
+}
+
+export interface DashboardData {
+  margins: MarginRow[]
+  summary: MarginSummary
+  projects: ProjectInfo[]
+}
+
+export interface MarginChanges {
+  version: string | null
+  fullResync: boolean
+  changed: MarginRow[]
+  removed: string[]
+}
+
+export interface MarginBucket {
+  label: string
+  min: number | null
+  max: number | null
+  count: number
+}
+
+export interface MarginDistribution {
+  buckets: MarginBucket[]
+  p10: number | null
+  p50: number | null
+  p90: number | null
+  negativeCount: number
+  nullMarginCount: number
+  totalProjects: number
+  dataVersion: string | null
+}
+
 export interface MarginFilter {
   project_name?: string
   min_margin?: number